@@ -0,0 +1,62 @@
+"""Checksums of the files in the manifest of a realization.
+
+The forward model runner computes the checksums of the files the forward
+model produced, and ert verifies them before loading the results to detect
+files that are not yet synchronized between the compute node and ert.
+
+Files are hashed in chunks, so that large files such as restart files are
+never read into memory as a whole. In QUICK mode only the size and the
+first and last chunk of a file are used, which catches incomplete
+synchronization without reading the whole file. The modification time is
+left out as it is not reliably preserved on network file systems.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, BinaryIO
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ChecksumMode(StrEnum):
+    MD5 = "MD5"
+    BLAKE2B = "BLAKE2B"
+    QUICK = "QUICK"
+
+
+def file_checksum(path: Path, mode: ChecksumMode = ChecksumMode.MD5) -> str:
+    with open(path, "rb") as f:
+        if mode == ChecksumMode.QUICK:
+            return _quick_checksum(f)
+        return hashlib.file_digest(f, mode.lower()).hexdigest()
+
+
+def _quick_checksum(f: BinaryIO) -> str:
+    stat = os.fstat(f.fileno())
+    digest = hashlib.blake2b(f.read(CHUNK_SIZE))
+    if stat.st_size > CHUNK_SIZE:
+        f.seek(max(CHUNK_SIZE, stat.st_size - CHUNK_SIZE))
+        digest.update(f.read(CHUNK_SIZE))
+    return f"{stat.st_size}:{digest.hexdigest()}"
+
+
+def checksum_info(path: Path, mode: ChecksumMode) -> dict[str, str]:
+    """The manifest entries giving the checksum of path"""
+    checksum = file_checksum(path, mode)
+    if mode == ChecksumMode.MD5:
+        # md5sum is the entry understood by all versions of ert
+        return {"md5sum": checksum}
+    return {"checksum": checksum, "checksum_mode": str(mode)}
+
+
+def expected_checksum(info: dict[str, Any]) -> tuple[str, ChecksumMode] | None:
+    """The checksum and its mode from a manifest entry, if it has one"""
+    if "checksum" in info:
+        return info["checksum"], ChecksumMode(info["checksum_mode"])
+    if "md5sum" in info:
+        return info["md5sum"], ChecksumMode.MD5
+    return None
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Annotated, Any, Final, Literal
 
@@ -215,12 +216,22 @@ class EEUserDone(BaseEvent):
     _DISPATCH_EVENTS_ANNOTATION
 )
 EventAdapter: TypeAdapter[Event] = TypeAdapter(_ALL_EVENTS_ANNOTATION)
+DispatchEventsAdapter: TypeAdapter[list[DispatchEvent]] = TypeAdapter(
+    list[_DISPATCH_EVENTS_ANNOTATION]
+)
 
 
 def dispatch_event_from_json(raw_msg: str | bytes) -> DispatchEvent:
     return DispatchEventAdapter.validate_json(raw_msg)
 
 
+def dispatch_events_from_json(raw_msg: str | bytes) -> list[DispatchEvent]:
+    """The events of a message holding either one event or a list of events"""
+    if raw_msg.lstrip()[:1] in {"[", b"["}:
+        return DispatchEventsAdapter.validate_json(raw_msg)
+    return [dispatch_event_from_json(raw_msg)]
+
+
 def event_from_json(raw_msg: str | bytes) -> Event:
     return EventAdapter.validate_json(raw_msg)
 
@@ -235,3 +246,23 @@ def event_to_json(event: Event) -> str:
 
 def event_to_dict(event: Event) -> dict[str, Any]:
     return event.model_dump()
+
+
+def events_to_json(events: Sequence[Event]) -> str:
+    return "[" + ",".join(event_to_json(event) for event in events) + "]"
+
+
+def coalesce_memory_reports(events: Sequence[Event]) -> list[Event]:
+    """Drop the ForwardModelStepRunning events that are followed by another
+    ForwardModelStepRunning event for the same forward model step, as the
+    later report overwrites every field of the earlier one."""
+    latest: dict[tuple[str, str], int] = {}
+    for index, event in enumerate(events):
+        if type(event) is ForwardModelStepRunning:
+            latest[event.real, event.fm_step] = index
+    return [
+        event
+        for index, event in enumerate(events)
+        if type(event) is not ForwardModelStepRunning
+        or latest[event.real, event.fm_step] == index
+    ]
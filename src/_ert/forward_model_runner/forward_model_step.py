@@ -18,6 +18,7 @@
 from psutil import AccessDenied, NoSuchProcess, Process, TimeoutExpired, ZombieProcess
 
 from .io import check_executable
+from .process_tree import ProcessTreeSample, proc_is_available, sample_process_tree
 from .reporting.message import (
     Exited,
     ProcessTreeStatus,
@@ -80,11 +81,19 @@ def killed_by_oom(pids: set[int]) -> bool:
 
 class ForwardModelStep:
     MEMORY_POLL_PERIOD = 5  # Seconds between memory polls
+    # PSS and IO require reading two more files per process, so they are
+    # only sampled every DETAILED_POLL_INTERVAL memory polls
+    DETAILED_POLL_INTERVAL = 6
 
     def __init__(
-        self, job_data: ForwardModelStepJSON, index: int, sleep_interval: int = 1
+        self,
+        job_data: ForwardModelStepJSON,
+        index: int,
+        sleep_interval: int = 1,
+        memory_poll_period: float | None = None,
     ) -> None:
         self.sleep_interval = sleep_interval
+        self.memory_poll_period = memory_poll_period or self.MEMORY_POLL_PERIOD
         self.job_data = job_data
         self.index = index
         self.std_err = job_data.get("stderr")
@@ -187,24 +196,34 @@ def _run(self) -> Generator[Start | Exited | Running | None]:
 
         max_memory_usage = 0
         fm_step_pids = {int(process.pid)}
+        use_proc = proc_is_available()
+        polls = 0
+        detailed = ProcessTreeSample()
         while exit_code is None:
-            (memory_rss, cpu_seconds, oom_score, pids) = _get_processtree_data(process)
-            fm_step_pids |= pids
-            max_memory_usage = max(memory_rss, max_memory_usage)
+            is_detailed = polls % self.DETAILED_POLL_INTERVAL == 0
+            sample = _sample_processtree(process, use_proc, is_detailed)
+            polls += 1
+            if is_detailed:
+                detailed = sample
+            fm_step_pids |= sample.pids
+            max_memory_usage = max(sample.rss, max_memory_usage)
             yield Running(
                 self,
                 ProcessTreeStatus(
-                    rss=memory_rss,
+                    rss=sample.rss,
                     max_rss=max_memory_usage,
                     fm_step_id=self.index,
                     fm_step_name=self.job_data.get("name"),
-                    cpu_seconds=cpu_seconds,
-                    oom_score=oom_score,
+                    cpu_seconds=sample.cpu_seconds,
+                    oom_score=sample.oom_score,
+                    pss=detailed.pss,
+                    read_bytes=detailed.read_bytes,
+                    write_bytes=detailed.write_bytes,
                 ),
             )
 
             try:
-                exit_code = process.wait(timeout=self.MEMORY_POLL_PERIOD)
+                exit_code = process.wait(timeout=self.memory_poll_period)
             except TimeoutExpired:
                 potential_exited_msg = (
                     self.handle_process_timeout_and_create_exited_msg(
@@ -421,6 +440,20 @@ def ensure_file_handles_closed(file_handles: Sequence[io.TextIOWrapper | None])
             file_handle.close()
 
 
+def _sample_processtree(
+    process: Process, use_proc: bool, detailed: bool = True
+) -> ProcessTreeSample:
+    """Sample the process tree from /proc when available, which is
+    considerably cheaper than going through psutil, and fall back to
+    psutil otherwise."""
+    if use_proc:
+        return sample_process_tree(int(process.pid), detailed)
+    memory_rss, cpu_seconds, oom_score, pids = _get_processtree_data(process)
+    return ProcessTreeSample(
+        rss=memory_rss, cpu_seconds=cpu_seconds, oom_score=oom_score, pids=pids
+    )
+
+
 def _get_processtree_data(
     process: Process,
 ) -> tuple[int, float, int | None, set[int]]:
@@ -0,0 +1,157 @@
+"""Sampling of resource usage of a process and all its descendants
+directly from /proc.
+
+psutil opens several files per process for every sample, and finding
+the descendants of a process requires reading the stat file of every
+process on the host anyway. Here all stat files are read in a single
+sweep which gives both the process tree and the cpu and memory usage of
+each process in it, so that only the optional measures (PSS, IO and
+oom_score) require additional reads.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_PROC = Path("/proc")
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass
+class ProcessTreeSample:
+    """Resource usage summed over a process and all its descendants.
+
+    Memory unit is bytes. A value of None means that there is no
+    information, e.g. because the kernel does not provide it or the
+    process is owned by another user.
+    """
+
+    rss: int = 0
+    pss: int | None = None
+    cpu_seconds: float = 0.0
+    read_bytes: int | None = None
+    write_bytes: int | None = None
+    oom_score: int | None = None
+    # The descendants of the process, not including the process itself
+    pids: set[int] = field(default_factory=set)
+
+
+def proc_is_available() -> bool:
+    return (_PROC / "self" / "stat").exists()
+
+
+def _read_stat(pid: int) -> tuple[int, float, int] | None:
+    """Returns the parent pid, the user cpu seconds and the rss of pid"""
+    try:
+        data = (_PROC / str(pid) / "stat").read_bytes()
+    except OSError:
+        return None
+    # The second field is the command name in parentheses, which may
+    # contain any character, so split after the last parenthesis. The
+    # remaining fields start with field 3 (state) in proc(5)
+    fields = data[data.rfind(b")") + 2 :].split()
+    try:
+        return (
+            int(fields[1]),
+            int(fields[11]) / _CLOCK_TICKS,
+            int(fields[21]) * _PAGE_SIZE,
+        )
+    except (IndexError, ValueError):
+        return None
+
+
+def _read_pss(pid: int) -> int | None:
+    with (
+        contextlib.suppress(OSError, ValueError),
+        open(_PROC / str(pid) / "smaps_rollup", "rb") as f,
+    ):
+        for line in f:
+            if line.startswith(b"Pss:"):
+                return int(line.split()[1]) * 1024
+    return None
+
+
+def _read_io(pid: int) -> tuple[int, int] | None:
+    read_bytes = write_bytes = None
+    with (
+        contextlib.suppress(OSError, ValueError),
+        open(_PROC / str(pid) / "io", "rb") as f,
+    ):
+        for line in f:
+            if line.startswith(b"read_bytes:"):
+                read_bytes = int(line.split()[1])
+            elif line.startswith(b"write_bytes:"):
+                write_bytes = int(line.split()[1])
+    if read_bytes is None or write_bytes is None:
+        return None
+    return read_bytes, write_bytes
+
+
+def _read_oom_score(pid: int) -> int | None:
+    with contextlib.suppress(OSError, ValueError):
+        return int((_PROC / str(pid) / "oom_score").read_bytes())
+    return None
+
+
+def _add(total: int | None, value: int | None) -> int | None:
+    if value is None:
+        return total
+    return value if total is None else total + value
+
+
+def sample_process_tree(pid: int, detailed: bool = True) -> ProcessTreeSample:
+    """Sample the resource usage of the process pid and all its
+    descendants. Processes that exit while being sampled are ignored,
+    so if pid itself has exited an empty sample is returned. PSS and IO
+    are only read when detailed is set, otherwise they are None.
+
+    As with psutil, only user cpu time is counted, and the oom_score is
+    the maximum over the process tree, as that is the process the Linux
+    kernel would kill first in an out-of-memory situation.
+    """
+    stats: dict[int, tuple[int, float, int]] = {}
+    children: defaultdict[int, list[int]] = defaultdict(list)
+    with os.scandir(_PROC) as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            child = int(entry.name)
+            if (stat := _read_stat(child)) is not None:
+                stats[child] = stat
+                children[stat[0]].append(child)
+
+    sample = ProcessTreeSample()
+    if pid not in stats:
+        return sample
+    tree = [pid]
+    seen = {pid}
+    unvisited = [pid]
+    while unvisited:
+        # Guard against cycles from pids being reused during the sweep
+        new = [c for c in children.get(unvisited.pop(), ()) if c not in seen]
+        seen.update(new)
+        tree.extend(new)
+        unvisited.extend(new)
+    for process in tree:
+        _, cpu_seconds, rss = stats[process]
+        sample.rss += rss
+        sample.cpu_seconds += cpu_seconds
+        if detailed:
+            sample.pss = _add(sample.pss, _read_pss(process))
+            if (io := _read_io(process)) is not None:
+                sample.read_bytes = _add(sample.read_bytes, io[0])
+                sample.write_bytes = _add(sample.write_bytes, io[1])
+        if (oom_score := _read_oom_score(process)) is not None:
+            sample.oom_score = (
+                oom_score
+                if sample.oom_score is None
+                else max(sample.oom_score, oom_score)
+            )
+    sample.pids = set(tree[1:])
+    return sample
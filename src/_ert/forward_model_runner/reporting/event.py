@@ -14,7 +14,9 @@
     ForwardModelStepRunning,
     ForwardModelStepStart,
     ForwardModelStepSuccess,
+    coalesce_memory_reports,
     event_to_json,
+    events_to_json,
 )
 from _ert.forward_model_runner.client import Client, ClientConnectionError
 from _ert.forward_model_runner.reporting.base import Reporter
@@ -45,8 +47,14 @@ class Event(Reporter):
     An Init event must be provided as the first message, which starts reporting,
     and a Finish event will signal the reporter that the last event has been reported.
 
-    If event fails to be sent (e.g. due to connection error) it does not proceed to the
-    next event but instead tries to re-send the same event.
+    Events that are queued while a message is being sent are sent together as
+    one message, where only the latest memory report of each forward model step
+    is kept. The longer the evaluator takes to acknowledge a message, the longer
+    the reporter waits before sending the next one, up to MAX_SEND_DELAY
+    seconds, so that more reports are coalesced when the evaluator is busy.
+
+    If events fail to be sent (e.g. due to connection error) it does not proceed to
+    the next events but instead tries to re-send the same events.
 
     Whenever the Finish event (when all the jobs have exited) is provided
     the reporter will try to send all remaining events for a maximum of 60 seconds
@@ -54,6 +62,8 @@ class Event(Reporter):
     """
 
     _sentinel: Final = EventSentinel()
+    MAX_BATCH_SIZE: Final = 100
+    MAX_SEND_DELAY: Final = 2.0
 
     def __init__(
         self,
@@ -97,24 +107,40 @@ async def publisher():
                 token=self._token,
                 ack_timeout=self._ack_timeout,
             ) as client:
-                event = None
+                batch: list[events.Event] = []
+                stopping = False
                 start_time = None
+                loop = asyncio.get_running_loop()
                 while True:
                     try:
                         if self._done.is_set() and start_time is None:
-                            start_time = asyncio.get_event_loop().time()
-                        if event is None:
+                            start_time = loop.time()
+                        if not batch:
                             event = self._event_queue.get()
                             if event is self._sentinel:
                                 break
+                            batch.append(event)
+                        stopping = self._drain_event_queue(batch) or stopping
                         if (
                             start_time
-                            and (asyncio.get_event_loop().time() - start_time)
+                            and (loop.time() - start_time)
                             > self._finished_event_timeout
                         ):
                             break
-                        await client.send(event_to_json(event), self._max_retries)
-                        event = None
+                        send_start = loop.time()
+                        await client.send(
+                            event_to_json(batch[0])
+                            if len(batch) == 1
+                            else events_to_json(batch),
+                            self._max_retries,
+                        )
+                        batch = []
+                        if stopping:
+                            break
+                        if not self._done.is_set():
+                            await asyncio.sleep(
+                                min(loop.time() - send_start, self.MAX_SEND_DELAY)
+                            )
                     except asyncio.CancelledError:
                         return
                     except ClientConnectionError as exc:
@@ -125,6 +151,23 @@ async def publisher():
         except ClientConnectionError as exc:
             raise ClientConnectionError("Couldn't connect to evaluator") from exc
 
+    def _drain_event_queue(self, batch: list[events.Event]) -> bool:
+        """Move the queued events into batch, keeping only the latest memory
+        report of each forward model step. Returns whether the queue has been
+        drained to the end of reporting."""
+        stopping = False
+        while len(batch) < self.MAX_BATCH_SIZE:
+            try:
+                event = self._event_queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is self._sentinel:
+                stopping = True
+                break
+            batch.append(event)
+        batch[:] = coalesce_memory_reports(batch)
+        return stopping
+
     def report(self, msg):
         self._statemachine.transition(msg)
 
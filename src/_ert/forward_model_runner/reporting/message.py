@@ -14,6 +14,8 @@ class _ChecksumDictBase(TypedDict):
 
     class ChecksumDict(_ChecksumDictBase, total=False):
         md5sum: str
+        checksum: str
+        checksum_mode: str
         error: str
 
 
@@ -51,6 +53,12 @@ class ProcessTreeStatus:
 
     oom_score: int | None = None
 
+    # Proportional set size, where memory shared between processes is
+    # divided among them, and bytes read from and written to storage
+    pss: int | None = None
+    read_bytes: int | None = None
+    write_bytes: int | None = None
+
     def __post_init__(self):
         self.timestamp = dt.now().isoformat()
         self.free = psutil.virtual_memory().available
@@ -1,11 +1,22 @@
-import hashlib
 import json
 import os
+import queue
+import threading
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from _ert.checksum import ChecksumMode, checksum_info
 from _ert.forward_model_runner.forward_model_step import ForwardModelStep
-from _ert.forward_model_runner.reporting.message import Checksum, Finish, Init
+from _ert.forward_model_runner.reporting.message import (
+    Checksum,
+    Exited,
+    Finish,
+    Init,
+    Running,
+    Start,
+)
 
 
 class ForwardModelRunner:
@@ -19,12 +30,21 @@ def __init__(self, steps_data: dict[str, Any]):
         self.real_id = steps_data.get("real_id")
         self.ert_pid = steps_data.get("ert_pid")
         self.global_environment = steps_data.get("global_environment")
+        self.num_cpu = steps_data.get("num_cpu") or 1
+        self.checksum_mode = ChecksumMode(
+            steps_data.get("checksum_mode") or ChecksumMode.MD5
+        )
+        self.memory_poll_period = steps_data.get("memory_poll_period")
         if self.simulation_id is not None:
             os.environ["ERT_RUN_ID"] = self.simulation_id
 
         self.steps: list[ForwardModelStep] = []
         for index, step_data in enumerate(steps_data["jobList"]):
-            self.steps.append(ForwardModelStep(step_data, index))
+            self.steps.append(
+                ForwardModelStep(
+                    step_data, index, memory_poll_period=self.memory_poll_period
+                )
+            )
 
         self._set_environment()
 
@@ -41,12 +61,16 @@ def _read_manifest(self):
     def _populate_checksums(self, manifest):
         if not manifest:
             return {}
-        for info in manifest.values():
+
+        def populate(info):
             path = Path(info["path"])
             if path.exists():
-                info["md5sum"] = hashlib.md5(path.read_bytes()).hexdigest()
+                info.update(checksum_info(path, self.checksum_mode))
             else:
                 info["error"] = f"Expected file {path} not created by forward model!"
+
+        with ThreadPoolExecutor(max_workers=self.num_cpu) as executor:
+            list(executor.map(populate, manifest.values()))
         return manifest
 
     def run(self, names_of_steps_to_run: list[str]):
@@ -76,23 +100,78 @@ def run(self, names_of_steps_to_run: list[str]):
         else:
             yield init_message
 
-        for step in step_queue:
-            for status_update in step.run():
+        for steps in _parallel_groups(step_queue):
+            failed = False
+            for status_update in self._run_steps(steps):
                 yield status_update
                 if not status_update.success():
-                    yield Checksum(checksum_dict={}, run_path=os.getcwd())
-                    yield Finish().with_error(
-                        "Not all forward model steps completed successfully."
-                    )
-                    return
+                    failed = True
+            if failed:
+                yield Checksum(checksum_dict={}, run_path=os.getcwd())
+                yield Finish().with_error(
+                    "Not all forward model steps completed successfully."
+                )
+                return
 
         checksum_dict = self._populate_checksums(self._read_manifest())
         yield Checksum(checksum_dict=checksum_dict, run_path=os.getcwd())
         yield Finish()
 
+    def _run_steps(
+        self, steps: list[ForwardModelStep]
+    ) -> Generator[Start | Exited | Running | None]:
+        """Run steps concurrently, at most num_cpu at a time, and yield their
+        status updates as they arrive. Once a step has failed, the steps that
+        have not yet started are skipped."""
+        if len(steps) == 1:
+            yield from steps[0].run()
+            return
+
+        updates: queue.Queue[Start | Exited | Running | None] = queue.Queue()
+        failed = threading.Event()
+
+        def run_step(step: ForwardModelStep) -> None:
+            try:
+                if failed.is_set():
+                    return
+                for status_update in step.run():
+                    if not status_update.success():
+                        failed.set()
+                    updates.put(status_update)
+            finally:
+                updates.put(None)
+
+        with ThreadPoolExecutor(max_workers=self.num_cpu) as executor:
+            for step in steps:
+                executor.submit(run_step, step)
+            remaining = len(steps)
+            while remaining:
+                status_update = updates.get()
+                if status_update is None:
+                    remaining -= 1
+                else:
+                    yield status_update
+
     def _set_environment(self):
         if self.global_environment:
             for key, value in self.global_environment.items():
                 for env_key, env_val in os.environ.items():
                     value = value.replace(f"${env_key}", env_val)
                 os.environ[key] = value
+
+
+def _parallel_groups(steps: list[ForwardModelStep]) -> list[list[ForwardModelStep]]:
+    """Split steps into the groups that are run one after the other, where
+    consecutive steps with the same parallel_group make up one group."""
+    groups: list[list[ForwardModelStep]] = []
+    for step in steps:
+        group = step.job_data.get("parallel_group")
+        if (
+            group is not None
+            and groups
+            and (groups[-1][-1].job_data.get("parallel_group") == group)
+        ):
+            groups[-1].append(step)
+        else:
+            groups.append([step])
+    return groups
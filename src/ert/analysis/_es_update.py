@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import functools
 import logging
 import time
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
 from typing import (
     TYPE_CHECKING,
@@ -18,7 +18,7 @@
 import psutil
 from iterative_ensemble_smoother.experimental import AdaptiveESMDA
 
-from ert.config import GenKwConfig
+from ert.config import Field, GenKwConfig
 
 from ..config.analysis_config import ObservationGroups, UpdateSettings
 from ..config.analysis_module import ESSettings, IESSettings
@@ -118,10 +118,9 @@ def _save_param_ensemble_array_to_disk(
     iens_active_index: npt.NDArray[np.int_],
 ) -> None:
     config_node = ensemble.experiment.parameter_configuration[param_group]
-    for i, realization in enumerate(iens_active_index):
-        config_node.save_parameters(
-            ensemble, param_group, realization, param_ensemble_array[:, i]
-        )
+    config_node.save_parameters_bulk(
+        ensemble, param_group, np.asarray(iens_active_index), param_ensemble_array
+    )
 
 
 def _load_param_ensemble_array(
@@ -350,7 +349,9 @@ def _split_by_batchsize(
     return np.array_split(arr, sections)
 
 
-def _calculate_adaptive_batch_size(num_params: int, num_obs: int) -> int:
+def _calculate_adaptive_batch_size(
+    num_params: int, num_obs: int, num_workers: int = 1
+) -> int:
     """Calculate adaptive batch size to optimize memory usage during Adaptive Localization
     Adaptive Localization calculates the cross-covariance between parameters and responses.
     Cross-covariance is a matrix with shape num_params x num_obs which may be larger than memory.
@@ -367,6 +368,10 @@ def _calculate_adaptive_batch_size(num_params: int, num_obs: int) -> int:
     We want (required_memory < available_memory) so:
     num_params < available_memory / (num_obs * bytes_in_float32)
 
+    When num_workers batches are updated concurrently, the available memory is
+    shared between them, and the batches are made small enough that every
+    worker gets at least one.
+
     The available memory is checked using the `psutil` library, which provides information about
     system memory usage.
     From `psutil` documentation:
@@ -381,14 +386,17 @@ def _calculate_adaptive_batch_size(num_params: int, num_obs: int) -> int:
     memory_safety_factor = 0.8
     # Fields are stored as 32-bit floats.
     bytes_in_float32 = 4
-    return min(
-        int(
-            np.floor(
-                (available_memory_in_bytes * memory_safety_factor)
-                / (num_obs * bytes_in_float32)
-            )
+    return max(
+        min(
+            int(
+                np.floor(
+                    (available_memory_in_bytes * memory_safety_factor)
+                    / (num_workers * num_obs * bytes_in_float32)
+                )
+            ),
+            -(-num_params // num_workers),
         ),
-        num_params,
+        1,
     )
 
 
@@ -422,11 +430,10 @@ def _copy_unupdated_parameters(
         set(all_parameter_groups) - set(updated_parameter_groups)
     )
 
-    # Copy the non-updated parameter groups from source to target for each active realization
+    # Copy the non-updated parameter groups from source to target for all active realizations
     for parameter_group in not_updated_parameter_groups:
-        for realization in iens_active_index:
-            ds = source_ensemble.load_parameters(parameter_group, realization)
-            target_ensemble.save_parameters(parameter_group, realization, ds)
+        ds = source_ensemble.load_parameters(parameter_group, iens_active_index)
+        target_ensemble.save_parameters(parameter_group, iens_active_index, ds)
 
 
 def analysis_ES(
@@ -519,13 +526,54 @@ def adaptive_localization_progress_callback(
         # Add identity in place for fast computation
         np.fill_diagonal(T, T.diagonal() + 1)
 
-    def correlation_callback(
-        cross_correlations_of_batch: npt.NDArray[np.float64],
-        cross_correlations_accumulator: list[npt.NDArray[np.float64]],
-    ) -> None:
-        cross_correlations_accumulator.append(cross_correlations_of_batch)
+    def assimilate_batch(
+        X_local: npt.NDArray[np.float64], save_correlations: bool
+    ) -> tuple[npt.NDArray[np.float64], list[npt.NDArray[np.float64]]]:
+        cross_correlations: list[npt.NDArray[np.float64]] = []
+        X_local = smoother_adaptive_es.assimilate(
+            X=X_local,
+            Y=S,
+            D=D,
+            alpha=1.0,  # The user is responsible for scaling observation covariance (esmda usage)
+            correlation_threshold=module.correlation_threshold,
+            cov_YY=cov_YY,
+            progress_callback=adaptive_localization_progress_callback,
+            correlation_callback=cross_correlations.append
+            if save_correlations
+            else None,
+        )
+        return X_local, cross_correlations
+
+    def update_param_group(
+        param_group: str,
+    ) -> tuple[npt.NDArray[np.float64], str, list[str]] | None:
+        """Update param_group, and return the cross correlations to save"""
+        cross_correlations_to_save = None
+        if (
+            module.field_chunk_size is not None
+            and not module.localization
+            and isinstance(
+                source_ensemble.experiment.parameter_configuration[param_group], Field
+            )
+        ):
+            log_msg = (
+                f"Updating {param_group} in chunks of {module.field_chunk_size} cells.."
+            )
+            logger.info(log_msg)
+            progress_callback(AnalysisStatusEvent(msg=log_msg))
+            start = time.time()
+            target_ensemble.save_parameters_product(
+                source_ensemble,
+                param_group,
+                iens_active_index,
+                T,
+                module.field_chunk_size,
+            )
+            logger.info(
+                f"Updating {param_group} completed in {(time.time() - start) / 60} minutes"
+            )
+            return None
 
-    for param_group in parameters:
         param_ensemble_array = _load_param_ensemble_array(
             source_ensemble, param_group, iens_active_index
         )
@@ -534,7 +582,9 @@ def correlation_callback(
                 param_group
             ]
             num_params = param_ensemble_array.shape[0]
-            batch_size = _calculate_adaptive_batch_size(num_params, num_obs)
+            batch_size = _calculate_adaptive_batch_size(
+                num_params, num_obs, module.max_workers
+            )
             batches = _split_by_batchsize(np.arange(0, num_params), batch_size)
 
             log_msg = f"Running localization on {num_params} parameters, {num_obs} responses, {ensemble_size} realizations and {len(batches)} batches"
@@ -543,27 +593,18 @@ def correlation_callback(
 
             start = time.time()
             cross_correlations: list[npt.NDArray[np.float64]] = []
-            for param_batch_idx in batches:
-                X_local = param_ensemble_array[param_batch_idx, :]
-                if isinstance(config_node, GenKwConfig):
-                    correlation_batch_callback = functools.partial(
-                        correlation_callback,
-                        cross_correlations_accumulator=cross_correlations,
-                    )
-                else:
-                    correlation_batch_callback = None
-                param_ensemble_array[param_batch_idx, :] = (
-                    smoother_adaptive_es.assimilate(
-                        X=X_local,
-                        Y=S,
-                        D=D,
-                        alpha=1.0,  # The user is responsible for scaling observation covariance (esmda usage)
-                        correlation_threshold=module.correlation_threshold,
-                        cov_YY=cov_YY,
-                        progress_callback=adaptive_localization_progress_callback,
-                        correlation_callback=correlation_batch_callback,
-                    )
-                )
+            # The batches are independent, and the results are collected in
+            # batch order, so the update does not depend on the number of workers
+            updated_batches = batch_executor.map(
+                assimilate_batch,
+                [param_ensemble_array[idx, :] for idx in batches],
+                [isinstance(config_node, GenKwConfig)] * len(batches),
+            )
+            for param_batch_idx, (X_local, correlations) in zip(
+                batches, updated_batches, strict=True
+            ):
+                param_ensemble_array[param_batch_idx, :] = X_local
+                cross_correlations.extend(correlations)
 
             if cross_correlations:
                 assert isinstance(config_node, GenKwConfig)
@@ -573,7 +614,7 @@ def correlation_callback(
                 ]
                 cross_correlations_ = np.vstack(cross_correlations)
                 if cross_correlations_.size != 0:
-                    source_ensemble.save_cross_correlations(
+                    cross_correlations_to_save = (
                         cross_correlations_,
                         param_group,
                         parameter_names[: cross_correlations_.shape[0]],
@@ -599,14 +640,29 @@ def correlation_callback(
         logger.info(
             f"Storing data for {param_group} completed in {(time.time() - start) / 60} minutes"
         )
+        return cross_correlations_to_save
 
-        _copy_unupdated_parameters(
-            list(source_ensemble.experiment.parameter_configuration.keys()),
-            parameters,
-            iens_active_index,
-            source_ensemble,
-            target_ensemble,
-        )
+    # Parameter groups and localization batches use separate pools, as the
+    # update of a parameter group waits for its batches
+    with (
+        ThreadPoolExecutor(max_workers=module.max_workers) as group_executor,
+        ThreadPoolExecutor(max_workers=module.max_workers) as batch_executor,
+    ):
+        updated_groups = list(group_executor.map(update_param_group, parameters))
+
+    # Every group writes the same file, so the correlations are saved in group
+    # order once all groups are updated, as they would be with a single worker
+    for cross_correlations_to_save in updated_groups:
+        if cross_correlations_to_save is not None:
+            source_ensemble.save_cross_correlations(*cross_correlations_to_save)
+
+    _copy_unupdated_parameters(
+        list(source_ensemble.experiment.parameter_configuration.keys()),
+        parameters,
+        iens_active_index,
+        source_ensemble,
+        target_ensemble,
+    )
 
 
 def analysis_IES(
@@ -742,6 +798,21 @@ def _create_smoother_snapshot(
     )
 
 
+def _store_field_std_devs(ensemble: Ensemble, parameters: Iterable[str]) -> None:
+    """
+    Compute and store the standard deviation of the updated fields, so that
+    it is ready when the posterior is plotted
+    """
+    for param_group in parameters:
+        if isinstance(ensemble.experiment.parameter_configuration[param_group], Field):
+            t = time.perf_counter()
+            ensemble.calculate_std_dev_for_parameter(param_group)
+            logger.info(
+                f"Stored standard deviation of {param_group} in "
+                f"{time.perf_counter() - t:.2f} seconds"
+            )
+
+
 def smoother_update(
     prior_storage: Ensemble,
     posterior_storage: Ensemble,
@@ -757,6 +828,7 @@ def smoother_update(
         progress_callback = noop_progress_callback
     if rng is None:
         rng = np.random.default_rng()
+    parameters = list(parameters)
     analysis_config = UpdateSettings() if analysis_config is None else analysis_config
     es_settings = ESSettings() if es_settings is None else es_settings
     ens_mask = prior_storage.get_realization_mask_with_responses()
@@ -796,6 +868,7 @@ def smoother_update(
             )
         )
         raise e
+    _store_field_std_devs(posterior_storage, parameters)
     progress_callback(
         AnalysisCompleteEvent(
             data=DataSection(
@@ -826,6 +899,7 @@ def iterative_smoother_update(
         progress_callback = noop_progress_callback
     if rng is None:
         rng = np.random.default_rng()
+    parameters = list(parameters)
 
     ens_mask = prior_storage.get_realization_mask_with_responses()
 
@@ -866,6 +940,7 @@ def iterative_smoother_update(
             )
         )
         raise e
+    _store_field_std_devs(posterior_storage, parameters)
     progress_callback(
         AnalysisCompleteEvent(
             data=DataSection(
@@ -29,15 +29,17 @@ async def _read_parameters(
         try:
             start_time = time.perf_counter()
             logger.debug(f"Starting to load parameter: {config.name}")
-            ds = config.read_from_runpath(Path(run_path), realization, iteration)
-            await asyncio.sleep(0)
+            ds = await asyncio.to_thread(
+                config.read_from_runpath, Path(run_path), realization, iteration
+            )
             logger.debug(
                 f"Loaded {config.name}",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
             )
             start_time = time.perf_counter()
-            ensemble.save_parameters(config.name, realization, ds)
-            await asyncio.sleep(0)
+            await asyncio.to_thread(
+                ensemble.save_parameters, config.name, realization, ds
+            )
             logger.debug(
                 f"Saved {config.name} to storage",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
@@ -61,19 +63,21 @@ async def _write_responses_to_storage(
             start_time = time.perf_counter()
             logger.debug(f"Starting to load response: {config.response_type}")
             try:
-                ds = config.read_from_file(run_path, realization, ensemble.iteration)
+                ds = await asyncio.to_thread(
+                    config.read_from_file, run_path, realization, ensemble.iteration
+                )
             except (FileNotFoundError, InvalidResponseFile) as err:
                 errors.append(str(err))
                 logger.warning(f"Failed to write: {realization}: {err}")
                 continue
-            await asyncio.sleep(0)
             logger.debug(
                 f"Loaded {config.response_type}",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
             )
             start_time = time.perf_counter()
-            ensemble.save_response(config.response_type, ds, realization)
-            await asyncio.sleep(0)
+            await asyncio.to_thread(
+                ensemble.save_response, config.response_type, ds, realization
+            )
             logger.debug(
                 f"Saved {config.response_type} to storage",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
@@ -74,6 +74,14 @@ class ESSettings(BaseSettings):
             title="Adaptive localization correlation threshold",
         ),
     ] = None
+    max_workers: Annotated[
+        int,
+        Field(ge=1, title="Maximum number of parallel update workers"),
+    ] = 1
+    field_chunk_size: Annotated[
+        int | None,
+        Field(ge=1, title="Number of field cells updated at a time"),
+    ] = None
 
     def correlation_threshold(self, ensemble_size: int) -> float:
         """Decides whether to use user-defined or default threshold.
@@ -195,6 +195,7 @@ def handle_default(fm_step: ForwardModelStep, arg: str) -> str:
             ),
             "exec_env": substituter.filter_env_dict(fm_step.exec_env),
             "max_running_minutes": fm_step.max_running_minutes,
+            "parallel_group": fm_step.parallel_group,
         }
 
         try:
@@ -1157,6 +1158,7 @@ def _forward_model_step_from_config_file(
             target_file=content_dict.get("TARGET_FILE"),
             error_file=content_dict.get("ERROR_FILE"),
             max_running_minutes=content_dict.get("MAX_RUNNING_MINUTES"),
+            parallel_group=content_dict.get("PARALLEL_GROUP"),
             min_arg=content_dict.get("MIN_ARG"),
             max_arg=content_dict.get("MAX_ARG"),
             arglist=content_dict.get("ARGLIST", []),
@@ -104,7 +104,36 @@ def save_parameters(
         realization: int,
         data: npt.NDArray[np.float64],
     ) -> None:
-        raise NotImplementedError()
+        self.save_parameters_bulk(
+            ensemble, group, np.array([realization]), data[:, np.newaxis]
+        )
+
+    def save_parameters_bulk(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        if isinstance(self.input_keys, dict):
+            names = [
+                f"{key}\0{suffix}"
+                for key, suffixes in self.input_keys.items()
+                for suffix in suffixes
+            ]
+        else:
+            names = list(self.input_keys)
+        ds = xr.Dataset(
+            {
+                "values": (
+                    ["realizations", "names"],
+                    np.asarray(data, dtype=np.float64).T,
+                ),
+                "names": names,
+            },
+            coords={"realizations": realizations},
+        )
+        ensemble.save_parameters(group, realizations, ds)
 
     def load_parameters(
         self, ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
@@ -136,7 +136,7 @@ def __len__(self) -> int:
         if self.mask_file is None:
             return self.nx * self.ny * self.nz
 
-        return np.size(self.mask) - np.count_nonzero(self.mask)
+        return len(self.active_index)
 
     def read_from_runpath(
         self, run_path: Path, real_nr: int, iteration: int
@@ -188,28 +188,39 @@ def save_parameters(
         realization: int,
         data: npt.NDArray[np.float64],
     ) -> None:
-        ma = np.ma.MaskedArray(  # type: ignore
-            data=np.zeros(self.mask.size),
-            mask=self.mask,
-            fill_value=np.nan,
+        self.save_parameters_bulk(
+            ensemble, group, np.array([realization]), data[:, np.newaxis]
         )
-        ma[~ma.mask] = data
-        ma = ma.reshape(self.mask.shape)  # type: ignore
-        ds = xr.Dataset({"values": (["x", "y", "z"], ma.filled())})  # type: ignore
-        ensemble.save_parameters(group, realization, ds)
+
+    def save_parameters_bulk(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        values = np.full(
+            (len(realizations), self.nx * self.ny * self.nz),
+            np.nan,
+            dtype=np.result_type(data.dtype, np.float32),
+        )
+        values[:, self.active_index] = data.T
+        ds = xr.Dataset(
+            {
+                "values": (
+                    ["realizations", "x", "y", "z"],
+                    values.reshape(len(realizations), self.nx, self.ny, self.nz),
+                )
+            },
+            coords={"realizations": realizations},
+        )
+        ensemble.save_parameters(group, realizations, ds)
 
     def load_parameters(
         self, ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
     ) -> npt.NDArray[np.float64]:
-        ds = ensemble.load_parameters(group, realizations)
-        ensemble_size = len(ds.realizations)
-        da = xr.DataArray(
-            [
-                np.ma.MaskedArray(data=d, mask=self.mask).compressed()  # type: ignore
-                for d in ds["values"].values.reshape(ensemble_size, -1)
-            ]
-        )
-        return da.T.to_numpy()
+        values = ensemble.load_parameters(group, realizations)["values"].values
+        return values.reshape(len(values), -1)[:, self.active_index].T
 
     def _fetch_from_ensemble(self, real_nr: int, ensemble: Ensemble) -> xr.DataArray:
         da = ensemble.load_parameters(self.name, real_nr)["values"]
@@ -219,12 +230,10 @@ def _fetch_from_ensemble(self, real_nr: int, ensemble: Ensemble) -> xr.DataArray
     def _transform_data(
         self, data_array: xr.DataArray
     ) -> np.ma.MaskedArray[Any, np.dtype[np.float32]]:
+        data = np.array(data_array.values, dtype=np.float32)
         return np.ma.MaskedArray(  # type: ignore
             _field_truncate(
-                field_transform(
-                    data_array,
-                    transform_name=self.output_transformation,
-                ),
+                field_transform(data, transform_name=self.output_transformation),
                 self.truncation_min,
                 self.truncation_max,
             ),
@@ -237,6 +246,9 @@ def save_experiment_data(self, experiment_path: Path) -> None:
         if not mask_path.exists():
             mask, _ = read_mask(self.grid_file)
             np.save(mask_path, mask)
+        active_index_path = experiment_path / "grid_active_index.npy"
+        if not active_index_path.exists():
+            np.save(active_index_path, _active_index(np.load(mask_path)))
         self.mask_file = mask_path
 
     @cached_property
@@ -248,6 +260,24 @@ def mask(self) -> Any:
             )
         return np.load(self.mask_file)
 
+    @cached_property
+    def active_index(self) -> npt.NDArray[np.int_]:
+        """
+        The flat index of the active cells of the grid, so that the active
+        values of a field are field.ravel()[active_index]. Memory mapped from
+        the experiment, and shared between realizations and processes.
+        """
+        if self.mask_file is not None:
+            active_index_path = self.mask_file.with_name("grid_active_index.npy")
+            if active_index_path.exists():
+                return np.load(active_index_path, mmap_mode="r")
+        # Experiments created before the index was stored with the mask
+        return _active_index(self.mask)
+
+
+def _active_index(mask: npt.NDArray[np.bool_]) -> npt.NDArray[np.int_]:
+    return np.flatnonzero(~np.asarray(mask).ravel())
+
 
 TRANSFORM_FUNCTIONS = {
     "LN": np.log,
@@ -283,14 +313,14 @@ def field_transform(
     return TRANSFORM_FUNCTIONS[transform_name](data)  # type: ignore
 
 
-def _field_truncate(data: npt.ArrayLike, min_: float | None, max_: float | None) -> Any:
-    if min_ is not None and max_ is not None:
-        vfunc = np.vectorize(lambda x: max(min(x, max_), min_))
-        return vfunc(data)
-    elif min_ is not None:
-        vfunc = np.vectorize(lambda x: max(x, min_))
-        return vfunc(data)
-    elif max_ is not None:
-        vfunc = np.vectorize(lambda x: min(x, max_))
-        return vfunc(data)
+def _field_truncate(
+    data: npt.NDArray[np.float32], min_: float | None, max_: float | None
+) -> npt.NDArray[np.float32]:
+    """Truncates data in place to the interval [min_, max_]. NaN values
+    are left as they are. If min_ is larger than max_, every value
+    becomes min_."""
+    if max_ is not None:
+        np.minimum(data, max_, out=data)
+    if min_ is not None:
+        np.maximum(data, min_, out=data)
     return data
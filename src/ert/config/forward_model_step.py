@@ -54,6 +54,8 @@ class ForwardModelStepJSON(TypedDict):
             environment of the forward model step.
         max_running_minutes: Maximum runtime in minutes. If the forward model step
             takes longer than this, the job is requested to be cancelled.
+        parallel_group: Consecutive forward model steps with the same
+            parallel group are run concurrently.
     """
 
     name: str
@@ -68,6 +70,7 @@ class ForwardModelStepJSON(TypedDict):
     environment: dict[str, str]
     exec_env: dict[str, str]
     max_running_minutes: int
+    parallel_group: str | None
 
 
 class ForwardModelStepOptions(TypedDict, total=False):
@@ -78,6 +81,7 @@ class ForwardModelStepOptions(TypedDict, total=False):
     target_file: NotRequired[str]
     error_file: NotRequired[str]
     max_running_minutes: NotRequired[int]
+    parallel_group: NotRequired[str]
     environment: NotRequired[dict[str, str | int]]
     exec_env: NotRequired[dict[str, str | int]]
     default_mapping: NotRequired[dict[str, str | int]]
@@ -122,6 +126,9 @@ class ForwardModelStep:
             This file is used for the legacy ERT queue driver, and may be deprecated.
         max_running_minutes: Maximum runtime in minutes. If the forward model step
             takes longer than this, the job is requested to be cancelled.
+        parallel_group: Consecutive forward model steps with the same parallel
+            group are run concurrently, as many at a time as the number of
+            cpus given to the realization.
         min_arg: The minimum number of arguments
         max_arg: The maximum number of arguments
         arglist: The arglist with which the executable is invoked
@@ -149,6 +156,7 @@ class ForwardModelStep:
     target_file: str | None = None
     error_file: str | None = None
     max_running_minutes: int | None = None
+    parallel_group: str | None = None
     min_arg: int | None = None
     max_arg: int | None = None
     arglist: list[str] = field(default_factory=list)
@@ -229,6 +237,7 @@ def __init__(
         target_file = kwargs.get("target_file")
         error_file = kwargs.get("error_file")
         max_running_minutes = kwargs.get("max_running_minutes")
+        parallel_group = kwargs.get("parallel_group")
         environment = kwargs.get("environment", {}) or {}
         exec_env = kwargs.get("exec_env", {}) or {}
         default_mapping = kwargs.get("default_mapping", {}) or {}
@@ -244,6 +253,7 @@ def __init__(
             target_file=target_file,
             error_file=error_file,
             max_running_minutes=max_running_minutes,
+            parallel_group=parallel_group,
             min_arg=0,
             max_arg=0,
             required_keywords=[],
@@ -2,6 +2,7 @@
 
 import dataclasses
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -60,6 +61,28 @@ def sample_or_load(
     ) -> xr.Dataset:
         return self.read_from_runpath(Path(), real_nr, 0)
 
+    def save_prior(
+        self,
+        ensemble: Ensemble,
+        realizations: Iterable[int],
+        random_seed: int,
+    ) -> None:
+        """
+        Sample or load the prior of the given realizations and save
+        it to the ensemble. Parameters that can sample every realization
+        at once should override this.
+        """
+        for realization in realizations:
+            ensemble.save_parameters(
+                self.name,
+                realization,
+                self.sample_or_load(
+                    realization,
+                    random_seed=random_seed,
+                    ensemble_size=ensemble.ensemble_size,
+                ),
+            )
+
     @abstractmethod
     def __len__(self) -> int:
         """Number of parameters"""
@@ -98,6 +121,21 @@ def save_parameters(
         Save the parameter in internal storage for the given ensemble
         """
 
+    def save_parameters_bulk(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        """
+        Save the parameter for several realizations at once, where data is
+        of shape (number of parameters, number of realizations), i.e. the
+        layout returned by load_parameters.
+        """
+        for i, realization in enumerate(realizations):
+            self.save_parameters(ensemble, group, realization, data[:, i])
+
     @abstractmethod
     def load_parameters(
         self, ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
@@ -27,6 +27,10 @@ class ConfigKeys(StrEnum):
     JOB_SCRIPT = "JOB_SCRIPT"
     JOBNAME = "JOBNAME"
     MAX_SUBMIT = "MAX_SUBMIT"
+    MAX_PARALLEL_INTERNALIZATION = "MAX_PARALLEL_INTERNALIZATION"
+    CHECKSUM_MODE = "CHECKSUM_MODE"
+    MEMORY_POLL_PERIOD = "MEMORY_POLL_PERIOD"
+    CONSOLIDATE_RESPONSES = "CONSOLIDATE_RESPONSES"
     DESIGN_MATRIX = "DESIGN_MATRIX"
     NUM_REALIZATIONS = "NUM_REALIZATIONS"
     MIN_REALIZATIONS = "MIN_REALIZATIONS"
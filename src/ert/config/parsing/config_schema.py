@@ -1,3 +1,5 @@
+from _ert.checksum import ChecksumMode
+
 from .config_dict import ConfigDict
 from .config_keywords import ConfigKeys
 from .config_schema_deprecations import deprecated_keywords_list
@@ -101,6 +103,13 @@ def stop_long_running_keyword() -> SchemaItem:
     )
 
 
+def consolidate_responses_keyword() -> SchemaItem:
+    return SchemaItem(
+        kw=ConfigKeys.CONSOLIDATE_RESPONSES,
+        type_map=[SchemaItemType.BOOL],
+    )
+
+
 def analysis_set_var_keyword() -> SchemaItem:
     return SchemaItem(
         kw=ConfigKeys.ANALYSIS_SET_VAR,
@@ -160,6 +169,15 @@ def load_workflow_job_keyword() -> SchemaItem:
     )
 
 
+def checksum_mode_keyword() -> SchemaItem:
+    return SchemaItem(
+        kw=ConfigKeys.CHECKSUM_MODE,
+        argc_min=1,
+        argc_max=1,
+        type_map=[ChecksumMode],
+    )
+
+
 def queue_system_keyword(required: bool) -> SchemaItem:
     return SchemaItem(
         kw=ConfigKeys.QUEUE_SYSTEM,
@@ -295,6 +313,10 @@ def init_site_config_schema() -> ConfigSchemaDict:
     schema = ConfigSchemaDict()
     for item in [
         positive_int_keyword(ConfigKeys.MAX_SUBMIT),
+        positive_int_keyword(ConfigKeys.MAX_PARALLEL_INTERNALIZATION),
+        checksum_mode_keyword(),
+        positive_float_keyword(ConfigKeys.MEMORY_POLL_PERIOD),
+        consolidate_responses_keyword(),
         positive_int_keyword(ConfigKeys.NUM_CPU),
         string_keyword(ConfigKeys.REALIZATION_MEMORY),
         queue_system_keyword(True),
@@ -358,6 +380,10 @@ def init_user_config_schema() -> ConfigSchemaDict:
         history_source_keyword(),
         path_keyword(ConfigKeys.RUNPATH_FILE),
         positive_int_keyword(ConfigKeys.MAX_SUBMIT),
+        positive_int_keyword(ConfigKeys.MAX_PARALLEL_INTERNALIZATION),
+        checksum_mode_keyword(),
+        positive_float_keyword(ConfigKeys.MEMORY_POLL_PERIOD),
+        consolidate_responses_keyword(),
         positive_int_keyword(ConfigKeys.NUM_CPU),
         positive_int_keyword(ConfigKeys.MAX_RUNNING),
         string_keyword(ConfigKeys.REALIZATION_MEMORY),
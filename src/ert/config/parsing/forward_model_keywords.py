@@ -15,6 +15,7 @@ class ForwardModelStepKeys(StrEnum):
 
     MAX_RUNNING = "MAX_RUNNING"
     MAX_RUNNING_MINUTES = "MAX_RUNNING_MINUTES"
+    PARALLEL_GROUP = "PARALLEL_GROUP"
 
     MIN_ARG = "MIN_ARG"
     MAX_ARG = "MAX_ARG"
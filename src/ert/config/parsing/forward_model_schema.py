@@ -67,6 +67,14 @@ def max_running_minutes_keyword() -> SchemaItem:
     )
 
 
+def parallel_group_keyword() -> SchemaItem:
+    return SchemaItem(
+        kw=ForwardModelStepKeys.PARALLEL_GROUP,
+        type_map=[SchemaItemType.STRING],
+        required_set=False,
+    )
+
+
 def min_arg_keyword() -> SchemaItem:
     return SchemaItem(
         kw=ForwardModelStepKeys.MIN_ARG,
@@ -146,6 +154,7 @@ def default_keyword() -> SchemaItem:
     target_file_keyword(),
     error_file_keyword(),
     max_running_minutes_keyword(),
+    parallel_group_keyword(),
     min_arg_keyword(),
     max_arg_keyword(),
     arglist_keyword(),
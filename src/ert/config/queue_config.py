@@ -11,6 +11,8 @@
 import pydantic
 from pydantic.dataclasses import dataclass
 
+from _ert.checksum import ChecksumMode
+
 from .parsing import (
     ConfigDict,
     ConfigKeys,
@@ -38,6 +40,7 @@ class QueueOptions:
     name: str
     max_running: pydantic.NonNegativeInt = 0
     submit_sleep: pydantic.NonNegativeFloat = 0.0
+    job_array_size: pydantic.NonNegativeInt = 0
     project_code: str | None = None
     activate_script: str = field(default_factory=activate_script)
 
@@ -115,6 +118,7 @@ def driver_options(self) -> dict[str, Any]:
         driver_dict["queue_name"] = driver_dict.pop("lsf_queue")
         driver_dict["resource_requirement"] = driver_dict.pop("lsf_resource")
         driver_dict.pop("submit_sleep")
+        driver_dict.pop("job_array_size")
         driver_dict.pop("max_running")
         return driver_dict
 
@@ -137,6 +141,7 @@ def driver_options(self) -> dict[str, Any]:
         driver_dict["queue_name"] = driver_dict.pop("queue")
         driver_dict.pop("max_running")
         driver_dict.pop("submit_sleep")
+        driver_dict.pop("job_array_size")
         return driver_dict
 
 
@@ -168,6 +173,7 @@ def driver_options(self) -> dict[str, Any]:
         driver_dict["queue_name"] = driver_dict.pop("partition")
         driver_dict.pop("max_running")
         driver_dict.pop("submit_sleep")
+        driver_dict.pop("job_array_size")
         return driver_dict
 
 
@@ -257,6 +263,10 @@ class QueueConfig:
     queue_options_test_run: LocalQueueOptions = field(default_factory=LocalQueueOptions)
     stop_long_running: bool = False
     max_runtime: int | None = None
+    max_parallel_internalization: int = 4
+    checksum_mode: ChecksumMode = ChecksumMode.MD5
+    memory_poll_period: float = 5.0
+    consolidate_responses: bool = False
 
     @no_type_check
     @classmethod
@@ -317,6 +327,14 @@ def from_dict(cls, config_dict: ConfigDict) -> QueueConfig:
             queue_options_test_run,
             stop_long_running=bool(stop_long_running),
             max_runtime=config_dict.get(ConfigKeys.MAX_RUNTIME),
+            max_parallel_internalization=config_dict.get(
+                ConfigKeys.MAX_PARALLEL_INTERNALIZATION, 4
+            ),
+            checksum_mode=config_dict.get(ConfigKeys.CHECKSUM_MODE, ChecksumMode.MD5),
+            memory_poll_period=config_dict.get(ConfigKeys.MEMORY_POLL_PERIOD, 5.0),
+            consolidate_responses=bool(
+                config_dict.get(ConfigKeys.CONSOLIDATE_RESPONSES, False)
+            ),
         )
 
     def create_local_copy(self) -> QueueConfig:
@@ -329,6 +347,10 @@ def create_local_copy(self) -> QueueConfig:
             self.queue_options_test_run,
             stop_long_running=bool(self.stop_long_running),
             max_runtime=self.max_runtime,
+            max_parallel_internalization=self.max_parallel_internalization,
+            checksum_mode=self.checksum_mode,
+            memory_poll_period=self.memory_poll_period,
+            consolidate_responses=self.consolidate_responses,
         )
 
     @property
@@ -339,6 +361,10 @@ def max_running(self) -> int:
     def submit_sleep(self) -> float:
         return self.queue_options.submit_sleep
 
+    @property
+    def job_array_size(self) -> int:
+        return self.queue_options.job_array_size
+
 
 def _parse_realization_memory_str(realization_memory_str: str) -> int:
     if "-" in realization_memory_str:
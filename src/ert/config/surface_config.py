@@ -150,16 +150,30 @@ def save_parameters(
         group: str,
         realization: int,
         data: npt.NDArray[np.float64],
+    ) -> None:
+        self.save_parameters_bulk(
+            ensemble, group, np.array([realization]), data[:, np.newaxis]
+        )
+
+    def save_parameters_bulk(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
     ) -> None:
         ds = xr.Dataset(
             {
                 "values": (
-                    ["x", "y"],
-                    data.reshape(self.ncol, self.nrow).astype("float32"),
+                    ["realizations", "x", "y"],
+                    data.T.reshape(len(realizations), self.ncol, self.nrow).astype(
+                        "float32"
+                    ),
                 )
-            }
+            },
+            coords={"realizations": realizations},
         )
-        ensemble.save_parameters(group, realization, ds)
+        ensemble.save_parameters(group, realizations, ds)
 
     @staticmethod
     def load_parameters(
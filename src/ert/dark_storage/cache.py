@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from ert.dark_storage.common import data_for_key
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from ert.storage import Ensemble
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024**2
+
+
+@dataclass
+class CacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions, "
+            f"{self.size / 1024**2:.1f} MiB cached"
+        )
+
+
+@dataclass
+class _Entry:
+    state: Any
+    dataframe: pd.DataFrame
+    size: int
+
+
+class ResponseCache:
+    """
+    Least recently used cache of the dataframes given by data_for_key, keyed
+    by ensemble id and key, and bounded by the total memory of the dataframes.
+
+    An entry is only used while the state of its ensemble, as given by
+    get_ensemble_state, and its saved responses and parameters, as given by
+    get_responses_version and get_parameters_version, are unchanged, so
+    realizations finishing or being rerun, or an update saving parameters,
+    invalidate it. The dataframes are shared between requests, and
+    must not be modified.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.metrics = CacheMetrics()
+        self._entries: OrderedDict[tuple[UUID, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def data_for_key(self, ensemble: Ensemble, key: str) -> pd.DataFrame:
+        cache_key = (ensemble.id, key)
+        state = (
+            tuple(frozenset(s) for s in ensemble.get_ensemble_state()),
+            ensemble.get_responses_version(),
+            ensemble.get_parameters_version(),
+        )
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry.state == state:
+                self._entries.move_to_end(cache_key)
+                self.metrics.hits += 1
+                return entry.dataframe
+            self.metrics.misses += 1
+
+        dataframe = data_for_key(ensemble, key)
+        size = int(dataframe.memory_usage(deep=True).sum())
+        with self._lock:
+            self._remove(cache_key)
+            if size <= self.max_bytes:
+                self._entries[cache_key] = _Entry(state, dataframe, size)
+                self.metrics.size += size
+                while self.metrics.size > self.max_bytes:
+                    self._remove(next(iter(self._entries)))
+                    self.metrics.evictions += 1
+        logger.debug(f"Dark storage response cache: {self.metrics}")
+        return dataframe
+
+    def invalidate(self, ensemble_id: UUID | None = None) -> None:
+        """Remove the entries of the given ensemble, or all entries"""
+        with self._lock:
+            for cache_key in list(self._entries):
+                if ensemble_id is None or cache_key[0] == ensemble_id:
+                    self._remove(cache_key)
+
+    def _remove(self, cache_key: tuple[UUID, str]) -> None:
+        if (entry := self._entries.pop(cache_key, None)) is not None:
+            self.metrics.size -= entry.size
+
+
+response_cache = ResponseCache()
@@ -1,38 +1,27 @@
-from collections.abc import Mapping
-
 import numpy as np
-import numpy.typing as npt
 import pandas as pd
 
-
-def _calculate_misfit(
-    obs_value: npt.NDArray[np.float64],
-    response_value: npt.NDArray[np.float64],
-    obs_std: npt.NDArray[np.float64],
-) -> list[float]:
-    difference = response_value - obs_value
-    misfit = (difference / obs_std) ** 2
-    return (misfit * np.sign(difference)).tolist()
+from ert.storage.misfits import calculate_misfits
 
 
 def calculate_misfits_from_pandas(
-    reponses_dict: Mapping[int, pd.DataFrame],
+    responses: pd.DataFrame,
     observation: pd.DataFrame,
     summary_misfits: bool = False,
 ) -> pd.DataFrame:
     """
-    Compute misfits from reponses_dict (real_id, values in dataframe)
-    and observation
+    Compute misfits of the responses, with one row per realization and one
+    column per index, to the observation, with the values and errors of
+    each observed index. All realizations are computed at once.
     """
-    misfits_dict = {}
-    for realization_index in reponses_dict:
-        misfits_dict[realization_index] = _calculate_misfit(
-            observation["values"],
-            reponses_dict[realization_index].loc[:, observation.index].values.flatten(),
-            observation["errors"],
-        )
-
-    df = pd.DataFrame(data=misfits_dict, index=observation.index)
+    misfits = calculate_misfits(
+        observation["values"].to_numpy(),
+        observation["errors"].to_numpy(),
+        responses.loc[:, observation.index].to_numpy().T,
+    )
     if summary_misfits:
-        df = pd.DataFrame([df.abs().sum(axis=0)], columns=df.columns, index=[0])
-    return df.T
+        return pd.DataFrame(
+            {0: np.nansum(np.abs(misfits), axis=0)},
+            index=responses.index,
+        )
+    return pd.DataFrame(misfits.T, index=responses.index, columns=observation.index)
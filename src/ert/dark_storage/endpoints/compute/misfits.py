@@ -1,15 +1,15 @@
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 from uuid import UUID
 
 import pandas as pd
 from dateutil.parser import parse
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import Response
 
 from ert.dark_storage import exceptions as exc
+from ert.dark_storage.cache import response_cache
 from ert.dark_storage.common import (
-    data_for_key,
     get_observation_keys_for_response,
     get_observations_for_obs_keys,
 )
@@ -38,14 +38,9 @@ async def get_response_misfits(
     summary_misfits: bool = False,
 ) -> Response:
     ensemble = storage.get_ensemble(ensemble_id)
-    dataframe = data_for_key(ensemble, response_name)
+    dataframe = response_cache.data_for_key(ensemble, response_name)
     if realization_index is not None:
-        dataframe = pd.DataFrame(dataframe.loc[realization_index]).T
-
-    response_dict = {}
-    for index, data in dataframe.iterrows():
-        data_df = pd.DataFrame(data).T
-        response_dict[index] = data_df
+        dataframe = dataframe.loc[[realization_index]]
 
     obs_keys = get_observation_keys_for_response(ensemble, response_name)
     obs = get_observations_for_obs_keys(ensemble, obs_keys)
@@ -68,7 +63,7 @@ def parse_index(x: Any) -> int | datetime:
     )
     try:
         result_df = calculate_misfits_from_pandas(
-            response_dict, observation_df, summary_misfits
+            dataframe, observation_df, summary_misfits
         )
     except Exception as misfits_exc:
         raise exc.UnprocessableError(
@@ -78,3 +73,35 @@ def parse_index(x: Any) -> int | datetime:
         content=result_df.to_csv().encode(),
         media_type="text/csv",
     )
+
+
+@router.get(
+    "/compute/misfits/groups",
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"text/csv": {}},
+        }
+    },
+)
+async def get_observation_group_misfits(
+    *,
+    storage: Storage = DEFAULT_STORAGEREADER,
+    ensemble_id: UUID,
+    observation_key: Annotated[list[str] | None, Query()] = None,
+) -> Response:
+    """
+    The sum of the absolute misfits over each observation group for each
+    realization, and the total over all groups, as computed by
+    LocalEnsemble.get_misfits_by_observation_group
+    """
+    ensemble = storage.get_ensemble(ensemble_id)
+    try:
+        result_df = ensemble.get_misfits_by_observation_group(observation_key)
+    except Exception as misfits_exc:
+        raise exc.UnprocessableError(
+            f"Unable to compute misfits: {misfits_exc}"
+        ) from misfits_exc
+    return Response(
+        content=result_df.to_csv().encode(),
+        media_type="text/csv",
+    )
@@ -1,16 +1,27 @@
 import io
-from collections.abc import Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from typing import Annotated, Any
 from urllib.parse import unquote
 from uuid import UUID, uuid4
 
 import numpy as np
-from fastapi import APIRouter, Body, Depends, File, Header, HTTPException, status
-from fastapi.responses import Response
+import pandas as pd
+import pyarrow as pa
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    status,
+)
+from fastapi.responses import Response, StreamingResponse
 
 from ert.dark_storage import json_schema as js
+from ert.dark_storage.cache import response_cache
 from ert.dark_storage.common import (
-    data_for_key,
     ensemble_parameters,
     gen_data_display_keys,
     get_observation_keys_for_response,
@@ -27,6 +38,49 @@
 DEFAULT_FILE = File(...)
 DEFAULT_HEADER = Header("application/json")
 
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+# Number of realizations in each record batch of an Arrow IPC stream
+ARROW_BATCH_SIZE = 64
+
+
+def _arrow_table(dataframe: pd.DataFrame, **metadata: str) -> pa.Table:
+    """
+    The dataframe as an Arrow table. Column names in Arrow are strings, so
+    the type of the columns of the dataframe is given in the schema metadata
+    under 'columns', together with metadata.
+    """
+    if isinstance(dataframe.columns, pd.DatetimeIndex):
+        column_type = "datetime"
+    elif pd.api.types.is_integer_dtype(dataframe.columns):
+        column_type = "int"
+    else:
+        column_type = "str"
+    table = pa.Table.from_pandas(dataframe.rename(columns=str))
+    return table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), "columns": column_type, **metadata}
+    )
+
+
+def _arrow_stream(tables: Iterable[pa.Table]) -> Iterator[bytes]:
+    """
+    The tables as consecutive Arrow IPC streams, yielded one record batch at
+    a time so that the response can be sent while it is being encoded
+    """
+    sink = io.BytesIO()
+
+    def flush() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    for table in tables:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=ARROW_BATCH_SIZE):
+                writer.write_batch(batch)
+                yield flush()
+        yield flush()
+
 
 @router.get("/ensembles/{ensemble_id}/records/{response_name}/observations")
 async def get_record_observations(
@@ -65,6 +119,7 @@ async def get_record_observations(
                 "application/json": {},
                 "text/csv": {},
                 "application/x-parquet": {},
+                ARROW_STREAM: {},
             }
         },
         status.HTTP_401_UNAUTHORIZED: {
@@ -83,14 +138,17 @@ async def get_ensemble_record(
 ) -> Any:
     name = unquote(name)
     try:
-        dataframe = data_for_key(storage.get_ensemble(ensemble_id), name)
+        dataframe = response_cache.data_for_key(storage.get_ensemble(ensemble_id), name)
     except PermissionError as e:
         raise HTTPException(status_code=401, detail=str(e)) from e
     media_type = accept if accept is not None else "text/csv"
-    if media_type == "application/x-parquet":
-        dataframe.columns = [str(s) for s in dataframe.columns]
+    if media_type == ARROW_STREAM:
+        return StreamingResponse(
+            _arrow_stream([_arrow_table(dataframe)]), media_type=ARROW_STREAM
+        )
+    elif media_type == "application/x-parquet":
         stream = io.BytesIO()
-        dataframe.to_parquet(stream)
+        dataframe.rename(columns=str).to_parquet(stream)
         return Response(
             content=stream.getvalue(),
             media_type="application/x-parquet",
@@ -104,6 +162,43 @@ async def get_ensemble_record(
         )
 
 
+@router.get(
+    "/records",
+    responses={
+        status.HTTP_200_OK: {"content": {ARROW_STREAM: {}}},
+        status.HTTP_401_UNAUTHORIZED: {
+            "content": {
+                "application/json": {"example": {"error": "Unauthorized access"}}
+            },
+        },
+    },
+)
+async def get_records(
+    *,
+    storage: Storage = DEFAULT_STORAGE,
+    ensemble_id: Annotated[list[UUID], Query()],
+    key: Annotated[list[str], Query()],
+) -> StreamingResponse:
+    """
+    The records of every key in every ensemble as consecutive Arrow IPC
+    streams, one for each ensemble and key, in that order. The ensemble id
+    and key of each stream is given in its schema metadata.
+    """
+    try:
+        tables = [
+            _arrow_table(
+                response_cache.data_for_key(storage.get_ensemble(id_), name),
+                ensemble_id=str(id_),
+                key=name,
+            )
+            for id_ in ensemble_id
+            for name in key
+        ]
+    except PermissionError as e:
+        raise HTTPException(status_code=401, detail=str(e)) from e
+    return StreamingResponse(_arrow_stream(tables), media_type=ARROW_STREAM)
+
+
 @router.get("/ensembles/{ensemble_id}/parameters", response_model=list[dict[str, Any]])
 async def get_ensemble_parameters(
     *, storage: Storage = DEFAULT_STORAGE, ensemble_id: UUID
@@ -172,13 +267,14 @@ def get_std_dev(
     ensemble = storage.get_ensemble(ensemble_id)
     try:
         da = ensemble.calculate_std_dev_for_parameter(key)["values"]
-    except ValueError as e:
+    except (ValueError, KeyError) as e:
         raise HTTPException(status_code=404, detail="Data not found") from e
 
     if z >= int(da.shape[2]):
         raise HTTPException(status_code=400, detail="Invalid z index")
 
-    data_2d = da[:, :, z]
+    # The standard deviation is memory-mapped, so only the layer is read
+    data_2d = np.ascontiguousarray(da.data[:, :, z])
 
     buffer = io.BytesIO()
     np.save(buffer, data_2d)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 
+from ert.dark_storage.cache import response_cache
+
 router = APIRouter(tags=["ensemble"])
 
 
 @router.post("/updates/facade")
 def refresh_facade() -> None:
-    pass
+    response_cache.invalidate()
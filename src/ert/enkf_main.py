@@ -9,6 +9,7 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import orjson
 import pandas as pd
 import xarray as xr
@@ -163,20 +164,20 @@ def save_design_matrix_to_ensemble(
     design_group_name: str = DESIGN_MATRIX_GROUP,
 ) -> None:
     assert not design_matrix_df.empty
-    for realization_nr in active_realizations:
-        row = design_matrix_df.loc[realization_nr][DESIGN_MATRIX_GROUP]
-        ds = xr.Dataset(
-            {
-                "values": ("names", list(row.values)),
-                "transformed_values": ("names", list(row.values)),
-                "names": list(row.keys()),
-            }
-        )
-        ensemble.save_parameters(
-            design_group_name,
-            realization_nr,
-            ds,
-        )
+    realizations = np.array(list(active_realizations), dtype=np.int_)
+    rows = design_matrix_df.loc[realizations][DESIGN_MATRIX_GROUP]
+    # All realizations are saved at once, so that the values have a common
+    # dtype when the design matrix mixes numbers and strings
+    values = np.array(rows.values.tolist())
+    ds = xr.Dataset(
+        {
+            "values": (["realizations", "names"], values),
+            "transformed_values": (["realizations", "names"], values),
+            "names": list(rows.columns),
+        },
+        coords={"realizations": realizations},
+    )
+    ensemble.save_parameters(design_group_name, realizations, ds)
 
 
 def sample_prior(
@@ -203,13 +204,7 @@ def sample_prior(
         logger.info(
             f"Sampling parameter {config_node.name} for realizations {active_realizations}"
         )
-        for realization_nr in active_realizations:
-            ds = config_node.sample_or_load(
-                realization_nr,
-                random_seed=random_seed,
-                ensemble_size=ensemble.ensemble_size,
-            )
-            ensemble.save_parameters(parameter, realization_nr, ds)
+        config_node.save_prior(ensemble, active_realizations, random_seed)
 
     ensemble.refresh_ensemble_state()
     logger.debug(f"sample_prior() time_used {(time.perf_counter() - t):.4f}s")
@@ -266,6 +266,10 @@ async def _evaluate_inner(  # pylint: disable=too-many-branches
                 max_submit=self._queue_config.max_submit,
                 max_running=self._queue_config.max_running,
                 submit_sleep=self._queue_config.submit_sleep,
+                job_array_size=self._queue_config.job_array_size,
+                max_parallel_internalization=self._queue_config.max_parallel_internalization,
+                checksum_mode=self._queue_config.checksum_mode,
+                memory_poll_period=self._queue_config.memory_poll_period,
                 ens_id=self.id_,
                 ee_uri=self._config.get_connection_info().router_uri,
                 ee_token=self._config.token,
@@ -23,7 +23,8 @@
     FMEvent,
     ForwardModelStepChecksum,
     RealizationEvent,
-    dispatch_event_from_json,
+    coalesce_memory_reports,
+    dispatch_events_from_json,
     event_from_json,
     event_to_json,
 )
@@ -46,7 +47,24 @@
 
 
 class EnsembleEvaluator:
-    def __init__(self, ensemble: Ensemble, config: EvaluatorServerConfig):
+    """Receives the events of the realizations of an ensemble, applies them
+    to the snapshot of the ensemble and publishes the changes to monitors.
+
+    Events are handled in batches. A batch is started by the first event
+    that arrives and is handled once batching_interval seconds have passed
+    or max_batch_size events have been collected, whichever comes first, so
+    batching_interval bounds the latency of a state change and
+    max_batch_size bounds the work done per snapshot update.
+    """
+
+    def __init__(
+        self,
+        ensemble: Ensemble,
+        config: EvaluatorServerConfig,
+        *,
+        batching_interval: float = 2.0,
+        max_batch_size: int = 500,
+    ):
         self._config: EvaluatorServerConfig = config
         self._ensemble: Ensemble = ensemble
 
@@ -58,14 +76,17 @@ def __init__(self, ensemble: Ensemble, config: EvaluatorServerConfig):
 
         self._ee_tasks: list[asyncio.Task[None]] = []
         self._server_done: asyncio.Event = asyncio.Event()
+        self._terminated: asyncio.Event = asyncio.Event()
+        self._message_received: asyncio.Event = asyncio.Event()
 
         # batching section
         self._batch_processing_queue: asyncio.Queue[
             list[tuple[EVENT_HANDLER, Event]]
         ] = asyncio.Queue()
-        self._max_batch_size: int = 500
-        self._batching_interval: float = 2.0
+        self._max_batch_size: int = max_batch_size
+        self._batching_interval: float = batching_interval
         self._complete_batch: asyncio.Event = asyncio.Event()
+        self._complete_batch.set()
         self._server_started: asyncio.Event = asyncio.Event()
         self._clients_connected: set[bytes] = set()
         self._clients_empty: asyncio.Event = asyncio.Event()
@@ -78,10 +99,10 @@ async def _publisher(self) -> None:
         await self._server_started.wait()
         while True:
             event = await self._events_to_send.get()
+            if self._clients_connected:
+                message = event_to_json(event).encode("utf-8")
             for identity in self._clients_connected:
-                await self._router_socket.send_multipart(
-                    [identity, b"", event_to_json(event).encode("utf-8")]
-                )
+                await self._router_socket.send_multipart([identity, b"", message])
             self._events_to_send.task_done()
 
     async def _append_message(self, snapshot_update_event: EnsembleSnapshot) -> None:
@@ -105,7 +126,8 @@ async def _process_event_buffer(self) -> None:
             processing_time = asyncio.get_running_loop().time() - batch_start_time
             if processing_time > 0.01:
                 logger.info(
-                    f"Processed {len(batch)} events in {processing_time:.3f} seconds."
+                    f"Processed {len(batch)} events in {processing_time:.3f} seconds, "
+                    f"{self._events.qsize()} events are queued."
                 )
 
             self._batch_processing_queue.task_done()
@@ -123,29 +145,37 @@ def set_event_handler(event_types: set[type[Event]], func: Any) -> None:
         set_event_handler({EnsembleCancelled}, self._cancelled_handler)
         set_event_handler({EnsembleFailed}, self._failed_handler)
 
+        loop = asyncio.get_running_loop()
         while True:
+            # Wait without a timeout for the event that starts the next batch
+            event = await self._events.get()
+            self._complete_batch.clear()
             batch: list[tuple[EVENT_HANDLER, Event]] = []
-            start_time = asyncio.get_running_loop().time()
-            while (
-                len(batch) < self._max_batch_size
-                and asyncio.get_running_loop().time() - start_time
-                < self._batching_interval
-            ):
-                self._complete_batch.clear()
+            deadline = loop.time() + self._batching_interval
+            while True:
+                batch.append((event_handler[type(event)], event))
+                self._events.task_done()
+                if len(batch) >= self._max_batch_size:
+                    break
+                if not self._events.empty():
+                    event = self._events.get_nowait()
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
                 try:
-                    event = await asyncio.wait_for(self._events.get(), timeout=0.1)
-                    function = event_handler[type(event)]
-                    batch.append((function, event))
-                    self._events.task_done()
+                    event = await asyncio.wait_for(self._events.get(), remaining)
                 except TimeoutError:
-                    continue
-            self._complete_batch.set()
+                    break
             await self._batch_processing_queue.put(batch)
+            self._complete_batch.set()
             if self._events.qsize() > 0:
                 logger.info(f"{self._events.qsize()} events left in queue")
 
     async def _fm_handler(self, events: Sequence[FMEvent | RealizationEvent]) -> None:
-        await self._append_message(self.ensemble.update_snapshot(events))
+        await self._append_message(
+            self.ensemble.update_snapshot(coalesce_memory_reports(events))
+        )
 
     async def _started_handler(self, events: Sequence[EnsembleStarted]) -> None:
         if self.ensemble.status != ENSEMBLE_STATE_FAILED:
@@ -208,6 +238,12 @@ async def handle_client(self, dealer: bytes, frame: bytes) -> None:
             await self._router_socket.send_multipart(
                 [dealer, b"", event_to_json(event).encode("utf-8")]
             )
+            if self._terminated.is_set():
+                # The client connected after EETerminated was published
+                event = EETerminated(ensemble=self._ensemble.id_)
+                await self._router_socket.send_multipart(
+                    [dealer, b"", event_to_json(event).encode("utf-8")]
+                )
         elif frame == DISCONNECT_MSG:
             self._clients_connected.discard(dealer)
             if not self._clients_connected:
@@ -230,24 +266,25 @@ async def handle_dispatch(self, dealer: bytes, frame: bytes) -> None:
             if not self._dispatchers_connected:
                 self._dispatchers_empty.set()
         else:
-            event = dispatch_event_from_json(frame.decode("utf-8"))
-            if event.ensemble != self.ensemble.id_:
-                logger.info(
-                    "Got event from evaluator "
-                    f"{event.ensemble}. "
-                    f"Ignoring since I am {self.ensemble.id_}"
-                )
-                return
-            if type(event) is ForwardModelStepChecksum:
-                await self.forward_checksum(event)
-            else:
-                await self._events.put(event)
+            for event in dispatch_events_from_json(frame.decode("utf-8")):
+                if event.ensemble != self.ensemble.id_:
+                    logger.info(
+                        "Got event from evaluator "
+                        f"{event.ensemble}. "
+                        f"Ignoring since I am {self.ensemble.id_}"
+                    )
+                    continue
+                if type(event) is ForwardModelStepChecksum:
+                    await self.forward_checksum(event)
+                else:
+                    await self._events.put(event)
 
     async def listen_for_messages(self) -> None:
         await self._server_started.wait()
         while True:
             try:
                 dealer, _, frame = await self._router_socket.recv_multipart()
+                self._message_received.set()
                 await self._router_socket.send_multipart([dealer, b"", ACK_MSG])
                 sender = dealer.decode("utf-8")
                 if sender.startswith("client"):
@@ -302,6 +339,7 @@ async def _server(self) -> None:
             await self._complete_batch.wait()
             await self._batch_processing_queue.join()
             event = EETerminated(ensemble=self._ensemble.id_)
+            self._terminated.set()
             await self._events_to_send.put(event)
             await self._events_to_send.join()
             try:
@@ -310,6 +348,17 @@ async def _server(self) -> None:
                 logger.warning(
                     "Not all clients were disconnected when closing zmq server!"
                 )
+            # Clients that connect while the server is closing down are sent
+            # EETerminated, and are served until no message has arrived for
+            # the quiet period
+            while True:
+                self._message_received.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._message_received.wait(), self.CLOSE_QUIET_PERIOD
+                    )
+                except TimeoutError:
+                    break
             logger.debug("Async server exiting.")
         finally:
             try:
@@ -364,6 +413,7 @@ async def _start_running(self) -> None:
         )
 
     CLOSE_SERVER_TIMEOUT = 60
+    CLOSE_QUIET_PERIOD = 0.1
 
     async def _monitor_and_handle_tasks(self) -> None:
         pending: Iterable[asyncio.Task[None]] = self._ee_tasks
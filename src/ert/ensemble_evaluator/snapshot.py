@@ -103,6 +103,10 @@ def __init__(self) -> None:
             tuple[RealId, FmStepId], FMStepSnapshot
         ] = defaultdict(FMStepSnapshot)  # type: ignore
 
+        # Number of realizations in each status, kept up to date on every
+        # change so that aggregating the states does not visit every realization
+        self._real_status_counts: Counter[str] = Counter()
+
         self._ensemble_state: str | None = None
         # TODO not sure about possible values at this point, as GUI hijacks this one as
         # well
@@ -129,22 +133,61 @@ def from_nested_dict(cls, source: Mapping[Any, Any]) -> EnsembleSnapshot:
     def add_realization(
         self, real_id: RealId, realization: RealizationSnapshot
     ) -> None:
+        old_status = (
+            self._realization_snapshots[real_id].get("status")
+            if real_id in self._realization_snapshots
+            else None
+        )
         self._realization_snapshots[real_id] = realization
+        self._count_real_status(old_status, realization.get("status"))
 
         for fm_step_id, fm_step_snapshot in realization.get("fm_steps", {}).items():
             fm_step_idx = (real_id, fm_step_id)
             self._fm_step_snapshots[fm_step_idx] = fm_step_snapshot
 
     def merge_snapshot(self, ensemble: EnsembleSnapshot) -> EnsembleSnapshot:
+        """Merge the changes in ensemble into this snapshot.
+
+        The realizations and forward model steps of ensemble are copied
+        field by field, so no dictionary of ensemble is shared with this
+        snapshot and ensemble can be handed to another thread afterwards
+        without being copied.
+        """
         self._metadata.update(ensemble._metadata)
         if ensemble._ensemble_state is not None:
             self._ensemble_state = ensemble._ensemble_state
         for real_id, other_real_data in ensemble._realization_snapshots.items():
-            self._realization_snapshots[real_id].update(other_real_data)
-        for fm_step_id, other_fm_data in ensemble._fm_step_snapshots.items():
-            self._fm_step_snapshots[fm_step_id].update(other_fm_data)
+            real = self._realization_snapshots[real_id]
+            for key, value in other_real_data.items():
+                if key == "status":
+                    self._count_real_status(real.get("status"), value)
+                if key == "fm_steps":
+                    real.setdefault("fm_steps", {})
+                else:
+                    real[key] = value  # type: ignore
+        for fm_idx, other_fm_data in ensemble._fm_step_snapshots.items():
+            fm_step = self._fm_step_snapshots[fm_idx]
+            fm_step.update(other_fm_data)
+            real_id, fm_step_id = fm_idx
+            if real_id in self._realization_snapshots:
+                self._realization_snapshots[real_id].setdefault("fm_steps", {})[
+                    fm_step_id
+                ] = fm_step
         return self
 
+    def copy(self) -> EnsembleSnapshot:
+        """A copy sharing no dictionaries of realizations or forward model
+        steps with this snapshot, which is cheaper than a deep copy"""
+        copied = EnsembleSnapshot().merge_snapshot(self)
+        copied._metadata = self._metadata.copy()
+        return copied
+
+    def _count_real_status(self, old: str | None, new: str | None) -> None:
+        if old is not None:
+            self._real_status_counts[old] -= 1
+        if new is not None:
+            self._real_status_counts[new] += 1
+
     def merge_metadata(self, metadata: EnsembleSnapshotMetadata) -> None:
         self._metadata.update(metadata)
 
@@ -217,12 +260,9 @@ def get_successful_realizations(self) -> list[int]:
         ]
 
     def aggregate_real_states(self) -> Counter[str]:
-        counter = Counter(
-            real["status"]
-            for real in self._realization_snapshots.values()
-            if real.get("status") is not None
-        )
-        return counter  # type: ignore
+        """The number of realizations in each status, which takes time
+        proportional to the number of distinct statuses"""
+        return +self._real_status_counts
 
     def data(self) -> Mapping[str, Any]:
         # The gui uses this
@@ -237,6 +277,9 @@ def update_realization(
         exec_hosts: str | None = None,
         message: str | None = None,
     ) -> EnsembleSnapshot:
+        self._count_real_status(
+            self._realization_snapshots[real_id].get("status"), status
+        )
         self._realization_snapshots[real_id].update(
             _filter_nones(
                 RealizationSnapshot(
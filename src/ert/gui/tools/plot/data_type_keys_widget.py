@@ -123,6 +123,19 @@ def getSelectedItem(self) -> PlotApiKeyDefinition | None:
         item = self.model.itemAt(source_index)
         return item
 
+    def getAdjacentItems(self) -> list[PlotApiKeyDefinition]:
+        """The visible items just above and below the selected item"""
+        row = self.data_type_keys_widget.currentIndex().row()
+        items = []
+        for adjacent in [row - 1, row + 1]:
+            if 0 <= adjacent < self.filter_model.rowCount():
+                source_index = self.filter_model.mapToSource(
+                    self.filter_model.index(adjacent, 0)
+                )
+                if (item := self.model.itemAt(source_index)) is not None:
+                    items.append(item)
+        return items
+
     def selectDefault(self) -> None:
         self.data_type_keys_widget.setCurrentIndex(self.filter_model.index(0, 0))
 
@@ -1,5 +1,6 @@
 import io
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
 from itertools import combinations as combi
 from json.decoder import JSONDecodeError
@@ -10,12 +11,35 @@
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
-from pandas.errors import ParserError
+import pyarrow as pa
 
 from ert.services import StorageService
 
 logger = logging.getLogger(__name__)
 
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+
+def _read_arrow_streams(
+    content: bytes,
+) -> Iterator[tuple[dict[str, str], pd.DataFrame]]:
+    """
+    Read the consecutive Arrow IPC streams sent by the records endpoints,
+    giving the metadata and the dataframe of each
+    """
+    source = pa.BufferReader(content)
+    while source.tell() < source.size():
+        table = pa.ipc.open_stream(source).read_all()
+        metadata = {
+            k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()
+        }
+        df = table.to_pandas()
+        if metadata.get("columns") == "datetime":
+            df.columns = pd.to_datetime(df.columns, format="ISO8601")
+        elif metadata.get("columns") == "int":
+            df.columns = df.columns.astype(int)
+        yield metadata, df
+
 
 @dataclass(frozen=True, eq=True)
 class EnsembleObject:
@@ -167,23 +191,45 @@ def data_for_key(self, ensemble_id: str, key: str) -> pd.DataFrame:
         with StorageService.session() as client:
             response = client.get(
                 f"/ensembles/{ensemble.id}/records/{PlotApi.escape(key)}",
-                headers={"accept": "application/x-parquet"},
+                headers={"accept": ARROW_STREAM},
                 timeout=self._timeout,
             )
             self._check_response(response)
 
-            stream = io.BytesIO(response.content)
-            df = pd.read_parquet(stream)
-
-            try:
-                df.columns = pd.to_datetime(df.columns, format="%Y-%m-%d %H:%M:%S")
-            except (ParserError, ValueError):
-                df.columns = [int(s) for s in df.columns]
+            _, df = next(_read_arrow_streams(response.content))
+            return df
+
+    def data_for_keys(
+        self, ensemble_ids: list[str], keys: list[str]
+    ) -> dict[tuple[str, str], pd.DataFrame]:
+        """Returns the data_for_key of every key for every ensemble, keyed by
+        ensemble id and key, fetched in a single request"""
+        data = {
+            (ensemble_id, key): pd.DataFrame()
+            for ensemble_id in ensemble_ids
+            for key in keys
+        }
+        ensemble_ids = [e for e in ensemble_ids if self._get_ensemble_by_id(e)]
+        if not ensemble_ids or not keys:
+            return data
+
+        stored_keys = {key: key.removeprefix("LOG10_") for key in keys}
+        with StorageService.session() as client:
+            response = client.get(
+                "/records",
+                params={
+                    "ensemble_id": ensemble_ids,
+                    "key": sorted(set(stored_keys.values())),
+                },
+                timeout=self._timeout,
+            )
+            self._check_response(response)
 
-            try:
-                return df.astype(float)
-            except ValueError:
-                return df
+            for metadata, df in _read_arrow_streams(response.content):
+                for key, stored_key in stored_keys.items():
+                    if stored_key == metadata["key"]:
+                        data[metadata["ensemble_id"], key] = df
+        return data
 
     def observations_for_key(self, ensemble_ids: list[str], key: str) -> pd.DataFrame:
         """Returns a pandas DataFrame with the datapoints for a given observation key
@@ -243,14 +289,14 @@ def history_data(self, key: str, ensemble_ids: list[str] | None) -> pd.DataFrame
         given data key, if any.  The row index is the index/date and the column
         index is the key."""
         if ensemble_ids:
+            if ":" in key:
+                head, tail = key.split(":", 2)
+                history_key = f"{head}H:{tail}"
+            else:
+                history_key = f"{key}H"
+            data = self.data_for_keys(ensemble_ids, [history_key])
             for ensemble_id in ensemble_ids:
-                if ":" in key:
-                    head, tail = key.split(":", 2)
-                    history_key = f"{head}H:{tail}"
-                else:
-                    history_key = f"{key}H"
-
-                df = self.data_for_key(ensemble_id, history_key)
+                df = data[ensemble_id, history_key]
 
                 if not df.empty:
                     df = df.T
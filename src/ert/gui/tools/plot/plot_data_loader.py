@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from httpx import RequestError
+from qtpy.QtCore import QObject, Signal, Slot
+
+from .plot_api import EnsembleObject, PlotApi, PlotApiKeyDefinition
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class PlotDataRequest:
+    # The key definition holds a dict, so requests are compared by key
+    key_def: PlotApiKeyDefinition = field(compare=False)
+    ensembles: tuple[EnsembleObject, ...]
+    layer: int | None = None
+    key: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "key", self.key_def.key)
+
+    @property
+    def is_history_key(self) -> bool:
+        return self.key.endswith("H") or "H:" in self.key
+
+
+@dataclass
+class PlotData:
+    request: PlotDataRequest
+    ensemble_to_data_map: dict[EnsembleObject, pd.DataFrame] = field(
+        default_factory=dict
+    )
+    observations: pd.DataFrame | None = None
+    std_dev_images: dict[str, npt.NDArray[np.float32]] = field(default_factory=dict)
+    history_data: pd.DataFrame | None = None
+    errors: list[str] = field(default_factory=list)
+
+
+def load_plot_data(api: PlotApi, request: PlotDataRequest) -> PlotData:
+    """Fetch everything needed to plot the key of request for its ensembles.
+    Failing requests are logged and reported in the errors of the result,
+    so that the rest of the data can still be plotted"""
+    data = PlotData(request)
+    key = request.key
+    ensemble_ids = [ensemble.id for ensemble in request.ensembles]
+
+    try:
+        data_by_id = api.data_for_keys(ensemble_ids, [key])
+        data.ensemble_to_data_map = {
+            ensemble: data_by_id[ensemble.id, key] for ensemble in request.ensembles
+        }
+    except (RequestError, TimeoutError) as e:
+        logger.exception(f"plot api request failed: {e}")
+        data.errors.append(str(e))
+
+    if request.key_def.observations and request.ensembles:
+        try:
+            data.observations = api.observations_for_key(ensemble_ids, key)
+        except (RequestError, TimeoutError) as e:
+            logger.exception(f"plot api request failed: {e}")
+            data.errors.append(str(e))
+
+    if request.layer is not None:
+        for ensemble in request.ensembles:
+            try:
+                data.std_dev_images[ensemble.name] = api.std_dev_for_parameter(
+                    key, ensemble.id, request.layer
+                )
+            except (RequestError, TimeoutError) as e:
+                logger.exception(f"plot api request failed: {e}")
+                data.errors.append(str(e))
+
+    # A history key already has the data it needs
+    if request.is_history_key:
+        data.history_data = pd.DataFrame()
+    else:
+        try:
+            data.history_data = api.history_data(key, ensemble_ids)
+        except (RequestError, TimeoutError) as e:
+            logger.exception(f"plot api request failed: {e}")
+            data.errors.append(str(e))
+    return data
+
+
+class PlotDataLoader(QObject):
+    """
+    Loads plot data on a pool of worker threads, so that the GUI stays
+    responsive while the data is fetched from storage.
+
+    Only the result of the most recent call to load is delivered by
+    dataLoaded, and when a new request is made, requests that are no
+    longer wanted are cancelled if they have not started. Keys that are
+    likely to be selected next can be prefetched, and a prefetched result
+    is used once, so that data is never older than the last selection.
+    """
+
+    dataLoaded = Signal(object)
+    # Emitted from the worker threads, and so delivered in the GUI thread
+    _loaded = Signal(object)
+
+    def __init__(self, api: PlotApi, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._api = api
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="plot_data"
+        )
+        self._current: PlotDataRequest | None = None
+        self._current_future: Future[PlotData] | None = None
+        self._futures: dict[PlotDataRequest, Future[PlotData]] = {}
+        self._loaded.connect(self._deliver)
+
+    @property
+    def loading(self) -> bool:
+        """Whether the result of the most recent request is not yet delivered"""
+        return self._current is not None
+
+    def load(
+        self,
+        request: PlotDataRequest,
+        prefetch: Sequence[PlotDataRequest] = (),
+    ) -> None:
+        wanted = {request, *prefetch}
+        # Prefetched results that are not wanted now are dropped even when
+        # finished, so that a later selection fetches fresh data
+        for other in list(self._futures):
+            if other not in wanted:
+                self._futures.pop(other).cancel()
+        if self._current_future is not None and self._current != request:
+            self._current_future.cancel()
+
+        self._current = request
+        future = self._futures.pop(request, None) or self._submit(request)
+        future.add_done_callback(partial(self._emit_loaded, request))
+        self._current_future = future
+        for other in prefetch:
+            if other != request and other not in self._futures:
+                self._futures[other] = self._submit(other)
+
+    def shutdown(self) -> None:
+        self._current = None
+        self._current_future = None
+        self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, request: PlotDataRequest) -> Future[PlotData]:
+        return self._executor.submit(load_plot_data, self._api, request)
+
+    def _emit_loaded(self, request: PlotDataRequest, future: Future[PlotData]) -> None:
+        if future.cancelled():
+            return
+        if (error := future.exception()) is not None:
+            logger.error(f"Loading plot data for {request.key} failed: {error}")
+            data = PlotData(request, errors=[str(error)])
+        else:
+            data = future.result()
+        # The loader may have been deleted while the request was running
+        with contextlib.suppress(RuntimeError):
+            self._loaded.emit(data)
+
+    @Slot(object)
+    def _deliver(self, data: PlotData) -> None:
+        if data.request != self._current:
+            return
+        self._current = None
+        self.dataLoaded.emit(data)
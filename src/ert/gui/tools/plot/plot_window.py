@@ -1,19 +1,18 @@
 import logging
 import time
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
-import numpy as np
-import pandas as pd
 from httpx import RequestError
-from pandas import DataFrame
 from qtpy.QtCore import Qt, Slot
+from qtpy.QtGui import QCloseEvent
 from qtpy.QtWidgets import QDockWidget, QMainWindow, QTabWidget, QWidget
 
 from ert.gui.ertwidgets import showWaitCursorWhileWaiting
 
 from .customize import PlotCustomizer
 from .data_type_keys_widget import DataTypeKeysWidget
-from .plot_api import EnsembleObject, PlotApi, PlotApiKeyDefinition
+from .plot_api import PlotApi, PlotApiKeyDefinition
+from .plot_data_loader import PlotData, PlotDataLoader, PlotDataRequest
 from .plot_ensemble_selection_widget import EnsembleSelectionWidget
 from .plot_widget import PlotWidget
 from .plottery import PlotConfig, PlotContext
@@ -48,9 +47,6 @@
 
 from ert.gui.ertwidgets import CopyButton
 
-if TYPE_CHECKING:
-    import numpy.typing as npt
-
 
 class _CopyButton(CopyButton):
     def __init__(self, text_edit: QTextEdit) -> None:
@@ -112,6 +108,9 @@ def __init__(self, config_file: str, parent: QWidget | None):
             self._key_definitions = []
         QApplication.restoreOverrideCursor()
 
+        self._data_loader = PlotDataLoader(self._api, self)
+        self._data_loader.dataLoaded.connect(self._plotDataLoaded)
+
         self._plot_customizer = PlotCustomizer(self, self._key_definitions)
 
         self._plot_customizer.settingsChanged.connect(self.keySelected)
@@ -176,36 +175,15 @@ def updatePlot(self, layer: int | None = None) -> None:
         key_def = self.getSelectedKey()
         if key_def is None:
             return
-        key = key_def.key
 
         plot_widget = self._central_tab.currentWidget()
         assert plot_widget is not None
 
         if plot_widget._plotter.dimensionality == key_def.dimensionality:
-            selected_ensembles = (
+            selected_ensembles = tuple(
                 self._ensemble_selection_widget.get_selected_ensembles()
             )
-            ensemble_to_data_map: dict[EnsembleObject, pd.DataFrame] = {}
-            for ensemble in selected_ensembles:
-                try:
-                    ensemble_to_data_map[ensemble] = self._api.data_for_key(
-                        ensemble.id, key
-                    )
-                except (RequestError, TimeoutError) as e:
-                    logger.exception(f"plot api request failed: {e}")
-                    open_error_dialog("Request failed", f"{e}")
-
-            observations = None
-            if key_def.observations and selected_ensembles:
-                try:
-                    observations = self._api.observations_for_key(
-                        [ensembles.id for ensembles in selected_ensembles], key
-                    )
-                except (RequestError, TimeoutError) as e:
-                    logger.exception(f"plot api request failed: {e}")
-                    open_error_dialog("Request failed", f"{e}")
 
-            std_dev_images: dict[str, npt.NDArray[np.float32]] = {}
             if "FIELD" in key_def.metadata["data_origin"]:
                 plot_widget.showLayerWidget.emit(True)
 
@@ -215,51 +193,58 @@ def updatePlot(self, layer: int | None = None) -> None:
                 if layer is None:
                     plot_widget.resetLayerWidget.emit()
                     layer = 0
-
-                for ensemble in selected_ensembles:
-                    try:
-                        std_dev_images[ensemble.name] = self._api.std_dev_for_parameter(
-                            key, ensemble.id, layer
-                        )
-                    except (RequestError, TimeoutError) as e:
-                        logger.exception(f"plot api request failed: {e}")
-                        open_error_dialog("Request failed", f"{e}")
             else:
                 plot_widget.showLayerWidget.emit(False)
-
-            plot_config = PlotConfig.createCopy(self._plot_customizer.getPlotConfig())
-            plot_context = PlotContext(plot_config, selected_ensembles, key, layer)
-
-            # Check if key is a history key.
-            # If it is it already has the data it needs
-            if str(key).endswith("H") or "H:" in str(key):
-                plot_context.history_data = DataFrame()
-            else:
-                try:
-                    plot_context.history_data = self._api.history_data(
-                        key,
-                        [e.id for e in plot_context.ensembles()],
+                layer = None
+
+            self._data_loader.load(
+                PlotDataRequest(key_def, selected_ensembles, layer),
+                prefetch=[
+                    PlotDataRequest(
+                        adjacent,
+                        selected_ensembles,
+                        0 if "FIELD" in adjacent.metadata["data_origin"] else None,
                     )
+                    for adjacent in self._data_type_keys_widget.getAdjacentItems()
+                ],
+            )
 
-                except (RequestError, TimeoutError) as e:
-                    logger.exception(f"plot api request failed: {e}")
-                    open_error_dialog("Request failed", f"{e}")
-                    plot_context.history_data = None
-
-            plot_context.log_scale = key_def.log_scale
-
-            for data in ensemble_to_data_map.values():
-                data = data.T
-
-                if not data.empty and data.index.inferred_type == "datetime64":
-                    self._preferred_ensemble_x_axis_format = PlotContext.DATE_AXIS
-                    break
+    @Slot(object)
+    def _plotDataLoaded(self, data: PlotData) -> None:
+        key_def = data.request.key_def
+        plot_widget = self._central_tab.currentWidget()
+        assert plot_widget is not None
+        if plot_widget._plotter.dimensionality != key_def.dimensionality:
+            return
 
-            self._updateCustomizer(plot_widget, self._preferred_ensemble_x_axis_format)
+        for error in data.errors:
+            open_error_dialog("Request failed", error)
 
-            plot_widget.updatePlot(
-                plot_context, ensemble_to_data_map, observations, std_dev_images
-            )
+        plot_config = PlotConfig.createCopy(self._plot_customizer.getPlotConfig())
+        plot_context = PlotContext(
+            plot_config, list(data.request.ensembles), key_def.key, data.request.layer
+        )
+        plot_context.history_data = data.history_data
+        plot_context.log_scale = key_def.log_scale
+
+        for ensemble_data in data.ensemble_to_data_map.values():
+            ensemble_data = ensemble_data.T
+
+            if (
+                not ensemble_data.empty
+                and ensemble_data.index.inferred_type == "datetime64"
+            ):
+                self._preferred_ensemble_x_axis_format = PlotContext.DATE_AXIS
+                break
+
+        self._updateCustomizer(plot_widget, self._preferred_ensemble_x_axis_format)
+
+        plot_widget.updatePlot(
+            plot_context,
+            data.ensemble_to_data_map,
+            data.observations,
+            data.std_dev_images,
+        )
 
     def _updateCustomizer(
         self, plot_widget: PlotWidget, preferred_x_axis_format: str
@@ -363,5 +348,9 @@ def keySelected(self) -> None:
 
         self.updatePlot()
 
+    def closeEvent(self, event: QCloseEvent | None) -> None:
+        self._data_loader.shutdown()
+        super().closeEvent(event)
+
     def toggleCustomizeDialog(self) -> None:
         self._plot_customizer.toggleCustomizationDialog()
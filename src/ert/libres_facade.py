@@ -21,8 +21,6 @@
     ErtConfig,
     Field,
 )
-from ert.data import MeasuredData
-from ert.data._measured_data import ObservationError, ResponseError
 from ert.load_status import LoadResult, LoadStatus
 
 from .plugins import ErtPluginContext
@@ -184,25 +182,7 @@ def load_all_misfit_data(ensemble: Ensemble) -> DataFrame:
                 to a realization. The "MISFIT:TOTAL" column contains the total
                 misfit for each realization.
         """
-        try:
-            measured_data = MeasuredData(ensemble)
-        except (ResponseError, ObservationError):
-            return DataFrame()
-        misfit = DataFrame()
-        for name in measured_data.data.columns.unique(0):
-            df = (
-                (
-                    measured_data.data[name].loc["OBS"]
-                    - measured_data.get_simulated_data()[name]
-                )
-                / measured_data.data[name].loc["STD"]
-            ) ** 2
-            misfit[f"MISFIT:{name}"] = df.sum(axis=1)
-        misfit["MISFIT:TOTAL"] = misfit.sum(axis=1)
-        misfit.index.name = "Realization"
-        misfit.index = misfit.index.astype(int)
-
-        return misfit
+        return ensemble.get_misfits_by_observation_group()
 
     def run_ertscript(  # type: ignore
         self,
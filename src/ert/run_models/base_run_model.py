@@ -176,6 +176,7 @@ def __init__(
         self.active_realizations = copy.copy(active_realizations)
         self.start_iteration = start_iteration
         self.restart = False
+        self._consolidate_responses = config.queue_config.consolidate_responses
 
     def log_at_startup(self) -> None:
         keys_to_drop = [
@@ -388,11 +389,9 @@ def get_current_status(self) -> dict[str, int]:
         status: dict[str, int] = defaultdict(int)
         if self._iter_snapshot.keys():
             current_iter = max(list(self._iter_snapshot.keys()))
-            all_realizations = self._iter_snapshot[current_iter].reals
-
-            if all_realizations:
-                for real in all_realizations.values():
-                    status[str(real["status"])] += 1
+            real_states = self._iter_snapshot[current_iter].aggregate_real_states()
+            for real_status, count in real_states.items():
+                status[real_status] += count
 
         if self.restart:
             status["Finished"] += (
@@ -425,17 +424,16 @@ def get_memory_consumption(self) -> int:
     def _current_progress(self) -> tuple[float, int]:
         current_iter = max(list(self._iter_snapshot.keys()))
         done_realizations = self.active_realizations.count(False)
-        all_realizations = self._iter_snapshot[current_iter].reals
+        snapshot = self._iter_snapshot[current_iter]
         current_progress = 0.0
         realization_count = self.get_number_of_active_realizations()
 
-        if all_realizations:
-            for real in all_realizations.values():
-                if real["status"] in {
-                    REALIZATION_STATE_FINISHED,
-                    REALIZATION_STATE_FAILED,
-                }:
-                    done_realizations += 1
+        if snapshot.reals:
+            real_states = snapshot.aggregate_real_states()
+            done_realizations += (
+                real_states[REALIZATION_STATE_FINISHED]
+                + real_states[REALIZATION_STATE_FAILED]
+            )
 
             realization_progress = float(done_realizations) / len(
                 self.active_realizations
@@ -462,7 +460,7 @@ def send_snapshot_event(self, event: Event, iteration: int) -> None:
                     realization_count=realization_count,
                     status_count=status,
                     iteration=iteration,
-                    snapshot=copy.deepcopy(snapshot),
+                    snapshot=snapshot.copy(),
                 )
             )
         elif type(event) is EESnapshotUpdate:
@@ -471,10 +469,9 @@ def send_snapshot_event(self, event: Event, iteration: int) -> None:
                     f"got snapshot update message without having stored "
                     f"snapshot for iter {iteration}"
                 )
-            snapshot = EnsembleSnapshot()
-            snapshot.update_from_event(
-                event, source_snapshot=self._iter_snapshot[iteration]
-            )
+            snapshot = EnsembleSnapshot.from_nested_dict(event.snapshot)
+            # Merging copies the update into the iteration snapshot, so the
+            # update itself can be handed over without being copied
             self._iter_snapshot[iteration].merge_snapshot(snapshot)
             current_progress, realization_count = self._current_progress()
             status = self.get_current_status()
@@ -486,7 +483,7 @@ def send_snapshot_event(self, event: Event, iteration: int) -> None:
                     realization_count=realization_count,
                     status_count=status,
                     iteration=iteration,
-                    snapshot=copy.deepcopy(snapshot),
+                    snapshot=snapshot,
                 )
             )
 
@@ -575,6 +572,8 @@ async def run_ensemble_evaluator_async(
             return []
         await evaluator_task
         ensemble.refresh_ensemble_state()
+        if self._consolidate_responses:
+            await asyncio.to_thread(ensemble.consolidate_responses)
 
         return evaluator_task.result()
 
@@ -112,6 +112,8 @@ def run_experiment(
         sample_prior(
             self.ensemble,
             np.where(self.active_realizations)[0],
+            # The design matrix group is saved from the design matrix below
+            parameters=[param.name for param in parameters_config],
             random_seed=self.random_seed,
         )
 
@@ -3,15 +3,22 @@
 import asyncio
 import logging
 import shlex
+import stat
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 
 from .event import Event
 
 SIGNAL_OFFSET = 128
 """Bash and other shells add an offset of 128 to the signal value when a process exited due to a signal"""
 
+MAX_JOB_IDS_LENGTH = 64 * 1024
+"""Upper limit on the total length of the job ids passed to one queue command"""
+
 
 def create_submit_script(
     runpath: Path, executable: str, args: tuple[str, ...], activate_script: str
@@ -24,10 +31,167 @@ def create_submit_script(
     )
 
 
+def create_array_submit_script(
+    index_variable: str, first_index: int, jobs: Sequence[tuple[Path, Path, Path]]
+) -> str:
+    """Script for a job array running the submit script of each array element.
+
+    Args:
+      index_variable: The environment variable holding the array index.
+      first_index: The array index of the first job.
+      jobs: Submit script, stdout file and stderr file of each job.
+    """
+    cases = "".join(
+        f"  {index}) exec {shlex.quote(str(script))}"
+        f" > {shlex.quote(str(stdout))} 2> {shlex.quote(str(stderr))} ;;\n"
+        for index, (script, stdout, stderr) in enumerate(jobs, start=first_index)
+    )
+    return (
+        "#!/usr/bin/env bash\n"
+        f'case "${{{index_variable}}}" in\n'
+        f"{cases}"
+        "esac\n"
+        f'echo "No job for array index ${{{index_variable}}}" >&2\n'
+        "exit 1\n"
+    )
+
+
+def write_submit_script(directory: Path, prefix: str, script: str) -> Path:
+    """Write script to a new executable file in directory"""
+    with NamedTemporaryFile(
+        dir=directory,
+        prefix=prefix,
+        suffix=".sh",
+        mode="w",
+        encoding="utf-8",
+        delete=False,
+    ) as script_handle:
+        script_handle.write(script)
+        script_path = Path(script_handle.name)
+    script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
+    return script_path
+
+
+def chunk_job_ids(
+    job_ids: Iterable[str], max_length: int = MAX_JOB_IDS_LENGTH
+) -> Iterator[list[str]]:
+    """Split job_ids into chunks short enough to be passed as arguments to one
+    queue command, as the length of a command line is limited."""
+    chunk: list[str] = []
+    length = 0
+    for job_id in job_ids:
+        if chunk and length + len(job_id) + 1 > max_length:
+            yield chunk
+            chunk, length = [], 0
+        chunk.append(job_id)
+        length += len(job_id) + 1
+    if chunk:
+        yield chunk
+
+
+@dataclass
+class PollMetrics:
+    """Statistics of the polls of the queue system by a driver"""
+
+    polls: int = 0
+    jobs_polled: int = 0
+    transitions: int = 0
+    total_latency: float = 0.0
+    last_latency: float = 0.0
+    last_period: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.polls if self.polls else 0.0
+
+    @property
+    def jobs_per_poll(self) -> float:
+        return self.jobs_polled / self.polls if self.polls else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.polls} polls of {self.jobs_per_poll:.1f} jobs on average "
+            f"detected {self.transitions} transitions, "
+            f"mean poll latency {self.mean_latency:.2f} s, "
+            f"last poll latency {self.last_latency:.2f} s"
+        )
+
+
+class AdaptivePoller:
+    """Paces the polls of a driver around its nominal poll period.
+
+    After a job has been submitted or killed, or a poll detected that a job
+    changed state, more transitions are likely to follow, so the next poll
+    happens after the nominal period divided by SPEEDUP, but never sooner than
+    MIN_PERIOD seconds. Every poll that detects no transition multiplies the
+    wait by BACKOFF, up to the nominal period, so a quiet queue is polled
+    exactly as often as configured.
+    """
+
+    SPEEDUP = 4.0
+    BACKOFF = 1.5
+    MIN_PERIOD = 1.0
+
+    def __init__(self, logger: logging.Logger | None = None) -> None:
+        self.metrics = PollMetrics()
+        self._logger = logger or logging.getLogger(__name__)
+        self._factor = 1.0 / self.SPEEDUP
+        self._poll_start = time.perf_counter()
+        self._transitions = 0
+
+    def expect_transitions(self) -> None:
+        self._factor = 1.0 / self.SPEEDUP
+
+    def start_poll(self) -> None:
+        self._poll_start = time.perf_counter()
+        self._transitions = 0
+
+    def transition(self) -> None:
+        """Record that the current poll detected that a job changed state"""
+        self._transitions += 1
+
+    def finish_poll(self, jobs_polled: int) -> None:
+        latency = time.perf_counter() - self._poll_start
+        self.metrics.polls += 1
+        self.metrics.jobs_polled += jobs_polled
+        self.metrics.transitions += self._transitions
+        self.metrics.total_latency += latency
+        self.metrics.last_latency = latency
+        if self._transitions:
+            self._factor = 1.0 / self.SPEEDUP
+        else:
+            self._factor = min(self._factor * self.BACKOFF, 1.0)
+        self._logger.debug(
+            f"Polled {jobs_polled} jobs in {latency:.2f} s, "
+            f"detected {self._transitions} transitions"
+        )
+
+    def next_period(self, poll_period: float) -> float:
+        """The time to wait until the next poll, given the nominal poll period"""
+        return max(poll_period * self._factor, min(poll_period, self.MIN_PERIOD))
+
+    async def sleep(self, poll_period: float) -> None:
+        self.metrics.last_period = self.next_period(poll_period)
+        await asyncio.sleep(self.metrics.last_period)
+
+
 class FailedSubmit(RuntimeError):
     pass
 
 
+@dataclass
+class JobSubmission:
+    """The arguments of one call to Driver.submit"""
+
+    iens: int
+    executable: str
+    args: tuple[str, ...] = ()
+    name: str | None = None
+    runpath: Path | None = None
+    num_cpu: int | None = 1
+    realization_memory: int | None = 0
+
+
 class Driver(ABC):
     """Adapter for the HPC cluster."""
 
@@ -67,6 +231,28 @@ async def submit(
             be regareded as a hint to the queue system, not absolute limits.
         """
 
+    @property
+    def poll_metrics(self) -> PollMetrics | None:
+        """Statistics of the polls of the queue system, if the driver polls"""
+        return None
+
+    @property
+    def supports_job_arrays(self) -> bool:
+        """Whether the driver implements submit_array"""
+        return False
+
+    async def submit_array(self, jobs: Sequence[JobSubmission]) -> None:
+        """Submit several programs as one job array on the cluster.
+
+        Each job is tracked by its realization number afterwards, exactly as if
+        it had been submitted by submit. All jobs must request the same number
+        of CPU-cores and memory.
+
+        Args:
+          jobs: The jobs to submit, at most one per realization.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support job arrays")
+
     @abstractmethod
     async def kill(self, iens: int) -> None:
         """Terminate execution of a job associated with a realization.
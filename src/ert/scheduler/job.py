@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import logging
 import time
 from contextlib import suppress
@@ -12,6 +11,7 @@
 from lxml import etree
 from pydantic_core._pydantic_core import ValidationError
 
+from _ert.checksum import expected_checksum, file_checksum
 from _ert.events import Id, RealizationTimeout, event_from_dict
 from ert.callbacks import forward_model_ok
 from ert.constant_filenames import ERROR_file
@@ -19,7 +19,7 @@
 from ert.storage.realization_storage_state import RealizationStorageState
 from ert.trace import tracer
 
-from .driver import Driver, FailedSubmit
+from .driver import Driver, FailedSubmit, JobSubmission
 
 if TYPE_CHECKING:
     from ert.ensemble_evaluator import Realization
@@ -107,15 +107,28 @@ async def _submit_and_run_once(self, sem: asyncio.BoundedSemaphore) -> None:
                 await self._scheduler.submit_sleep_state.sleep_until_we_can_submit()
             await self._send(JobState.SUBMITTING)
             try:
-                await self.driver.submit(
-                    self.real.iens,
-                    self.real.job_script,
-                    self.real.run_arg.runpath,
-                    num_cpu=self.real.num_cpu,
-                    realization_memory=self.real.realization_memory,
-                    name=self.real.run_arg.job_name,
-                    runpath=Path(self.real.run_arg.runpath),
-                )
+                if self._scheduler.job_array_submitter is not None:
+                    await self._scheduler.job_array_submitter.submit(
+                        JobSubmission(
+                            self.real.iens,
+                            self.real.job_script,
+                            (self.real.run_arg.runpath,),
+                            num_cpu=self.real.num_cpu,
+                            realization_memory=self.real.realization_memory,
+                            name=self.real.run_arg.job_name,
+                            runpath=Path(self.real.run_arg.runpath),
+                        )
+                    )
+                else:
+                    await self.driver.submit(
+                        self.real.iens,
+                        self.real.job_script,
+                        self.real.run_arg.runpath,
+                        num_cpu=self.real.num_cpu,
+                        realization_memory=self.real.realization_memory,
+                        name=self.real.run_arg.job_name,
+                        runpath=Path(self.real.run_arg.runpath),
+                    )
             except FailedSubmit as err:
                 await self._send(JobState.FAILED)
                 logger.error(f"Failed to submit: {err}")
@@ -146,8 +159,8 @@ async def _submit_and_run_once(self, sem: asyncio.BoundedSemaphore) -> None:
     async def run(
         self,
         sem: asyncio.BoundedSemaphore,
-        forward_model_ok_lock: asyncio.Lock,
-        checksum_lock: asyncio.Lock,
+        forward_model_ok_sem: asyncio.BoundedSemaphore,
+        checksum_sem: asyncio.BoundedSemaphore,
         max_submit: int = 1,
     ) -> None:
         with tracer.start_as_current_span(f"{__name__}.run.realization_{self.iens}"):
@@ -160,8 +173,8 @@ async def run(
 
                 if self.returncode.result() == 0:
                     if self._scheduler._manifest_queue is not None:
-                        await self._verify_checksum(checksum_lock)
-                    async with forward_model_ok_lock:
+                        await self._verify_checksum(checksum_sem)
+                    async with forward_model_ok_sem:
                         await self._handle_finished_forward_model()
                     break
 
@@ -191,7 +204,7 @@ async def _max_runtime_task(self) -> None:
 
     async def _verify_checksum(
         self,
-        checksum_lock: asyncio.Lock,
+        checksum_sem: asyncio.BoundedSemaphore,
         timeout: int | None = None,  # noqa: ASYNC109
     ) -> None:
         if timeout is None:
@@ -224,22 +237,33 @@ async def _verify_checksum(
             timeout -= 1
             logger.debug("Waiting for disk synchronization")
             await asyncio.sleep(1)
-        async with checksum_lock:
-            for info in valid_checksums:
-                file_path = Path(info["path"])
-                expected_md5sum = info.get("md5sum")
-                if file_path.exists() and expected_md5sum:
-                    actual_md5sum = hashlib.md5(file_path.read_bytes()).hexdigest()
-                    if expected_md5sum == actual_md5sum:
-                        logger.debug(f"File {file_path} checksum successful.")
-                    else:
-                        logger.warning(
-                            f"File {file_path} checksum verification failed."
-                        )
-                elif file_path.exists() and expected_md5sum is None:
-                    logger.warning(f"Checksum not received for file {file_path}")
-                else:
-                    logger.error(f"Disk synchronization failed for {file_path}")
+        await asyncio.gather(
+            *(
+                self._verify_file_checksum(info, checksum_sem)
+                for info in valid_checksums
+            )
+        )
+
+    @staticmethod
+    async def _verify_file_checksum(
+        info: dict[str, Any], checksum_sem: asyncio.BoundedSemaphore
+    ) -> None:
+        file_path = Path(info["path"])
+        expected = expected_checksum(info)
+        if file_path.exists() and expected:
+            checksum, mode = expected
+            # Hashing reads the whole file, so it is done in a worker thread
+            # and the semaphore bounds how many files are read at the same time
+            async with checksum_sem:
+                actual = await asyncio.to_thread(file_checksum, file_path, mode)
+            if checksum == actual:
+                logger.debug(f"File {file_path} checksum successful.")
+            else:
+                logger.warning(f"File {file_path} checksum verification failed.")
+        elif file_path.exists() and expected is None:
+            logger.warning(f"Checksum not received for file {file_path}")
+        else:
+            logger.error(f"Disk synchronization failed for {file_path}")
 
     async def _handle_finished_forward_model(self) -> None:
         callback_status, status_msg = await forward_model_ok(
@@ -4,22 +4,33 @@
 import itertools
 import json
 import logging
+import os
 import re
 import shlex
 import shutil
-import stat
 import time
 from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from contextlib import AsyncExitStack
 from dataclasses import dataclass
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import (
     Literal,
     cast,
     get_args,
 )
 
-from .driver import SIGNAL_OFFSET, Driver, FailedSubmit, create_submit_script
+from .driver import (
+    SIGNAL_OFFSET,
+    AdaptivePoller,
+    Driver,
+    FailedSubmit,
+    JobSubmission,
+    PollMetrics,
+    chunk_job_ids,
+    create_array_submit_script,
+    create_submit_script,
+    write_submit_script,
+)
 from .event import Event, FinishedEvent, StartedEvent
 
 _POLL_PERIOD = 2.0  # seconds
@@ -111,10 +122,19 @@ class JobData:
     exec_hosts: str = "-"
 
 
+def _array_element_job_id(job_id: str, job_index: str) -> str:
+    """The job id of an element of a job array, as accepted by LSF commands"""
+    if job_index in {"", "-", "0"}:
+        return job_id
+    return f"{job_id}[{job_index}]"
+
+
 def parse_bjobs(bjobs_output: str) -> dict[str, JobState]:
     data: dict[str, JobState] = {}
     for line in bjobs_output.splitlines():
         tokens = line.split(sep="^")
+        if len(tokens) == 4:
+            tokens[0] = _array_element_job_id(tokens[0], tokens.pop())
         if len(tokens) == 3:
             job_id, job_state, _ = tokens
             if job_state not in get_args(JobState):
@@ -131,6 +151,8 @@ def parse_bjobs_exec_hosts(bjobs_output: str) -> dict[str, str]:
     data: dict[str, str] = {}
     for line in bjobs_output.splitlines():
         tokens = line.split(sep="^")
+        if len(tokens) == 4:
+            tokens[0] = _array_element_job_id(tokens[0], tokens.pop())
         if len(tokens) == 3:
             job_id, _, exec_hosts = tokens
             data[job_id] = exec_hosts
@@ -278,6 +300,7 @@ def __init__(
         self._max_bsub_attempts = 10
 
         self._poll_period = _POLL_PERIOD
+        self._poller = AdaptivePoller(logger)
 
         self._bhist_cmd = Path(bhist_cmd or shutil.which("bhist") or "bhist")
         self._bhist_cache: dict[str, dict[str, int]] | None = None
@@ -305,26 +328,13 @@ async def submit(
         arg_queue_name = ["-q", self._queue_name] if self._queue_name else []
         arg_project_code = ["-P", self._project_code] if self._project_code else []
         script = create_submit_script(runpath, executable, args, self.activate_script)
-        script_path: Path | None = None
         try:
-            with NamedTemporaryFile(
-                dir=runpath,
-                prefix=".lsf_submit_",
-                suffix=".sh",
-                mode="w",
-                encoding="utf-8",
-                delete=False,
-            ) as script_handle:
-                script_handle.write(script)
-                script_path = Path(script_handle.name)
+            script_path = write_submit_script(runpath, ".lsf_submit_", script)
         except OSError as err:
             error_message = f"Could not create submit script: {err}"
             self._job_error_message_by_iens[iens] = error_message
             raise FailedSubmit(error_message) from err
 
-        assert script_path is not None
-        script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
-
         bsub_with_args: list[str] = [
             str(self._bsub_cmd),
             *arg_queue_name,
@@ -380,6 +390,113 @@ async def submit(
                 submitted_timestamp=time.time(),
             )
             self._iens2jobid[iens] = job_id
+            self._poller.expect_transitions()
+
+    @property
+    def poll_metrics(self) -> PollMetrics:
+        return self._poller.metrics
+
+    @property
+    def supports_job_arrays(self) -> bool:
+        return True
+
+    async def submit_array(self, jobs: Sequence[JobSubmission]) -> None:
+        runpaths = [job.runpath or Path.cwd() for job in jobs]
+        names = [job.name or Path(job.executable).name for job in jobs]
+        try:
+            scripts = [
+                (
+                    write_submit_script(
+                        runpath,
+                        ".lsf_submit_",
+                        create_submit_script(
+                            runpath, job.executable, job.args, self.activate_script
+                        ),
+                    ),
+                    runpath / f"{name}.LSF-stdout",
+                    runpath / f"{name}.LSF-stderr",
+                )
+                for job, runpath, name in zip(jobs, runpaths, names, strict=True)
+            ]
+            array_script_path = write_submit_script(
+                runpaths[0],
+                ".lsf_array_submit_",
+                create_array_submit_script("LSB_JOBINDEX", 1, scripts),
+            )
+        except OSError as err:
+            error_message = f"Could not create submit script: {err}"
+            for job in jobs:
+                self._job_error_message_by_iens[job.iens] = error_message
+            raise FailedSubmit(error_message) from err
+
+        arg_queue_name = ["-q", self._queue_name] if self._queue_name else []
+        arg_project_code = ["-P", self._project_code] if self._project_code else []
+        array_name = os.path.commonprefix(names).rstrip("-_") or names[0]
+        bsub_with_args: list[str] = [
+            str(self._bsub_cmd),
+            *arg_queue_name,
+            *arg_project_code,
+            # Each array element redirects its output in the array script
+            "-o",
+            "/dev/null",
+            "-e",
+            "/dev/null",
+            "-n",
+            str(jobs[0].num_cpu),
+            *self._build_resource_requirement_arg(
+                realization_memory=jobs[0].realization_memory or 0
+            ),
+            "-J",
+            f"{array_name}[1-{len(jobs)}]",
+            str(array_script_path),
+        ]
+
+        async with AsyncExitStack() as stack:
+            for job in jobs:
+                await stack.enter_async_context(
+                    self._submit_locks.setdefault(job.iens, asyncio.Lock())
+                )
+            logger.debug(f"Submitting to LSF with command {shlex.join(bsub_with_args)}")
+            process_success, process_message = await self._execute_with_retry(
+                bsub_with_args,
+                retry_on_empty_stdout=True,
+                retry_codes=(FLAKY_SSH_RETURNCODE,),
+                total_attempts=self._max_bsub_attempts,
+                retry_interval=self._sleep_time_between_cmd_retries,
+                error_on_msgs=BSUB_FAILURE_MESSAGES,
+            )
+            if not process_success:
+                for job in jobs:
+                    self._job_error_message_by_iens[job.iens] = process_message
+                raise FailedSubmit(process_message)
+
+            match = re.search(
+                r"Job <([0-9]+)> is submitted to .*queue", process_message
+            )
+            if match is None:
+                raise FailedSubmit(
+                    f"Could not understand '{process_message}' from bsub"
+                )
+            array_job_id = match[1]
+            logger.info(
+                f"Realizations {[job.iens for job in jobs]} accepted by LSF "
+                f"as job array {array_job_id}"
+            )
+
+            for index, (job, runpath) in enumerate(
+                zip(jobs, runpaths, strict=True), start=1
+            ):
+                job_id = _array_element_job_id(array_job_id, str(index))
+                (runpath / LSF_INFO_JSON_FILENAME).write_text(
+                    json.dumps({"job_id": job_id}), encoding="utf-8"
+                )
+                self._jobs[job_id] = JobData(
+                    iens=job.iens,
+                    job_state=QueuedJob(job_state="PEND"),
+                    submitted_timestamp=time.time(),
+                )
+                self._iens2jobid[job.iens] = job_id
+            self._poller.expect_transitions()
 
     async def kill(self, iens: int) -> None:
         if iens not in self._submit_locks:
@@ -396,6 +513,7 @@ async def kill(self, iens: int) -> None:
                 return
 
             job_id = self._iens2jobid[iens]
+            self._poller.expect_transitions()
 
             logger.debug(f"Killing realization {iens} with LSF-id {job_id}")
             bkill_with_args: list[str] = [
@@ -413,14 +531,15 @@ async def kill(self, iens: int) -> None:
                 return_on_msgs=(JOB_ALREADY_FINISHED_BKILL_MSG),
             )
             await asyncio.create_subprocess_shell(
-                f"sleep {self._sleep_time_between_bkills}; {self._bkill_cmd} -s SIGKILL {job_id}",
+                f"sleep {self._sleep_time_between_bkills}; {self._bkill_cmd} -s SIGKILL {shlex.quote(job_id)}",
                 start_new_session=True,
                 stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.DEVNULL,
             )
 
             if not re.search(
-                f"Job <{job_id}> is being (terminated|signaled)", process_message
+                f"Job <{re.escape(job_id)}> is being (terminated|signaled)",
+                process_message,
             ):
                 if JOB_ALREADY_FINISHED_BKILL_MSG in process_message:
                     logger.debug(f"LSF kill failed with: {process_message}")
@@ -433,32 +552,34 @@ async def poll(self) -> None:
                 await asyncio.sleep(self._poll_period)
                 continue
             current_jobids = list(self._jobs.keys())
+            self._poller.start_poll()
+
+            bjobs_output = ""
+            for job_ids in chunk_job_ids(current_jobids):
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        str(self._bjobs_cmd),
+                        "-noheader",
+                        "-o",
+                        "jobid stat exec_host jobindex delimiter='^'",
+                        *job_ids,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
+                except FileNotFoundError as e:
+                    logger.error(str(e))
+                    return
 
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    str(self._bjobs_cmd),
-                    "-noheader",
-                    "-o",
-                    "jobid stat exec_host delimiter='^'",
-                    *current_jobids,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-            except FileNotFoundError as e:
-                logger.error(str(e))
-                return
-
-            stdout, stderr = await process.communicate()
-            if process.returncode:
-                # bjobs may give nonzero return code even when it is providing
-                # at least some correct information
-                logger.warning(
-                    f"bjobs gave returncode {process.returncode} and error {stderr.decode()}"
-                )
-            bjobs_states = _parse_jobs_dict(parse_bjobs(stdout.decode(errors="ignore")))
-            self.update_and_log_exec_hosts(
-                parse_bjobs_exec_hosts(stdout.decode(errors="ignore"))
-            )
+                stdout, stderr = await process.communicate()
+                if process.returncode:
+                    # bjobs may give nonzero return code even when it is providing
+                    # at least some correct information
+                    logger.warning(
+                        f"bjobs gave returncode {process.returncode} and error {stderr.decode()}"
+                    )
+                bjobs_output += stdout.decode(errors="ignore")
+            bjobs_states = _parse_jobs_dict(parse_bjobs(bjobs_output))
+            self.update_and_log_exec_hosts(parse_bjobs_exec_hosts(bjobs_output))
 
             job_ids_found_in_bjobs_output = set(bjobs_states.keys())
             if (
@@ -485,7 +606,8 @@ async def poll(self) -> None:
                 logger.debug(
                     f"bhist did not give status for job_ids {missing_in_bhist_and_bjobs}, giving up for now."
                 )
-            await asyncio.sleep(self._poll_period)
+            self._poller.finish_poll(len(current_jobids))
+            await self._poller.sleep(self._poll_period)
 
     async def _process_job_update(self, job_id: str, new_state: AnyJob) -> None:
         if job_id not in self._jobs:
@@ -527,6 +649,7 @@ async def _process_job_update(self, job_id: str, new_state: AnyJob) -> None:
                 del self._jobs[job_id]
                 del self._iens2jobid[iens]
                 await self._log_bhist_job_summary(job_id)
+            self._poller.transition()
             await self.event_queue.put(event)
 
     async def _get_exit_code(self, job_id: str) -> int:
@@ -5,12 +5,19 @@
 import logging
 import shlex
 import shutil
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Iterable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal, cast, get_type_hints
 
-from .driver import Driver, FailedSubmit, create_submit_script
+from .driver import (
+    AdaptivePoller,
+    Driver,
+    FailedSubmit,
+    PollMetrics,
+    chunk_job_ids,
+    create_submit_script,
+)
 from .event import Event, FinishedEvent, StartedEvent
 
 logger = logging.getLogger(__name__)
@@ -141,6 +148,7 @@ def __init__(
         self._max_pbs_cmd_attempts = 10
         self._sleep_time_between_cmd_retries = 2
         self._poll_period = _POLL_PERIOD
+        self._poller = AdaptivePoller(logger)
 
         self._qsub_cmd = Path(qsub_cmd or shutil.which("qsub") or "qsub")
         self._qstat_cmd = Path(qstat_cmd or shutil.which("qstat") or "qstat")
@@ -231,6 +239,7 @@ async def submit(
         self._jobs[job_id_] = (iens, QueuedJob())
         self._iens2jobid[iens] = job_id_
         self._non_finished_job_ids.add(job_id_)
+        self._poller.expect_transitions()
 
     async def kill(self, iens: int) -> None:
         if iens in self._finished_iens:
@@ -241,6 +250,7 @@ async def kill(self, iens: int) -> None:
             return
 
         job_id = self._iens2jobid[iens]
+        self._poller.expect_transitions()
 
         logger.debug(f"Killing realization {iens} with PBS-id {job_id}")
 
@@ -255,38 +265,37 @@ async def kill(self, iens: int) -> None:
         if not process_success:
             raise RuntimeError(process_message)
 
+    @property
+    def poll_metrics(self) -> PollMetrics:
+        return self._poller.metrics
+
     async def poll(self) -> None:
         while True:
             if not self._jobs:
                 await asyncio.sleep(self._poll_period)
                 continue
+            self._poller.start_poll()
+            num_jobs = len(self._jobs)
 
             if self._non_finished_job_ids:
                 try:
-                    process = await asyncio.create_subprocess_exec(
-                        str(self._qstat_cmd),
-                        "-Ex",
-                        "-w",  # wide format
-                        *self._non_finished_job_ids,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
+                    outputs = await self._qstat(
+                        ["-Ex", "-w"],  # wide format
+                        self._non_finished_job_ids,
                     )
                 except FileNotFoundError as e:
                     logger.error(str(e))
                     return
-                stdout, stderr = await process.communicate()
-                if process.returncode not in {0, QSTAT_UNKNOWN_JOB_ID}:
-                    # Any unknown job ids will yield QSTAT_UNKNOWN_JOB_ID, but
-                    # results for other job ids on stdout can be assumed valid.
-                    await asyncio.sleep(self._poll_period)
+                if outputs is None:
+                    self._poller.finish_poll(num_jobs)
+                    await self._poller.sleep(self._poll_period)
                     continue
-                if process.returncode == QSTAT_UNKNOWN_JOB_ID:
-                    logger.debug(
-                        f"qstat gave returncode {QSTAT_UNKNOWN_JOB_ID} "
-                        f"with message {stderr.decode(errors='ignore')}"
-                    )
                 parsed_jobs = _parse_jobs_dict(
-                    parse_qstat(stdout.decode(errors="ignore"))
+                    {
+                        job_id: job
+                        for output in outputs
+                        for job_id, job in parse_qstat(output).items()
+                    }
                 )
                 for job_id, job in parsed_jobs.items():
                     if isinstance(job, FinishedJob):
@@ -296,33 +305,48 @@ async def poll(self) -> None:
                         await self._process_job_update(job_id, job)
 
             if self._finished_job_ids:
-                process = await asyncio.create_subprocess_exec(
-                    str(self._qstat_cmd),
-                    "-Efx",
-                    "-Fjson",
-                    *self._finished_job_ids,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, stderr = await process.communicate()
-                if process.returncode not in {0, QSTAT_UNKNOWN_JOB_ID}:
-                    # Any unknown job ids will yield QSTAT_UNKNOWN_JOB_ID, but
-                    # results for other job ids on stdout can be assumed valid.
-                    await asyncio.sleep(self._poll_period)
+                outputs = await self._qstat(["-Efx", "-Fjson"], self._finished_job_ids)
+                if outputs is None:
+                    self._poller.finish_poll(num_jobs)
+                    await self._poller.sleep(self._poll_period)
                     continue
-                if process.returncode == QSTAT_UNKNOWN_JOB_ID:
-                    logger.debug(
-                        f"qstat gave returncode {QSTAT_UNKNOWN_JOB_ID} "
-                        f"with message {stderr.decode(errors='ignore')}"
-                    )
-                stdout_content: dict[str, Any] = json.loads(
-                    stdout.decode(errors="ignore")
-                )
-                parsed_jobs_dict = _parse_jobs_dict(stdout_content.get("Jobs", {}))
+                jobs: dict[str, Any] = {}
+                for output in outputs:
+                    jobs.update(json.loads(output).get("Jobs", {}))
+                parsed_jobs_dict = _parse_jobs_dict(jobs)
                 for job_id, job in parsed_jobs_dict.items():
                     await self._process_job_update(job_id, job)
 
-            await asyncio.sleep(self._poll_period)
+            self._poller.finish_poll(num_jobs)
+            await self._poller.sleep(self._poll_period)
+
+    async def _qstat(
+        self, options: Sequence[str], job_ids: Iterable[str]
+    ) -> list[str] | None:
+        """Run qstat with options on job_ids, split into as many calls as the
+        length of the command line requires. Returns the output of each call,
+        or None if qstat failed."""
+        outputs = []
+        for chunk in chunk_job_ids(list(job_ids)):
+            process = await asyncio.create_subprocess_exec(
+                str(self._qstat_cmd),
+                *options,
+                *chunk,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await process.communicate()
+            if process.returncode not in {0, QSTAT_UNKNOWN_JOB_ID}:
+                # Any unknown job ids will yield QSTAT_UNKNOWN_JOB_ID, but
+                # results for other job ids on stdout can be assumed valid.
+                return None
+            if process.returncode == QSTAT_UNKNOWN_JOB_ID:
+                logger.debug(
+                    f"qstat gave returncode {QSTAT_UNKNOWN_JOB_ID} "
+                    f"with message {stderr.decode(errors='ignore')}"
+                )
+            outputs.append(stdout.decode(errors="ignore"))
+        return outputs
 
     async def _process_job_update(self, job_id: str, new_state: AnyJob) -> None:
         if job_id not in self._jobs:
@@ -364,6 +388,7 @@ async def _process_job_update(self, job_id: str, new_state: AnyJob) -> None:
             self._finished_job_ids.remove(job_id)
 
         if event:
+            self._poller.transition()
             await self.event_queue.put(event)
 
     async def finish(self) -> None:
@@ -15,9 +15,10 @@
 from pydantic.dataclasses import dataclass
 
 from _ert.async_utils import get_running_loop
+from _ert.checksum import ChecksumMode
 from _ert.events import Event, ForwardModelStepChecksum, Id, event_from_dict
 
-from .driver import Driver
+from .driver import Driver, JobSubmission
 from .event import FinishedEvent, StartedEvent
 from .job import Job, JobState
 
@@ -34,6 +35,9 @@ class _JobsJson:
     dispatch_url: str | None
     ee_token: str | None
     experiment_id: str | None
+    num_cpu: int | None
+    checksum_mode: ChecksumMode
+    memory_poll_period: float
 
 
 class SubmitSleeper:
@@ -53,6 +57,91 @@ async def sleep_until_we_can_submit(self) -> None:
         await asyncio.sleep(max(0, next_start_time - now))
 
 
+class JobArraySubmitter:
+    """Collects the submissions of jobs and submits them to the driver as job
+    arrays of at most size jobs. Jobs requesting the same resources are
+    batched together, and a batch is submitted when it is full or
+    collect_time seconds after its first job arrived.
+
+    A job that is cancelled while its batch is being submitted waits for the
+    submission to finish before the cancellation is raised, so that the job
+    ids are known to the driver when the job is killed."""
+
+    def __init__(self, driver: Driver, size: int, collect_time: float = 1.0):
+        self._driver = driver
+        self._size = size
+        self._collect_time = collect_time
+        self._batches: dict[
+            tuple[int | None, int | None],
+            list[tuple[JobSubmission, asyncio.Future[None]]],
+        ] = {}
+        self._timers: dict[tuple[int | None, int | None], asyncio.TimerHandle] = {}
+        self._submit_tasks: set[asyncio.Task[None]] = set()
+        self._submitting: dict[asyncio.Future[None], asyncio.Task[None]] = {}
+
+    async def submit(self, job: JobSubmission) -> None:
+        """Submit job as part of a job array, raises FailedSubmit as
+        Driver.submit does."""
+        loop = get_running_loop()
+        key = (job.num_cpu, job.realization_memory)
+        entry = (job, loop.create_future())
+        batch = self._batches.setdefault(key, [])
+        batch.append(entry)
+        if len(batch) >= self._size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self._collect_time, self._flush, key)
+        try:
+            await entry[1]
+        except asyncio.CancelledError:
+            if entry in self._batches.get(key, []):
+                self._batches[key].remove(entry)
+            elif (task := self._submitting.get(entry[1])) is not None:
+                await asyncio.shield(task)
+            raise
+
+    def _flush(self, key: tuple[int | None, int | None]) -> None:
+        if (timer := self._timers.pop(key, None)) is not None:
+            timer.cancel()
+        if batch := self._batches.pop(key, []):
+            task = asyncio.create_task(self._submit_batch(batch))
+            self._submit_tasks.add(task)
+            task.add_done_callback(self._submit_tasks.discard)
+            for _, future in batch:
+                self._submitting[future] = task
+
+    async def _submit_batch(
+        self, batch: list[tuple[JobSubmission, asyncio.Future[None]]]
+    ) -> None:
+        jobs = [job for job, _ in batch]
+        try:
+            if len(jobs) == 1:
+                await self._driver.submit(
+                    jobs[0].iens,
+                    jobs[0].executable,
+                    *jobs[0].args,
+                    name=jobs[0].name,
+                    runpath=jobs[0].runpath,
+                    num_cpu=jobs[0].num_cpu,
+                    realization_memory=jobs[0].realization_memory,
+                )
+            else:
+                logger.info(f"Submitting {len(jobs)} realizations as a job array")
+                await self._driver.submit_array(jobs)
+        except Exception as err:
+            # Raised in the jobs waiting for the submission
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(err)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+        finally:
+            for _, future in batch:
+                self._submitting.pop(future, None)
+
+
 class Scheduler:
     def __init__(
         self,
@@ -64,9 +153,13 @@ def __init__(
         max_submit: int = 1,
         max_running: int = 1,
         submit_sleep: float = 0.0,
+        job_array_size: int = 0,
+        max_parallel_internalization: int = 4,
         ens_id: str | None = None,
         ee_uri: str | None = None,
         ee_token: str | None = None,
+        checksum_mode: ChecksumMode = ChecksumMode.MD5,
+        memory_poll_period: float = 5.0,
     ) -> None:
         self.driver = driver
         self._ensemble_evaluator_queue = ensemble_evaluator_queue
@@ -78,6 +171,16 @@ def __init__(
         if submit_sleep > 0:
             self.submit_sleep_state = SubmitSleeper(submit_sleep)
 
+        self.job_array_submitter: JobArraySubmitter | None = None
+        if job_array_size > 1:
+            if driver.supports_job_arrays:
+                self.job_array_submitter = JobArraySubmitter(driver, job_array_size)
+            else:
+                logger.warning(
+                    f"{type(driver).__name__} does not support job arrays, "
+                    "realizations are submitted one by one"
+                )
+
         self._jobs: MutableMapping[int, Job] = {
             real.iens: Job(self, real) for real in (realizations or [])
         }
@@ -97,9 +200,14 @@ def __init__(
             )
         self._max_submit = max_submit
         self._max_running = max_running
+        if max_parallel_internalization < 1:
+            raise ValueError("max_parallel_internalization needs to be at least 1")
+        self._max_parallel_internalization = max_parallel_internalization
         self._ee_uri = ee_uri
         self._ens_id = ens_id
         self._ee_token = ee_token
+        self._checksum_mode = checksum_mode
+        self._memory_poll_period = memory_poll_period
 
         self.checksum: dict[str, dict[str, Any]] = {}
 
@@ -257,18 +365,22 @@ async def execute(
             scheduling_tasks.append(asyncio.create_task(self._update_avg_job_runtime()))
 
         sem = asyncio.BoundedSemaphore(self._max_running or len(self._jobs))
-        # this lock is to assure that no more than 1 task
-        # does internalization at a time
-        forward_model_ok_lock = asyncio.Lock()
-        verify_checksum_lock = asyncio.Lock()
+        # Internalization reads and writes files in worker threads,
+        # this bounds how many realizations do so at the same time
+        forward_model_ok_sem = asyncio.BoundedSemaphore(
+            self._max_parallel_internalization
+        )
+        verify_checksum_sem = asyncio.BoundedSemaphore(
+            self._max_parallel_internalization
+        )
         for iens, job in self._jobs.items():
             await asyncio.sleep(0)
             if job.state != JobState.ABORTED:
                 self._job_tasks[iens] = asyncio.create_task(
                     job.run(
                         sem,
-                        forward_model_ok_lock,
-                        verify_checksum_lock,
+                        forward_model_ok_sem,
+                        verify_checksum_sem,
                         self._max_submit,
                     ),
                     name=f"job-{iens}_task",
@@ -292,6 +404,8 @@ async def execute(
             await self._monitor_and_handle_tasks(scheduling_tasks)
             await self.driver.finish()
         finally:
+            if (poll_metrics := self.driver.poll_metrics) is not None:
+                logger.info(f"Queue system polls: {poll_metrics}")
             for scheduling_task in scheduling_tasks:
                 scheduling_task.cancel()
             # We discard exceptions when cancelling the scheduling tasks
@@ -331,6 +445,9 @@ def _update_jobs_json(self, iens: int, runpath: str) -> None:
             real_id=iens,
             dispatch_url=self._ee_uri,
             ee_token=self._ee_token,
+            num_cpu=self._jobs[iens].real.num_cpu,
+            checksum_mode=self._checksum_mode,
+            memory_poll_period=self._memory_poll_period,
         )
         jobs_path = os.path.join(runpath, "jobs.json")
         try:
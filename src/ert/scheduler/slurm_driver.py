@@ -4,16 +4,26 @@
 import datetime
 import itertools
 import logging
+import os
 import shlex
-import stat
 import time
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from contextlib import AsyncExitStack
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
-from .driver import SIGNAL_OFFSET, Driver, FailedSubmit, create_submit_script
+from .driver import (
+    SIGNAL_OFFSET,
+    AdaptivePoller,
+    Driver,
+    FailedSubmit,
+    JobSubmission,
+    PollMetrics,
+    create_array_submit_script,
+    create_submit_script,
+    write_submit_script,
+)
 from .event import Event, FinishedEvent, StartedEvent
 
 SLURM_FAILED_EXIT_CODE_FETCH = SIGNAL_OFFSET + 66
@@ -104,15 +114,15 @@ def __init__(
 
         self._scontrol = scontrol_cmd
         self._sacct = sacct_cmd
-        self._scontrol_cache_timestamp = 0.0
         self._scontrol_required_cache_age = 30
-        self._scontrol_cache: dict[str, ScontrolInfo] = {}
+        self._scontrol_cache: dict[str, tuple[float, ScontrolInfo]] = {}
 
         self._user = user
 
         self._sleep_time_between_cmd_retries = 3
         self._sleep_time_between_kills = 30
         self._poll_period = squeue_timeout
+        self._poller = AdaptivePoller(logger)
         self._project_code = project_code
 
     def _submit_cmd(
@@ -120,15 +130,23 @@ def _submit_cmd(
         name: str = "dummy",
         runpath: Path | None = None,
         num_cpu: int | None = 1,
+        array_size: int = 0,
     ) -> list[str]:
         sbatch_with_args = [
             str(self._sbatch),
             f"--job-name={name}",
             f"--chdir={runpath}",
             "--parsable",
-            f"--output={name}.stdout",
-            f"--error={name}.stderr",
         ]
+        if array_size:
+            # Each array element redirects its output in the array script
+            sbatch_with_args += [
+                f"--array=0-{array_size - 1}",
+                "--output=/dev/null",
+                "--error=/dev/null",
+            ]
+        else:
+            sbatch_with_args += [f"--output={name}.stdout", f"--error={name}.stderr"]
         if num_cpu:
             sbatch_with_args.append(f"--ntasks={num_cpu}")
         if self._realization_memory and self._realization_memory > 0:
@@ -166,24 +184,12 @@ async def submit(
             name = Path(executable).name
 
         script = create_submit_script(runpath, executable, args, self.activate_script)
-        script_path: Path | None = None
         try:
-            with NamedTemporaryFile(
-                dir=runpath,
-                prefix=".slurm_submit_",
-                suffix=".sh",
-                mode="w",
-                encoding="utf-8",
-                delete=False,
-            ) as script_handle:
-                script_handle.write(script)
-                script_path = Path(script_handle.name)
+            script_path = write_submit_script(runpath, ".slurm_submit_", script)
         except OSError as err:
             error_message = f"Could not create submit script: {err}"
             self._job_error_message_by_iens[iens] = error_message
             raise FailedSubmit(error_message) from err
-        assert script_path is not None
-        script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
         sbatch_with_args = [*self._submit_cmd(name, runpath, num_cpu), str(script_path)]
 
         if iens not in self._submit_locks:
@@ -213,6 +219,86 @@ async def submit(
                 iens=iens,
             )
             self._iens2jobid[iens] = job_id
+            self._poller.expect_transitions()
+
+    @property
+    def poll_metrics(self) -> PollMetrics:
+        return self._poller.metrics
+
+    @property
+    def supports_job_arrays(self) -> bool:
+        return True
+
+    async def submit_array(self, jobs: Sequence[JobSubmission]) -> None:
+        runpaths = [job.runpath or Path.cwd() for job in jobs]
+        names = [job.name or Path(job.executable).name for job in jobs]
+        try:
+            scripts = [
+                (
+                    write_submit_script(
+                        runpath,
+                        ".slurm_submit_",
+                        create_submit_script(
+                            runpath, job.executable, job.args, self.activate_script
+                        ),
+                    ),
+                    runpath / f"{name}.stdout",
+                    runpath / f"{name}.stderr",
+                )
+                for job, runpath, name in zip(jobs, runpaths, names, strict=True)
+            ]
+            array_script_path = write_submit_script(
+                runpaths[0],
+                ".slurm_array_submit_",
+                create_array_submit_script("SLURM_ARRAY_TASK_ID", 0, scripts),
+            )
+        except OSError as err:
+            error_message = f"Could not create submit script: {err}"
+            for job in jobs:
+                self._job_error_message_by_iens[job.iens] = error_message
+            raise FailedSubmit(error_message) from err
+        sbatch_with_args = [
+            *self._submit_cmd(
+                os.path.commonprefix(names).rstrip("-_") or names[0],
+                runpaths[0],
+                jobs[0].num_cpu,
+                array_size=len(jobs),
+            ),
+            str(array_script_path),
+        ]
+
+        async with AsyncExitStack() as stack:
+            for job in jobs:
+                await stack.enter_async_context(
+                    self._submit_locks.setdefault(job.iens, asyncio.Lock())
+                )
+            logger.debug(
+                f"Submitting to SLURM with command {shlex.join(sbatch_with_args)}"
+            )
+            process_success, process_message = await self._execute_with_retry(
+                sbatch_with_args,
+                retry_on_empty_stdout=True,
+                retry_codes=(),
+                total_attempts=self._max_sbatch_attempts,
+                retry_interval=self._sleep_time_between_cmd_retries,
+            )
+            if not process_success:
+                for job in jobs:
+                    self._job_error_message_by_iens[job.iens] = process_message
+                raise FailedSubmit(process_message)
+
+            if not process_message:
+                raise FailedSubmit("sbatch returned empty jobid")
+            array_job_id = process_message
+            logger.info(
+                f"Realizations {[job.iens for job in jobs]} accepted by SLURM "
+                f"as job array {array_job_id}"
+            )
+            for index, job in enumerate(jobs):
+                job_id = f"{array_job_id}_{index}"
+                self._jobs[job_id] = JobData(iens=job.iens)
+                self._iens2jobid[job.iens] = job_id
+            self._poller.expect_transitions()
 
     async def kill(self, iens: int) -> None:
         if iens not in self._submit_locks:
@@ -227,6 +313,7 @@ async def kill(self, iens: int) -> None:
                 return
 
             job_id = self._iens2jobid[iens]
+            self._poller.expect_transitions()
 
             logger.debug(f"Killing realization {iens} with SLURM-id {job_id}")
             await self._execute_with_retry(
@@ -241,7 +328,10 @@ async def poll(self) -> None:
             if not self._jobs.keys():
                 await asyncio.sleep(self._poll_period)
                 continue
-            arguments = ["-h", "--format=%i %T"]
+            self._poller.start_poll()
+            num_jobs = len(self._jobs)
+            # -r lists pending array elements one by one
+            arguments = ["-h", "-r", "--format=%i %T"]
             if self._user:
                 arguments.append(f"--user={self._user}")
             try:
@@ -268,12 +358,9 @@ async def poll(self) -> None:
                 logger.debug(
                     f"scontrol is used for job ids: {missing_in_squeue_output}"
                 )
-                scontrol_states = {}
-                for job_id in missing_in_squeue_output:
-                    if (
-                        scontrol_info := await self._poll_once_by_scontrol(job_id)
-                    ) is not None:
-                        scontrol_states[job_id] = scontrol_info
+                scontrol_states = await self._poll_once_by_scontrol(
+                    sorted(missing_in_squeue_output)
+                )
                 missing_in_squeue_and_scontrol = missing_in_squeue_output - set(
                     scontrol_states.keys()
                 )
@@ -290,7 +377,13 @@ async def poll(self) -> None:
                 logger.debug(
                     f"scontrol did not give status for job_ids {missing_in_squeue_and_scontrol}, giving up for now."
                 )
-            await asyncio.sleep(self._poll_period)
+            if missing_in_squeue_output:
+                logger.debug(
+                    f"{len(missing_in_squeue_output)} of {num_jobs} jobs "
+                    "were polled by scontrol or sacct"
+                )
+            self._poller.finish_poll(num_jobs)
+            await self._poller.sleep(self._poll_period)
 
     async def _process_job_update(self, job_id: str, new_info: JobInfo) -> None:
         new_state = new_info.status
@@ -325,13 +418,19 @@ async def _process_job_update(self, job_id: str, new_info: JobInfo) -> None:
             if isinstance(event, FinishedEvent):
                 del self._jobs[job_id]
                 del self._iens2jobid[iens]
+                self._scontrol_cache.pop(job_id, None)
+            self._poller.transition()
             await self.event_queue.put(event)
 
     async def _get_exit_code(self, job_id: str) -> int:
         retries = 0
         while retries < 10 and self._jobs[job_id].exit_code is None:
             retries += 1
-            if (scontrol_info := await self._poll_once_by_scontrol(job_id)) is not None:
+            if (
+                scontrol_info := (await self._poll_once_by_scontrol([job_id])).get(
+                    job_id
+                )
+            ) is not None:
                 self._jobs[job_id].exit_code = scontrol_info.exit_code
             else:
                 await asyncio.sleep(self._poll_period)
@@ -341,30 +440,57 @@ async def _get_exit_code(self, job_id: str) -> int:
             return code
         return SLURM_FAILED_EXIT_CODE_FETCH
 
-    async def _poll_once_by_scontrol(self, missing_job_id: str) -> ScontrolInfo | None:
-        if (
-            time.time() - self._scontrol_cache_timestamp
-            < self._scontrol_required_cache_age
-        ) and missing_job_id in self._scontrol_cache:
-            return self._scontrol_cache[missing_job_id]
-
-        info = await self._run_scontrol(missing_job_id)
-        if info is None:
-            logger.warning("scontrol failed, trying sacct")
-            info = await self._run_sacct(missing_job_id)
-        if info is None:
-            return None
-
-        self._scontrol_cache[missing_job_id] = info
-        self._scontrol_cache_timestamp = time.time()
-        return info
-
-    async def _run_scontrol(self, missing_job_id: str) -> ScontrolInfo | None:
+    async def _poll_once_by_scontrol(
+        self, missing_job_ids: Collection[str]
+    ) -> dict[str, ScontrolInfo]:
+        """Status of the given jobs. A single job is looked up by scontrol,
+        or by sacct if scontrol fails. Several jobs are looked up by one sacct
+        call, as scontrol shows either one job or every job on the cluster,
+        or by one scontrol call per job if sacct fails. Statuses younger than
+        the required cache age are reused."""
+        now = time.time()
+        infos = {
+            job_id: info
+            for job_id in missing_job_ids
+            if job_id in self._scontrol_cache
+            for timestamp, info in [self._scontrol_cache[job_id]]
+            if now - timestamp < self._scontrol_required_cache_age
+        }
+        if not (
+            job_ids := [job_id for job_id in missing_job_ids if job_id not in infos]
+        ):
+            return infos
+
+        if len(job_ids) == 1:
+            found = await self._run_scontrol(job_ids[0])
+            if found is None:
+                logger.warning("scontrol failed, trying sacct")
+                found = await self._run_sacct(job_ids)
+        else:
+            found = await self._run_sacct(job_ids)
+            if found is None:
+                logger.warning("sacct failed, trying scontrol for each job")
+                found = {}
+                for job_id in job_ids:
+                    found.update(await self._run_scontrol(job_id) or {})
+        if found is None:
+            return infos
+
+        now = time.time()
+        for job_id in job_ids:
+            if job_id in found:
+                infos[job_id] = found[job_id]
+                self._scontrol_cache[job_id] = (now, found[job_id])
+        return infos
+
+    async def _run_scontrol(
+        self, missing_job_id: str
+    ) -> dict[str, ScontrolInfo] | None:
         process = await asyncio.create_subprocess_exec(
             self._scontrol,
             "show",
             "job",
-            str(missing_job_id),
+            missing_job_id,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -378,24 +504,33 @@ async def _run_scontrol(self, missing_job_id: str) -> ScontrolInfo | None:
             return None
 
         try:
-            return _parse_scontrol_output(stdout.decode(errors="ignore"))
+            return {
+                missing_job_id: _parse_scontrol_output(stdout.decode(errors="ignore"))
+            }
         except Exception as err:
             logger.warning(
                 f"Could not parse scontrol stdout {stdout.decode(errors='ignore')}: {err}"
             )
         return None
 
-    async def _run_sacct(self, missing_job_id: str) -> ScontrolInfo | None:
+    async def _run_sacct(
+        self, missing_job_ids: Sequence[str]
+    ) -> dict[str, ScontrolInfo] | None:
+        if len(missing_job_ids) == 1:
+            arguments = ["-o", "State,ExitCode", "-P", "-j", missing_job_ids[0]]
+        else:
+            arguments = [
+                "-o",
+                "JobID,State,ExitCode",
+                "-P",
+                f"--jobs={','.join(missing_job_ids)}",
+            ]
         try:
             process = await asyncio.create_subprocess_exec(
                 self._sacct,
                 "-X",
                 "-n",
-                "-o",
-                "State,ExitCode",
-                "-P",
-                "-j",
-                str(missing_job_id),
+                *arguments,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
@@ -412,7 +547,13 @@ async def _run_sacct(self, missing_job_id: str) -> ScontrolInfo | None:
             return None
 
         try:
-            return _parse_sacct_output(stdout.decode(errors="ignore"))
+            if len(missing_job_ids) == 1:
+                return {
+                    missing_job_ids[0]: _parse_sacct_output(
+                        stdout.decode(errors="ignore")
+                    )
+                }
+            return dict(_parse_sacct_jobs_output(stdout.decode(errors="ignore")))
         except Exception as err:
             logger.warning(
                 f"Could not parse sacct stdout {stdout.decode(errors='ignore')}: {err}"
@@ -464,7 +605,10 @@ def _seconds_to_slurm_time_format(seconds: float) -> str:
 
 
 def _parse_scontrol_output(output: str) -> ScontrolInfo:
-    values = dict(w.split("=", 1) for w in output.split())
+    return _scontrol_info(dict(w.split("=", 1) for w in output.split()))
+
+
+def _scontrol_info(values: Mapping[str, str]) -> ScontrolInfo:
     exit_code_str = values.get("ExitCode")
     exit_code = None
     if exit_code_str:
@@ -478,3 +622,11 @@ def _parse_sacct_output(output: str) -> ScontrolInfo:
     if len(items) > 0 and items[1]:
         exit_code = int(items[1].split(":")[0])
     return ScontrolInfo(JobStatus[items[0]], exit_code)
+
+
+def _parse_sacct_jobs_output(output: str) -> Iterator[tuple[str, ScontrolInfo]]:
+    for line in output.splitlines():
+        if line:
+            job_id, state, exit_code = line.split("|")
+            # Cancelled jobs have the state "CANCELLED by <uid>"
+            yield job_id, _parse_sacct_output(f"{state.split()[0]}|{exit_code}")
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import numpy.typing as npt
+
+
+class ConsolidatedResponses:
+    """
+    Ensemble level, read optimized copy of the responses of a single
+    response type.
+
+    The responses of all realizations are stored as a parquet dataset sorted
+    by response key, split into parts of disjoint key ranges with row group
+    statistics, so that loading one key for all realizations only reads the
+    row groups containing that key. Which realizations the copy was made from
+    is tracked by ``realizations.npy``.
+
+    The per realization response files remain the source of truth, the copy
+    must be removed whenever one of them is changed.
+    """
+
+    REALIZATIONS = "realizations.npy"
+    PART_ROWS = 5_000_000
+    ROW_GROUP_SIZE = 50_000
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def exists(self) -> bool:
+        return (self.path / self.REALIZATIONS).exists()
+
+    def realizations(self) -> npt.NDArray[np.int_]:
+        """The realizations the responses were consolidated from"""
+        try:
+            return np.load(self.path / self.REALIZATIONS)
+        except FileNotFoundError:
+            return np.zeros(0, dtype=np.int_)
+
+    def covers(self, realizations: tuple[int, ...]) -> bool:
+        return bool(realizations) and bool(
+            np.isin(realizations, self.realizations()).all()
+        )
+
+    def scan(
+        self, realizations: tuple[int, ...], key: str | None = None
+    ) -> polars.LazyFrame:
+        """
+        Scan the responses of realizations, and only of key if given, in the
+        order the realizations are given in.
+        """
+        df = polars.scan_parquet(self.path / "*.parquet")
+        if key is not None:
+            df = df.filter(polars.col("response_key") == key)
+        return df.filter(polars.col("realization").is_in(list(realizations))).sort(
+            polars.col("realization").replace_strict(
+                list(realizations), list(range(len(realizations)))
+            ),
+            maintain_order=True,
+        )
+
+    def create(self, files: Mapping[int, Path], swap: Path) -> None:
+        """
+        Consolidate the per realization response files, given by realization,
+        replacing any previous copy. Only the responses of one part of the keys
+        are in memory at a time.
+        """
+        realizations = sorted(files)
+        responses = polars.scan_parquet([files[r] for r in realizations])
+        keys = (
+            responses.select(polars.col("response_key").unique())
+            .collect()
+            .to_series()
+            .sort()
+        )
+        num_rows = responses.select(polars.len()).collect().item()
+        keys_per_part = -(-len(keys) * self.PART_ROWS // max(num_rows, 1)) or 1
+
+        swap.mkdir(parents=True, exist_ok=True)
+        tmp = Path(mkdtemp(dir=swap))
+        try:
+            for part, offset in enumerate(range(0, len(keys), keys_per_part)):
+                part_keys = keys.slice(offset, keys_per_part)
+                df = responses.filter(
+                    polars.col("response_key").is_in(part_keys)
+                ).collect()
+                # A stable sort on the position of the key keeps the rows of
+                # each key in realization order
+                df = (
+                    df.with_columns(
+                        polars.col("response_key")
+                        .cast(polars.Enum(part_keys))
+                        .to_physical()
+                        .alias("__key_order__")
+                    )
+                    .sort("__key_order__", maintain_order=True)
+                    .drop("__key_order__")
+                )
+                df.write_parquet(
+                    tmp / f"part-{part:05d}.parquet",
+                    row_group_size=self.ROW_GROUP_SIZE,
+                    statistics=True,
+                )
+            np.save(tmp / self.REALIZATIONS, np.array(realizations, dtype=np.int_))
+            self.remove(swap)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(tmp, self.path)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def remove(self, swap: Path) -> None:
+        if not self.path.exists():
+            return
+        swap.mkdir(parents=True, exist_ok=True)
+        trash = Path(mkdtemp(dir=swap))
+        try:
+            os.rename(self.path, trash / self.path.name)
+        except FileNotFoundError:
+            # Removed by another writer
+            pass
+        finally:
+            shutil.rmtree(trash, ignore_errors=True)
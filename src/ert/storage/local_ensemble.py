@@ -19,6 +19,9 @@
 from ert.config.gen_kw_config import GenKwConfig
 from ert.storage.mode import BaseMode, Mode, require_write
 
+from .consolidated_responses import ConsolidatedResponses
+from .misfits import calculate_misfits, sum_misfits_by_group
+from .parameter_store import ParameterStore
 from .realization_storage_state import RealizationStorageState
 
 if TYPE_CHECKING:
@@ -29,6 +32,15 @@
 
 logger = logging.getLogger(__name__)
 
+# The columns of get_observations_and_responses that precede the responses
+_OBSERVATION_COLUMNS = [
+    "response_key",
+    "index",
+    "observation_key",
+    "observations",
+    "std",
+]
+
 import polars
 
 
@@ -60,6 +72,9 @@ class LocalEnsemble(BaseMode):
     parameters and responses.
     """
 
+    PARAMETERS_PATH = "parameters"
+    RESPONSES_PATH = "responses"
+
     def __init__(
         self,
         storage: LocalStorage,
@@ -93,6 +108,22 @@ def create_realization_dir(realization: int) -> Path:
 
         self._realization_dir = create_realization_dir
 
+        @cache
+        def create_parameter_store(group: str) -> ParameterStore:
+            return ParameterStore(
+                self._path / self.PARAMETERS_PATH / _escape_filename(group), group
+            )
+
+        self._parameter_store = create_parameter_store
+
+        @cache
+        def create_consolidated_responses(response_type: str) -> ConsolidatedResponses:
+            return ConsolidatedResponses(
+                self._path / self.RESPONSES_PATH / _escape_filename(response_type)
+            )
+
+        self._consolidated_responses = create_consolidated_responses
+
     @classmethod
     def create(
         cls,
@@ -268,18 +299,22 @@ def is_initalized(self) -> list[int]:
             Returns the realization numbers with parameters
         """
 
-        return [
-            i
-            for i in range(self.ensemble_size)
-            if all(
-                (
-                    self._realization_dir(i)
-                    / (_escape_filename(parameter.name) + ".nc")
-                ).exists()
-                for parameter in self.experiment.parameter_configuration.values()
-                if not parameter.forward_init
-            )
+        saved = [
+            self._saved_parameter_realizations(parameter.name)
+            for parameter in self.experiment.parameter_configuration.values()
+            if not parameter.forward_init
         ]
+        return [i for i in range(self.ensemble_size) if all(mask[i] for mask in saved)]
+
+    def _saved_parameter_realizations(self, group: str) -> npt.NDArray[np.bool_]:
+        """
+        Mask of length ensemble_size which is True for the realizations
+        where the parameter group has been saved.
+        """
+        mask = np.zeros(self.ensemble_size, dtype=np.bool_)
+        saved = self._parameter_store(group).realizations()[: self.ensemble_size]
+        mask[: len(saved)] = saved
+        return mask
 
     def has_data(self) -> list[int]:
         """
@@ -408,6 +443,10 @@ def get_ensemble_state(self) -> list[set[RealizationStorageState]]:
         """
 
         response_configs = self.experiment.response_configuration
+        saved_parameters = [
+            self._saved_parameter_realizations(parameter)
+            for parameter in self.experiment.parameter_configuration
+        ]
 
         def _parameters_exist_for_realization(realization: int) -> bool:
             """
@@ -424,13 +463,7 @@ def _parameters_exist_for_realization(realization: int) -> bool:
             exists : bool
                 True if parameters exist for realization.
             """
-            if not self.experiment.parameter_configuration:
-                return True
-            path = self._realization_dir(realization)
-            return all(
-                (path / (_escape_filename(parameter) + ".nc")).exists()
-                for parameter in self.experiment.parameter_configuration
-            )
+            return all(mask[realization] for mask in saved_parameters)
 
         def _responses_exist_for_realization(
             realization: int, key: str | None = None
@@ -501,43 +534,15 @@ def _find_state(realization: int) -> set[RealizationStorageState]:
 
         return [_find_state(i) for i in range(self.ensemble_size)]
 
-    def _load_single_dataset(
-        self,
-        group: str,
-        realization: int,
-    ) -> xr.Dataset:
-        try:
-            return xr.open_dataset(
-                self.mount_point
-                / f"realization-{realization}"
-                / f"{_escape_filename(group)}.nc",
-                engine="scipy",
-            )
-        except FileNotFoundError as e:
-            raise KeyError(
-                f"No dataset '{group}' in storage for realization {realization}"
-            ) from e
-
     def _load_dataset(
         self,
         group: str,
         realizations: int | np.int64 | npt.NDArray[np.int_] | None,
     ) -> xr.Dataset:
+        store = self._parameter_store(group)
         if isinstance(realizations, int | np.int64):
-            return self._load_single_dataset(group, int(realizations)).isel(
-                realizations=0, drop=True
-            )
-
-        if realizations is None:
-            datasets = [
-                xr.open_dataset(p, engine="scipy")
-                for p in sorted(
-                    self.mount_point.glob(f"realization-*/{_escape_filename(group)}.nc")
-                )
-            ]
-        else:
-            datasets = [self._load_single_dataset(group, i) for i in realizations]
-        return xr.combine_nested(datasets, concat_dim="realizations")
+            return store.load(np.array([realizations])).isel(realizations=0, drop=True)
+        return store.load(realizations)
 
     def load_parameters(
         self, group: str, realizations: int | npt.NDArray[np.int_] | None = None
@@ -657,6 +662,10 @@ def _load_responses_lazy(
             response_type = self.experiment.response_key_to_response_type[key]
             select_key = True
 
+        consolidated = self._consolidated_responses(response_type)
+        if consolidated.covers(realizations):
+            return consolidated.scan(realizations, key if select_key else None)
+
         loaded = []
         for realization in realizations:
             input_path = self._realization_dir(realization) / f"{response_type}.parquet"
@@ -789,7 +798,7 @@ def load_all_gen_kw_data(
     def save_parameters(
         self,
         group: str,
-        realization: int,
+        realization: int | npt.NDArray[np.int_],
         dataset: xr.Dataset,
     ) -> None:
         """
@@ -817,13 +826,69 @@ def save_parameters(
         if group not in self.experiment.parameter_configuration:
             raise ValueError(f"{group} is not registered to the experiment.")
 
-        path = self._realization_dir(realization) / f"{_escape_filename(group)}.nc"
-        path.parent.mkdir(exist_ok=True)
-        if "realizations" in dataset.dims:
-            data_to_save = dataset.sel(realizations=[realization])
+        if isinstance(realization, int | np.integer):
+            realizations = np.array([realization])
+            if "realizations" in dataset.dims:
+                dataset = dataset.sel(realizations=realizations)
+            else:
+                dataset = dataset.expand_dims(realizations=realizations)
         else:
-            data_to_save = dataset.expand_dims(realizations=[realization])
-        self._storage._to_netcdf_transaction(path, data_to_save)
+            realizations = np.asarray(realization)
+            if "realizations" not in dataset.dims:
+                raise ValueError(
+                    f"Dataset for parameter group '{group}' must have a "
+                    "'realizations' dimension when saving multiple realizations"
+                )
+        store = self._parameter_store(group)
+        if not store.exists():
+            store.create(
+                dataset.isel(realizations=0, drop=True),
+                self.ensemble_size,
+                self._storage._swap_path,
+            )
+        store.save(realizations, dataset)
+
+    @require_write
+    def save_parameters_product(
+        self,
+        source: LocalEnsemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        matrix: npt.NDArray[np.float64],
+        chunk_size: int,
+    ) -> None:
+        """
+        Saves the parameters of group for realizations as X @ matrix, where
+        X holds the parameters of group in source with one column per
+        realization, without loading all of X into memory.
+
+        Parameters
+        ----------
+        source : LocalEnsemble
+            Ensemble to read the parameters from.
+        group : str
+            Parameter group name.
+        realizations : NDArray[int_]
+            Realizations to read from source and save, in the order of the
+            rows and columns of matrix.
+        matrix : NDArray[float64]
+            Square matrix to multiply the parameters by.
+        chunk_size : int
+            Number of parameters read into memory at a time.
+        """
+        if group not in self.experiment.parameter_configuration:
+            raise ValueError(f"{group} is not registered to the experiment.")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        source_store = source._parameter_store(group)
+        if not source_store.exists():
+            raise KeyError(f"No dataset '{group}' in storage")
+        store = self._parameter_store(group)
+        if not store.exists():
+            store.create_like(
+                source_store, self.ensemble_size, self._storage._swap_path
+            )
+        store.save_product(source_store, realizations, matrix, chunk_size)
 
     @require_write
     def save_response(
@@ -861,6 +926,8 @@ def save_response(
                 ),
             )
 
+        self._consolidated_responses(response_type).remove(self._storage._swap_path)
+
         output_path = self._realization_dir(realization)
         Path.mkdir(output_path, parents=True, exist_ok=True)
 
@@ -872,20 +939,74 @@ def save_response(
             response_keys = data["response_key"].unique().to_list()
             self.experiment._update_response_keys(response_type, response_keys)
 
+    @require_write
+    def consolidate_responses(self) -> None:
+        """
+        Merge the per realization responses of each response type into an
+        ensemble level copy, sorted by response key, which
+        :meth:`load_responses` prefers over reading one file per realization.
+        The copy is discarded when a response is saved again.
+        """
+        for response_type in self.experiment.response_configuration:
+            files = {
+                realization: path
+                for realization in range(self.ensemble_size)
+                if (
+                    path := self._realization_dir(realization)
+                    / f"{response_type}.parquet"
+                ).exists()
+            }
+            if files:
+                self._consolidated_responses(response_type).create(
+                    files, self._storage._swap_path
+                )
+
     def calculate_std_dev_for_parameter(self, parameter_group: str) -> xr.Dataset:
+        """
+        The standard deviation over realizations of the parameters in
+        parameter_group. It is computed once and stored with the ensemble
+        until the parameters are saved to again, and the returned dataset is
+        memory-mapped, so reading a slice of it is cheap.
+        """
         if parameter_group not in self.experiment.parameter_configuration:
             raise ValueError(f"{parameter_group} is not registered to the experiment.")
 
-        ds = self.load_parameters(parameter_group)
-        return ds.std("realizations")
+        return self._parameter_store(parameter_group).std_dev(self._storage._swap_path)
+
+    def get_responses_version(self) -> tuple[tuple[int, int, int] | None, ...]:
+        """
+        Identifies the saved responses of each realization. Unlike
+        :meth:`get_ensemble_state`, it changes when a saved response is
+        replaced, so it tells whether data read from the responses is stale.
+        """
+        version: list[tuple[int, int, int] | None] = []
+        for realization in range(self.ensemble_size):
+            path = self._realization_dir(realization)
+            for response_type in self.experiment.response_configuration:
+                try:
+                    stat = (path / f"{response_type}.parquet").stat()
+                except FileNotFoundError:
+                    version.append(None)
+                else:
+                    version.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return tuple(version)
+
+    def get_parameters_version(self) -> tuple[str, ...]:
+        """
+        Identifies the saved parameters of each parameter group, and
+        changes when any realization of a group is saved.
+        """
+        return tuple(
+            self._parameter_store(group).generation()
+            for group in self.experiment.parameter_configuration
+        )
 
     def get_parameter_state(
         self, realization: int
     ) -> dict[str, RealizationStorageState]:
-        path = self._realization_dir(realization)
         return {
             e: RealizationStorageState.PARAMETERS_LOADED
-            if (path / (_escape_filename(e) + ".nc")).exists()
+            if self._saved_parameter_realizations(e)[realization]
             else RealizationStorageState.UNDEFINED
             for e in self.experiment.parameter_configuration
         }
@@ -907,135 +1028,164 @@ def get_observations_and_responses(
         selected_observations: Iterable[str],
         iens_active_index: npt.NDArray[np.int_],
     ) -> polars.DataFrame:
-        """Fetches and aligns selected observations with their corresponding simulated responses from an ensemble."""
-        observations_by_type = self.experiment.observations
+        """Fetches and aligns selected observations with their corresponding simulated responses from an ensemble.
 
-        with polars.StringCache():
-            dfs_per_response_type = []
-            for (
-                response_type,
-                response_cls,
-            ) in self.experiment.response_configuration.items():
-                if response_type not in observations_by_type:
-                    continue
-
-                observations_for_type = (
-                    observations_by_type[response_type]
-                    .filter(
-                        polars.col("observation_key").is_in(list(selected_observations))
-                    )
-                    .with_columns(
-                        [
-                            polars.col("response_key")
-                            .cast(polars.Categorical)
-                            .alias("response_key")
-                        ]
+        The responses of all realizations are read in a single lazy query that
+        only keeps the rows that are observed, and are then scattered into a
+        (observations x realizations) matrix, so the memory used is bounded by
+        the size of the observed responses rather than all the responses.
+        """
+        observations_by_type = self.experiment.observations
+        reals = sorted(iens_active_index.tolist())
+
+        dfs_per_response_type = []
+        for (
+            response_type,
+            response_cls,
+        ) in self.experiment.response_configuration.items():
+            if response_type not in observations_by_type or not reals:
+                continue
+
+            index_cols = ["response_key", *response_cls.primary_key]
+            observations_for_type = observations_by_type[response_type].filter(
+                polars.col("observation_key").is_in(list(selected_observations))
+            )
+            responses = self._load_responses_lazy(response_type, tuple(reals))
+            schema = responses.collect_schema()
+            observed_index = observations_for_type.select(
+                [polars.col(c).cast(schema[c]) for c in index_cols]
+            )
+            observed = observed_index.unique()
+
+            # Filter out responses without observations. Comparing hashes of
+            # the index is much cheaper than joining on several columns, the
+            # join on the remaining rows guards against hash collisions.
+            responses = (
+                responses.filter(
+                    polars.struct(index_cols)
+                    .hash()
+                    .is_in(
+                        observed.select(polars.struct(index_cols).hash()).to_series()
                     )
                 )
+                .join(observed.lazy(), on=index_cols, how="semi")
+                .group_by(["realization", *index_cols])
+                .agg(polars.col("values").mean())
+            )
 
-                observed_cols = {
-                    k: observations_for_type[k].unique()
-                    for k in ["response_key", *response_cls.primary_key]
-                }
-
-                reals = iens_active_index.tolist()
-                reals.sort()
-                # too much memory to do it all at once, go per realization
-                first_columns: polars.DataFrame | None = None
-                realization_columns: list[polars.DataFrame] = []
-                for real in reals:
-                    responses = self._load_responses_lazy(
-                        response_type, (real,)
-                    ).with_columns(
-                        [
-                            polars.col("response_key")
-                            .cast(polars.Categorical)
-                            .alias("response_key")
-                        ]
-                    )
-
-                    # Filter out responses without observations
-                    for col, observed_values in observed_cols.items():
-                        responses = responses.filter(
-                            polars.col(col).is_in(observed_values)
-                        )
-
-                    pivoted = responses.collect().pivot(
-                        on="realization",
-                        index=["response_key", *response_cls.primary_key],
-                        values="values",
-                        aggregate_function="mean",
-                    )
+            matched = (
+                observed_index.lazy()
+                .with_row_index("__obs_row__")
+                .join(responses, on=index_cols, how="inner")
+                .select("__obs_row__", "realization", "values")
+                .collect()
+            )
 
-                    if pivoted.is_empty():
-                        # There are no responses for this realization,
-                        # so we explicitly create a column of nans
-                        # to represent this. We are basically saying that
-                        # for this realization, each observation points
-                        # to a NaN response.
-                        joined = observations_for_type.with_columns(
-                            polars.Series(
-                                str(real),
-                                [np.nan] * len(observations_for_type),
-                                dtype=polars.Float32,
-                            )
-                        )
-                    elif "time" in pivoted:
-                        joined = observations_for_type.join_asof(
-                            pivoted,
-                            by=["response_key", *response_cls.primary_key],
-                            on="time",
-                            tolerance="1s",
-                        )
-                    else:
-                        joined = observations_for_type.join(
-                            pivoted,
-                            how="left",
-                            on=["response_key", *response_cls.primary_key],
-                        )
-
-                    joined = (
-                        joined.with_columns(
-                            polars.concat_str(
-                                response_cls.primary_key, separator=", "
-                            ).alias(
-                                "__tmp_index_key__"
-                                # Avoid potential collisions w/ primary key
-                            )
-                        )
-                        .drop(response_cls.primary_key)
-                        .rename({"__tmp_index_key__": "index"})
+            # Realizations without a response to an observation
+            # are represented by a NaN response
+            values = matched["values"].to_numpy()
+            S = np.full(
+                (len(observations_for_type), len(reals)),
+                np.nan,
+                dtype=np.result_type(values.dtype, np.float32),
+            )
+            S[
+                matched["__obs_row__"].to_numpy(),
+                np.searchsorted(reals, matched["realization"].to_numpy()),
+            ] = values
+
+            first_columns = (
+                observations_for_type.with_columns(
+                    polars.concat_str(response_cls.primary_key, separator=", ").alias(
+                        "__tmp_index_key__"
+                        # Avoid potential collisions w/ primary key
                     )
+                )
+                .drop(response_cls.primary_key)
+                .rename({"__tmp_index_key__": "index"})
+                .select(_OBSERVATION_COLUMNS)
+            )
 
-                    if first_columns is None:
-                        # The "leftmost" index columns are not yet collected.
-                        # They are the same for all iterations, and indexed the same
-                        # because we do a left join for the observations.
-                        # Hence, we select these columns only once.
-                        first_columns = joined.select(
-                            [
-                                "response_key",
-                                "index",
-                                "observation_key",
-                                "observations",
-                                "std",
-                            ]
-                        )
-
-                    realization_columns.append(joined.select(str(real)))
-
-                if first_columns is None:
-                    # Not a single realization had any responses to the
-                    # observations. Hence, there is no need to include
-                    # it in the dataset
-                    continue
-
-                dfs_per_response_type.append(
-                    polars.concat(
-                        [first_columns, *realization_columns], how="horizontal"
-                    )
+            dfs_per_response_type.append(
+                polars.concat(
+                    [
+                        first_columns,
+                        polars.from_numpy(
+                            S, schema=[str(r) for r in reals], orient="row"
+                        ),
+                    ],
+                    how="horizontal",
                 )
+            )
+
+        return polars.concat(dfs_per_response_type, how="vertical").with_columns(
+            polars.col("response_key").cast(polars.String).alias("response_key")
+        )
 
-            return polars.concat(dfs_per_response_type, how="vertical").with_columns(
-                polars.col("response_key").cast(polars.String).alias("response_key")
+    def get_misfits(
+        self,
+        selected_observations: Iterable[str] | None = None,
+        iens_active_index: npt.NDArray[np.int_] | None = None,
+    ) -> polars.DataFrame:
+        """The signed misfits of the selected observations, or all observations,
+        for the given realizations, or all realizations with responses.
+
+        The dataframe has the columns of get_observations_and_responses, with
+        the misfit of each realization in place of its response.
+        """
+        if selected_observations is None:
+            selected_observations = self.experiment.observation_keys
+        selected_observations = list(selected_observations)
+        if iens_active_index is None:
+            iens_active_index = np.flatnonzero(
+                self.get_realization_mask_with_responses()
             )
+        if not selected_observations or len(iens_active_index) == 0:
+            return polars.DataFrame()
+
+        observations_and_responses = self.get_observations_and_responses(
+            selected_observations, iens_active_index
+        )
+        realization_columns = [
+            column
+            for column in observations_and_responses.columns
+            if column not in _OBSERVATION_COLUMNS
+        ]
+        misfits = calculate_misfits(
+            observations_and_responses["observations"].to_numpy(),
+            observations_and_responses["std"].to_numpy(),
+            observations_and_responses.select(realization_columns).to_numpy(),
+        )
+        return observations_and_responses.select(_OBSERVATION_COLUMNS).hstack(
+            polars.from_numpy(misfits, schema=realization_columns, orient="row")
+        )
+
+    def get_misfits_by_observation_group(
+        self,
+        selected_observations: Iterable[str] | None = None,
+        iens_active_index: npt.NDArray[np.int_] | None = None,
+    ) -> pd.DataFrame:
+        """The sum of the absolute misfits over each observation group, as
+        given by the observation key, for each realization.
+
+        The columns are MISFIT:<observation key> for each group and
+        MISFIT:TOTAL, the sum over all groups, and the index is the
+        realization.
+        """
+        misfits = self.get_misfits(selected_observations, iens_active_index)
+        if misfits.is_empty():
+            return pd.DataFrame()
+        realization_columns = [
+            column for column in misfits.columns if column not in _OBSERVATION_COLUMNS
+        ]
+        groups, sums = sum_misfits_by_group(
+            misfits.select(realization_columns).to_numpy(),
+            misfits["observation_key"].to_numpy(),
+        )
+        dataframe = pd.DataFrame(
+            sums.T,
+            index=pd.Index([int(r) for r in realization_columns], name="Realization"),
+            columns=[f"MISFIT:{group}" for group in groups],
+        )
+        dataframe["MISFIT:TOTAL"] = sums.sum(axis=0)
+        return dataframe
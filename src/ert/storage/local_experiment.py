@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from collections.abc import Generator
 from datetime import datetime
 from functools import cached_property
@@ -72,6 +73,7 @@ def __init__(
         super().__init__(mode)
         self._storage = storage
         self._path = path
+        self._response_keys_lock = threading.Lock()
         self._index = _Index.model_validate_json(
             (path / "index.json").read_text(encoding="utf-8")
         )
@@ -366,31 +368,32 @@ def _update_response_keys(
         When a response is saved to storage, it may contain keys
         that are not explicitly declared in the config. Calling this ensures
         that the response config saved in this storage has keys corresponding
-        to the actual received responses.
+        to the actual received responses. Responses may be saved from several
+        threads, so only the first realization to finalize the keys wins.
         """
-        responses_configuration = self.response_configuration
-        if response_type not in responses_configuration:
-            raise KeyError(
-                f"Response type {response_type} does not exist in current responses.json"
-            )
-
-        config = responses_configuration[response_type]
-        config.keys = sorted(response_keys)
-        config.has_finalized_keys = True
-        self._storage._write_transaction(
-            self._path / self._responses_file,
-            json.dumps(
-                {
-                    c.response_type: c.to_dict()
-                    for c in responses_configuration.values()
-                },
-                default=str,
-                indent=2,
-            ).encode("utf-8"),
-        )
+        with self._response_keys_lock:
+            responses_configuration = self.response_configuration
+            if response_type not in responses_configuration:
+                raise KeyError(
+                    f"Response type {response_type} does not exist in current responses.json"
+                )
 
-        if self.response_key_to_response_type is not None:
-            del self.response_key_to_response_type
+            config = responses_configuration[response_type]
+            if config.has_finalized_keys:
+                return
+            config.keys = sorted(response_keys)
+            config.has_finalized_keys = True
+            self._storage._write_transaction(
+                self._path / self._responses_file,
+                json.dumps(
+                    {
+                        c.response_type: c.to_dict()
+                        for c in responses_configuration.values()
+                    },
+                    default=str,
+                    indent=2,
+                ).encode("utf-8"),
+            )
 
-        if self.response_type_to_response_keys is not None:
-            del self.response_type_to_response_keys
+            self.__dict__.pop("response_key_to_response_type", None)
+            self.__dict__.pop("response_type_to_response_keys", None)
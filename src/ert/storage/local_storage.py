@@ -29,7 +29,7 @@
 
 logger = logging.getLogger(__name__)
 
-_LOCAL_STORAGE_VERSION = 9
+_LOCAL_STORAGE_VERSION = 10
 
 
 class _Migrations(BaseModel):
@@ -456,6 +456,7 @@ def _migrate(self, version: int) -> None:
             to7,
             to8,
             to9,
+            to10,
         )
 
         try:
@@ -500,7 +501,7 @@ def _migrate(self, version: int) -> None:
 
             elif version < _LOCAL_STORAGE_VERSION:
                 migrations = list(
-                    enumerate([to2, to3, to4, to5, to6, to7, to8, to9], start=1)
+                    enumerate([to2, to3, to4, to5, to6, to7, to8, to9, to10], start=1)
                 )
                 for from_version, migration in migrations[version - 1 :]:
                     print(f"* Updating storage to version: {from_version+1}")
@@ -0,0 +1,49 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+
+from ert.storage.local_ensemble import LocalEnsemble, _escape_filename
+from ert.storage.parameter_store import ParameterStore
+
+info = "Store parameters in one ensemble level file per parameter group"
+
+
+def _migrate_parameters_to_ensemble_level_store(path: Path) -> None:
+    for ensemble in path.glob("ensembles/*"):
+        with open(ensemble / "index.json", encoding="utf-8") as f:
+            ens_index = json.load(f)
+
+        experiment = path / "experiments" / ens_index["experiment_id"]
+        with open(experiment / "parameter.json", encoding="utf-8") as f:
+            parameter_groups = list(json.load(f))
+
+        for group in parameter_groups:
+            escaped = _escape_filename(group)
+            store = ParameterStore(
+                ensemble / LocalEnsemble.PARAMETERS_PATH / escaped, group
+            )
+            for real_dir in sorted(ensemble.glob("realization-*")):
+                nc_path = real_dir / f"{escaped}.nc"
+                if not nc_path.exists():
+                    continue
+
+                realization = int(real_dir.name.removeprefix("realization-"))
+                with xr.open_dataset(nc_path, engine="scipy") as ds:
+                    ds = ds.load()
+                if "realizations" not in ds.dims:
+                    ds = ds.expand_dims(realizations=[realization])
+                if not store.exists():
+                    store.create(
+                        ds.isel(realizations=0, drop=True),
+                        ens_index["ensemble_size"],
+                        path / "swp",
+                    )
+                store.save(np.array([realization]), ds)
+                os.remove(nc_path)
+
+
+def migrate(path: Path) -> None:
+    _migrate_parameters_to_ensemble_level_store(path)
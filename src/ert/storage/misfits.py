@@ -0,0 +1,45 @@
+"""Misfits between observations and the responses of an ensemble.
+
+The misfit of a response to an observation is the squared difference
+between them, normalized by the standard deviation of the observation,
+and signed by the direction of the difference. The misfits of all
+realizations are computed at once from the (observations x realizations)
+matrix of responses.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+
+def calculate_misfits(
+    observations: npt.ArrayLike,
+    std: npt.ArrayLike,
+    responses: npt.ArrayLike,
+) -> npt.NDArray[np.float64]:
+    """
+    The signed misfits of responses, which has one row per observation and
+    one column per realization. A missing (NaN) response gives a NaN misfit.
+    """
+    observations = np.asarray(observations, dtype=np.float64)
+    std = np.asarray(std, dtype=np.float64)
+    difference = np.asarray(responses, dtype=np.float64) - observations[:, None]
+    return np.sign(difference) * (difference / std[:, None]) ** 2
+
+
+def sum_misfits_by_group(
+    misfits: npt.NDArray[np.float64], groups: npt.ArrayLike
+) -> tuple[npt.NDArray[np.object_], npt.NDArray[np.float64]]:
+    """
+    The sum of the absolute misfits of each realization over the observations
+    in each group, where groups gives the group of each row of misfits.
+    Missing misfits are skipped. Returns the sorted group labels and a
+    (groups x realizations) matrix of sums.
+    """
+    labels, group_index = np.unique(
+        np.asarray(groups, dtype=object), return_inverse=True
+    )
+    sums = np.zeros((len(labels), misfits.shape[1]), dtype=np.float64)
+    np.add.at(sums, group_index.ravel(), np.nan_to_num(np.abs(misfits)))
+    return labels, sums
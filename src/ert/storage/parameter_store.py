@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+import threading
+from functools import cached_property
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import TYPE_CHECKING, BinaryIO
+from uuid import uuid4
+
+import numpy as np
+import xarray as xr
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+class _Variable(BaseModel):
+    dims: list[str]
+    shape: list[int]
+    dtype: str
+
+
+class _Index(BaseModel):
+    ensemble_size: int
+    variables: dict[str, _Variable]
+
+
+_creation_lock = threading.Lock()
+
+
+class ParameterStore:
+    """
+    Ensemble level storage of a single parameter group.
+
+    Every data variable of the group is stored as one ``.npy`` file with
+    the realization as the leading (slowest varying) axis, so that loading
+    any set of realizations is a single read of a memory-mapped array
+    instead of one file open per realization. Coordinates and attributes,
+    which are shared by all realizations, are stored once in ``coords.nc``.
+    Which realizations have been saved is tracked by ``realizations.npy``.
+
+    Saving a realization only writes the bytes belonging to that
+    realization, so different realizations can be saved concurrently.
+
+    The standard deviation over realizations of every variable is computed
+    on request and kept in ``std_dev/`` until the store is next saved to.
+    Every save writes a new token to ``generation``, and the standard
+    deviation is only used if it was computed from the current generation,
+    so it is never stale even if it was computed while a save was going on.
+    """
+
+    INDEX = "index.json"
+    COORDS = "coords.nc"
+    REALIZATIONS = "realizations.npy"
+    GENERATION = "generation"
+    STD_DEV = "std_dev"
+
+    def __init__(self, path: Path, name: str) -> None:
+        self.path = path
+        self.name = name
+
+    def exists(self) -> bool:
+        return (self.path / self.INDEX).exists()
+
+    @cached_property
+    def _index(self) -> _Index:
+        return _Index.model_validate_json(
+            (self.path / self.INDEX).read_text(encoding="utf-8")
+        )
+
+    @cached_property
+    def _coords(self) -> xr.Dataset:
+        with xr.open_dataset(self.path / self.COORDS, engine="scipy") as ds:
+            return ds.load()
+
+    @property
+    def ensemble_size(self) -> int:
+        return self._index.ensemble_size
+
+    def _variable_path(self, name: str) -> Path:
+        return self.path / f"{name}.npy"
+
+    def create(self, dataset: xr.Dataset, ensemble_size: int, swap: Path) -> None:
+        """
+        Create the store using dataset, which holds a single realization,
+        as template for the layout. The store is populated in a temporary
+        directory and moved into place, so that if several writers race to
+        create it, exactly one of them wins and the others reuse its layout.
+        """
+        index = _Index(
+            ensemble_size=ensemble_size,
+            variables={
+                str(name): _Variable(
+                    dims=[str(d) for d in var.dims],
+                    shape=list(var.shape),
+                    dtype=var.dtype.str,
+                )
+                for name, var in dataset.data_vars.items()
+            },
+        )
+        self._create(index, dataset.drop_vars(list(dataset.data_vars)), swap)
+
+    def create_like(
+        self, template: ParameterStore, ensemble_size: int, swap: Path
+    ) -> None:
+        """Create the store with the same layout as template"""
+        index = template._index.model_copy(update={"ensemble_size": ensemble_size})
+        self._create(index, template._coords, swap)
+
+    def _create(self, index: _Index, coords: xr.Dataset, swap: Path) -> None:
+        ensemble_size = index.ensemble_size
+        swap.mkdir(parents=True, exist_ok=True)
+        tmp = Path(mkdtemp(dir=swap))
+        try:
+            for name, var in index.variables.items():
+                np.lib.format.open_memmap(
+                    tmp / f"{name}.npy",
+                    mode="w+",
+                    dtype=np.dtype(var.dtype),
+                    shape=(ensemble_size, *var.shape),
+                ).flush()
+            np.lib.format.open_memmap(
+                tmp / self.REALIZATIONS,
+                mode="w+",
+                dtype=np.bool_,
+                shape=(ensemble_size,),
+            ).flush()
+            coords.to_netcdf(tmp / self.COORDS, engine="scipy")
+            (tmp / self.INDEX).write_text(index.model_dump_json(), encoding="utf-8")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with _creation_lock:
+                if not self.exists():
+                    os.rename(tmp, self.path)
+        except OSError:
+            if not self.exists():
+                raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def realizations(self) -> npt.NDArray[np.bool_]:
+        """Mask of the realizations that have been saved"""
+        if not self.exists():
+            return np.zeros(0, dtype=np.bool_)
+        return np.load(self.path / self.REALIZATIONS)
+
+    def _check_realizations(self, realizations: npt.NDArray[np.int_]) -> None:
+        saved = self.realizations()
+        for realization in realizations:
+            if not 0 <= realization < len(saved) or not saved[realization]:
+                raise KeyError(
+                    f"No dataset '{self.name}' in storage "
+                    f"for realization {realization}"
+                )
+
+    def load(self, realizations: npt.NDArray[np.int_] | None = None) -> xr.Dataset:
+        """
+        Load the given realizations, or all saved realizations if None,
+        as a dataset with a leading 'realizations' dimension.
+        """
+        if realizations is None:
+            realizations = np.flatnonzero(self.realizations())
+            if realizations.size == 0:
+                raise KeyError(f"No dataset '{self.name}' in storage")
+        else:
+            realizations = np.asarray(realizations, dtype=np.int_)
+            self._check_realizations(realizations)
+            if not self.exists():
+                raise KeyError(f"No dataset '{self.name}' in storage")
+
+        data_vars = {
+            name: (
+                ["realizations", *var.dims],
+                np.load(self._variable_path(name), mmap_mode="r")[realizations],
+            )
+            for name, var in self._index.variables.items()
+        }
+        return xr.Dataset(
+            data_vars,
+            coords={"realizations": realizations, **self._coords.coords},
+            attrs=self._coords.attrs,
+        )
+
+    def save(self, realizations: npt.NDArray[np.int_], dataset: xr.Dataset) -> None:
+        """
+        Save dataset, which has a leading 'realizations' dimension matching
+        realizations, into the rows of the store belonging to realizations.
+        """
+        realizations = np.asarray(realizations, dtype=np.int_)
+        outside = realizations[
+            (realizations < 0) | (realizations >= self.ensemble_size)
+        ]
+        if outside.size:
+            raise ValueError(
+                f"Realization {outside[0]} is outside of ensemble "
+                f"of size {self.ensemble_size}"
+            )
+        if set(dataset.data_vars) != set(self._index.variables):
+            raise ValueError(
+                f"Dataset for '{self.name}' has variables "
+                f"{sorted(map(str, dataset.data_vars))}, "
+                f"expected {sorted(self._index.variables)}"
+            )
+        dataset = self._align_coords(dataset)
+        for name, var in self._index.variables.items():
+            values = dataset[name].transpose("realizations", *var.dims).values
+            if list(values.shape) != [len(realizations), *var.shape]:
+                raise ValueError(
+                    f"Variable '{name}' of '{self.name}' has shape "
+                    f"{values.shape[1:]}, expected {tuple(var.shape)}"
+                )
+            self._write_rows(
+                self._variable_path(name),
+                realizations,
+                np.ascontiguousarray(values, dtype=np.dtype(var.dtype)),
+            )
+        self._write_rows(
+            self.path / self.REALIZATIONS,
+            realizations,
+            np.ones(len(realizations), dtype=np.bool_),
+        )
+        self._new_generation()
+        self._remove_std_dev()
+
+    def _align_coords(self, dataset: xr.Dataset) -> xr.Dataset:
+        """
+        The coordinates are stored once, so dataset is reindexed to the
+        order of the stored coordinates of a dimension, and any other
+        difference in coordinates is an error.
+        """
+        for name, stored in self._coords.coords.items():
+            if name not in dataset.coords:
+                continue
+            values = dataset.coords[name].values
+            if np.array_equal(values, stored.values):
+                continue
+            if (
+                name in dataset.indexes
+                and dataset.indexes[name].is_unique
+                and len(values) == len(stored)
+                and set(values.tolist()) == set(stored.values.tolist())
+            ):
+                dataset = dataset.reindex({name: stored.values})
+                continue
+            raise ValueError(
+                f"Coordinate '{name}' of '{self.name}' is {values.tolist()}, "
+                f"expected {stored.values.tolist()}"
+            )
+        return dataset
+
+    def save_product(
+        self,
+        source: ParameterStore,
+        realizations: npt.NDArray[np.int_],
+        matrix: npt.NDArray[np.float64],
+        chunk_size: int,
+    ) -> None:
+        """
+        Save X @ matrix into the rows of the store belonging to realizations,
+        where X holds the values of each variable in source with one column
+        per realization in realizations. Only chunk_size values of each
+        realization are read into memory at a time.
+        """
+        realizations = np.asarray(realizations, dtype=np.int_)
+        source._check_realizations(realizations)
+        if self._index.variables != source._index.variables:
+            raise ValueError(
+                f"Parameter group '{self.name}' does not have the layout of "
+                f"'{source.name}'"
+            )
+        for name, var in self._index.variables.items():
+            dtype = np.dtype(var.dtype)
+            size = int(np.prod(var.shape))
+            matrix_t = np.ascontiguousarray(matrix.T, dtype=dtype)
+            with (
+                open(source._variable_path(name), "rb") as input_file,
+                open(self._variable_path(name), "r+b") as output_file,
+            ):
+                input_offset = self._data_offset(input_file)
+                output_offset = self._data_offset(output_file)
+                for start in range(0, size, chunk_size):
+                    count = min(chunk_size, size - start)
+                    chunk = np.empty((len(realizations), count), dtype=dtype)
+                    for i, realization in enumerate(realizations):
+                        input_file.seek(
+                            input_offset
+                            + (int(realization) * size + start) * dtype.itemsize
+                        )
+                        input_file.readinto(memoryview(chunk[i]).cast("B"))
+                    chunk = matrix_t @ chunk
+                    for i, realization in enumerate(realizations):
+                        output_file.seek(
+                            output_offset
+                            + (int(realization) * size + start) * dtype.itemsize
+                        )
+                        output_file.write(chunk[i].tobytes())
+        self._write_rows(
+            self.path / self.REALIZATIONS,
+            realizations,
+            np.ones(len(realizations), dtype=np.bool_),
+        )
+        self._new_generation()
+        self._remove_std_dev()
+
+    def std_dev(self, swap: Path) -> xr.Dataset:
+        """
+        The standard deviation over all saved realizations of every variable,
+        computed in a single pass over the realizations, so that only one
+        realization of a variable is in memory at a time. The result is
+        stored, and returned as memory-mapped arrays so that slices of it can
+        be read without reading all of it.
+        """
+        generation = self.generation()
+        saved = self.realizations()
+        if not saved.any():
+            raise KeyError(f"No dataset '{self.name}' in storage")
+        std_path = self.path / self.STD_DEV
+        with contextlib.suppress(FileNotFoundError):
+            if (std_path / self.GENERATION).read_text(encoding="utf-8") == generation:
+                return self._load_std_dev()
+
+        swap.mkdir(parents=True, exist_ok=True)
+        tmp = Path(mkdtemp(dir=swap))
+        try:
+            for name in self._index.variables:
+                np.save(tmp / f"{name}.npy", self._welford_std(name, saved))
+            (tmp / self.GENERATION).write_text(generation, encoding="utf-8")
+            self._remove_std_dev()
+            with contextlib.suppress(OSError):
+                # Another reader may have computed it at the same time
+                os.rename(tmp, std_path)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        return self._load_std_dev()
+
+    def _welford_std(
+        self, name: str, saved: npt.NDArray[np.bool_]
+    ) -> npt.NDArray[np.float64]:
+        values = np.load(self._variable_path(name), mmap_mode="r")
+        count = np.zeros(values.shape[1:], dtype=np.int64)
+        mean = np.zeros(values.shape[1:], dtype=np.float64)
+        m2 = np.zeros(values.shape[1:], dtype=np.float64)
+        for realization in np.flatnonzero(saved):
+            x = np.asarray(values[realization], dtype=np.float64)
+            # Missing values are skipped, as in xarray
+            valid = ~np.isnan(x)
+            count += valid
+            delta = np.where(valid, x - mean, 0.0)
+            mean += delta / np.maximum(count, 1)
+            m2 += delta * np.where(valid, x - mean, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count > 0, np.sqrt(m2 / count), np.nan)
+
+    def _load_std_dev(self) -> xr.Dataset:
+        std_path = self.path / self.STD_DEV
+        return xr.Dataset(
+            {
+                name: (
+                    var.dims,
+                    np.load(std_path / f"{name}.npy", mmap_mode="r"),
+                )
+                for name, var in self._index.variables.items()
+            },
+            coords=self._coords.coords,
+            attrs=self._coords.attrs,
+        )
+
+    def generation(self) -> str:
+        """Token that changes every time the store is saved to"""
+        try:
+            return (self.path / self.GENERATION).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return ""
+
+    def _new_generation(self) -> None:
+        tmp = self.path / f"{self.GENERATION}.{uuid4().hex}"
+        tmp.write_text(uuid4().hex, encoding="utf-8")
+        os.replace(tmp, self.path / self.GENERATION)
+
+    def _remove_std_dev(self) -> None:
+        shutil.rmtree(self.path / self.STD_DEV, ignore_errors=True)
+
+    @staticmethod
+    def _write_rows(
+        path: Path, rows: npt.NDArray[np.int_], values: npt.NDArray[np.generic]
+    ) -> None:
+        """
+        Write values[i] into row rows[i] of the .npy file at path, opening
+        the file once and writing runs of consecutive rows in one call.
+        """
+        row_size = values.nbytes // max(len(rows), 1)
+        order = np.argsort(rows, kind="stable")
+        rows, values = rows[order], values[order]
+        with open(path, "r+b") as f:
+            offset = ParameterStore._data_offset(f)
+            runs = np.flatnonzero(np.diff(rows) != 1) + 1
+            for start, stop in zip([0, *runs], [*runs, len(rows)], strict=True):
+                f.seek(offset + int(rows[start]) * row_size)
+                f.write(values[start:stop].tobytes())
+
+    @staticmethod
+    def _data_offset(f: BinaryIO) -> int:
+        """The offset of the data of the .npy file f, past its header"""
+        f.seek(0)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            np.lib.format.read_array_header_1_0(f)
+        else:
+            np.lib.format.read_array_header_2_0(f)
+        return f.tell()
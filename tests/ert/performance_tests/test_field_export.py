@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ert.config import Field
+from ert.field_utils import FieldFileFormat, Shape, read_field
+
+
+@pytest.fixture
+def large_field(monkeypatch):
+    shape = Shape(250, 200, 200)
+    mask = np.zeros((shape.nx, shape.ny, shape.nz), dtype=bool)
+    mask[:, :, :10] = True
+    monkeypatch.setattr("ert.config.field.read_mask", lambda _: (mask, shape))
+    return Field(
+        name="PERMX",
+        forward_init=False,
+        nx=shape.nx,
+        ny=shape.ny,
+        nz=shape.nz,
+        file_format=FieldFileFormat.BGRDECL,
+        output_transformation="EXP",
+        input_transformation=None,
+        truncation_min=0.1,
+        truncation_max=10.0,
+        forward_init_file="",
+        output_file=Path("permx.bgrdecl"),
+        grid_file="grid.EGRID",
+        update=True,
+    )
+
+
+@pytest.mark.integration_test
+def test_field_export_of_10_million_cells(benchmark, large_field, storage, tmp_path):
+    ensemble = storage.create_experiment(parameters=[large_field]).create_ensemble(
+        name="prior", ensemble_size=1
+    )
+    rng = np.random.default_rng(42)
+    values = rng.standard_normal(len(large_field), dtype=np.float32)
+    large_field.save_parameters(ensemble, large_field.name, 0, values)
+
+    benchmark(large_field.write_to_runpath, tmp_path / "runpath", 0, ensemble)
+
+    exported = read_field(
+        tmp_path / "runpath" / "permx.bgrdecl",
+        large_field.name,
+        large_field.mask,
+        Shape(large_field.nx, large_field.ny, large_field.nz),
+    )
+    np.testing.assert_allclose(
+        exported.compressed(), np.clip(np.exp(values), 0.1, 10.0), rtol=1e-6
+    )
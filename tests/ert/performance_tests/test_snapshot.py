@@ -1,12 +1,15 @@
 import pytest
 
 from _ert.events import (
+    EESnapshotUpdate,
     EnsembleStarted,
     ForwardModelStepRunning,
     ForwardModelStepStart,
     ForwardModelStepSuccess,
     RealizationSuccess,
     RealizationWaiting,
+    event_from_json,
+    event_to_json,
 )
 from ert.ensemble_evaluator import state
 from ert.ensemble_evaluator.snapshot import (
@@ -105,3 +108,52 @@ def simulate_forward_model_event_handling(
 
     for real in range(ensemble_size):
         snapshot.update_from_event(RealizationSuccess(ensemble=ens_id, real=str(real)))
+
+
+@pytest.mark.parametrize(
+    "ensemble_size, forward_models",
+    [
+        (100, 20),
+        (1000, 20),
+    ],
+)
+def test_snapshot_update_round_trip(benchmark, ensemble_size, forward_models):
+    """Memory usage reports of all running forward model steps, sent from the
+    evaluator and merged into the snapshot of the run model"""
+    full_snapshot = EnsembleSnapshot()
+    for real in range(ensemble_size):
+        realization = RealizationSnapshot(
+            active=True, status=state.REALIZATION_STATE_RUNNING, fm_steps={}
+        )
+        for fm_idx in range(forward_models):
+            realization["fm_steps"][str(fm_idx)] = FMStepSnapshot(
+                status=state.FORWARD_MODEL_STATE_RUNNING,
+                index=str(fm_idx),
+                name=f"FM_{fm_idx}",
+            )
+        full_snapshot.add_realization(str(real), realization)
+
+    update = EnsembleSnapshot()
+    for real in range(ensemble_size):
+        for fm_idx in range(forward_models):
+            update.update_from_event(
+                ForwardModelStepRunning(
+                    ensemble="A",
+                    real=str(real),
+                    fm_step=str(fm_idx),
+                    max_memory_usage=real,
+                    current_memory_usage=real,
+                )
+            )
+
+    def round_trip():
+        message = event_to_json(
+            EESnapshotUpdate(snapshot=update.to_dict(), ensemble="A")
+        )
+        event = event_from_json(message)
+        received = EnsembleSnapshot.from_nested_dict(event.snapshot)
+        full_snapshot.merge_snapshot(received)
+        return received
+
+    received = benchmark(round_trip)
+    assert len(received.get_all_fm_steps()) == ensemble_size * forward_models
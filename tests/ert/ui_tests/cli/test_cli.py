@@ -961,7 +961,7 @@ def raise_connection_error(*args, **kwargs):
         raise zmq.error.ZMQError(None, None)
 
     with patch(
-        "ert.ensemble_evaluator.evaluator.dispatch_event_from_json",
+        "ert.ensemble_evaluator.evaluator.dispatch_events_from_json",
         raise_connection_error,
     ):
         run_cli(
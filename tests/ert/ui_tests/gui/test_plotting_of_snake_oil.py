@@ -105,6 +105,10 @@ def plot_figure(qtbot, heat_equation_storage, snake_oil_case_storage, request):
                                     2000 / tab._figure.get_dpi(),
                                     1000 / tab._figure.get_dpi(),
                                 )
+                            qtbot.waitUntil(
+                                lambda: not plot_window._data_loader.loading,
+                                timeout=20000,
+                            )
                             yield tab._figure.figure
                         else:
                             assert (
@@ -567,10 +567,8 @@ def test_temporary_parameter_storage_with_inactive_fields(
         ensemble, param_ensemble_array, param_group, realization_list
     )
     for iens in range(prior_ensemble.ensemble_size):
-        ds = xr.open_dataset(
-            ensemble._path / f"realization-{iens}" / f"{param_group}.nc", engine="scipy"
-        )
-        np.testing.assert_array_equal(ds["values"].values[0], fields[iens]["values"])
+        ds = ensemble.load_parameters(param_group, iens)
+        np.testing.assert_array_equal(ds["values"].values, fields[iens]["values"])
 
 
 def _mock_load_observations_and_responses(
@@ -917,3 +915,175 @@ def test_update_subset_parameters(storage, uniform_parameter, obs):
     assert not prior.load_parameters("PARAMETER", 0)["values"].equals(
         posterior_ens.load_parameters("PARAMETER", 0)["values"]
     )
+
+
+@pytest.mark.parametrize("localization", [True, False])
+def test_that_update_does_not_depend_on_number_of_workers(
+    storage, obs, localization, monkeypatch
+):
+    # Make several localization batches regardless of available memory
+    monkeypatch.setattr(
+        "ert.analysis._es_update._calculate_adaptive_batch_size",
+        lambda num_params, num_obs, num_workers: 3,
+    )
+    parameters = [
+        GenKwConfig(
+            name=f"PARAMETER_{group}",
+            forward_init=False,
+            template_file="",
+            transform_function_definitions=[
+                TransformFunctionDefinition(f"KEY{i}", "NORMAL", [0, 1])
+                for i in range(10)
+            ],
+            output_file=None,
+            update=True,
+        )
+        for group in range(3)
+    ]
+    experiment = storage.create_experiment(
+        parameters=parameters,
+        responses=[GenDataConfig(keys=["RESPONSE"])],
+        observations={"gen_data": obs},
+    )
+    prior = storage.create_ensemble(experiment, ensemble_size=20, name="prior")
+    rng = np.random.default_rng(42)
+    for param in parameters:
+        param.save_parameters_bulk(
+            prior, param.name, np.arange(20), rng.standard_normal((10, 20))
+        )
+    for iens in range(prior.ensemble_size):
+        prior.save_response(
+            "gen_data",
+            polars.DataFrame(
+                {
+                    "response_key": "RESPONSE",
+                    "report_step": polars.Series([0] * 3, dtype=polars.UInt16),
+                    "index": polars.Series(range(3), dtype=polars.UInt16),
+                    "values": polars.Series(
+                        rng.uniform(0.5, 1.5, 3), dtype=polars.Float32
+                    ),
+                }
+            ),
+            iens,
+        )
+
+    def update(max_workers):
+        posterior = storage.create_ensemble(
+            experiment,
+            ensemble_size=prior.ensemble_size,
+            iteration=1,
+            name=f"posterior_{max_workers}",
+            prior_ensemble=prior,
+        )
+        smoother_update(
+            prior,
+            posterior,
+            ["OBSERVATION"],
+            [param.name for param in parameters],
+            UpdateSettings(),
+            ESSettings(localization=localization, max_workers=max_workers),
+            rng=np.random.default_rng(1234),
+        )
+        updated = [
+            _load_param_ensemble_array(posterior, param.name, np.arange(20))
+            for param in parameters
+        ]
+        correlations = None
+        if localization:
+            with xr.open_dataset(prior.mount_point / "corr_XY.nc") as dataset:
+                correlations = dataset.load()
+        return updated, correlations
+
+    sequential, sequential_correlations = update(1)
+    parallel, parallel_correlations = update(4)
+    for sequential_group, parallel_group in zip(sequential, parallel, strict=True):
+        np.testing.assert_array_equal(sequential_group, parallel_group)
+    if localization:
+        xr.testing.assert_identical(sequential_correlations, parallel_correlations)
+
+
+def test_that_field_updated_in_chunks_equals_field_updated_in_memory(
+    storage, obs, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    shape = Shape(10, 10, 3)
+    grid = xtgeo.create_box_grid(dimension=(shape.nx, shape.ny, shape.nz))
+    mask = grid.get_actnum()
+    rng = np.random.default_rng(42)
+    mask_list = rng.choice([True, False], shape.nx * shape.ny * shape.nz)
+    mask.values = mask_list
+    grid.set_actnum(mask)
+    grid.to_file("MY_EGRID.EGRID", "egrid")
+    field = Field.from_config_list(
+        "MY_EGRID.EGRID",
+        shape,
+        [
+            "PARAM_FIELD",
+            "PARAM_FIELD",
+            "param.GRDECL",
+            "INIT_FILES:param_%d.GRDECL",
+            "FORWARD_INIT:False",
+        ],
+    )
+    experiment = storage.create_experiment(
+        parameters=[field],
+        responses=[GenDataConfig(keys=["RESPONSE"])],
+        observations={"gen_data": obs},
+    )
+    prior = storage.create_ensemble(experiment, ensemble_size=10, name="prior")
+    field.save_parameters_bulk(
+        prior,
+        field.name,
+        np.arange(prior.ensemble_size),
+        rng.standard_normal((np.count_nonzero(mask_list), prior.ensemble_size)),
+    )
+    # Realization 3 has failed and is left out of the update
+    for iens in [0, 1, 2, 4, 5, 6, 7, 8, 9]:
+        prior.save_response(
+            "gen_data",
+            polars.DataFrame(
+                {
+                    "response_key": "RESPONSE",
+                    "report_step": polars.Series([0] * 3, dtype=polars.UInt16),
+                    "index": polars.Series(range(3), dtype=polars.UInt16),
+                    "values": polars.Series(
+                        rng.uniform(0.5, 1.5, 3), dtype=polars.Float32
+                    ),
+                }
+            ),
+            iens,
+        )
+
+    def update(field_chunk_size):
+        posterior = storage.create_ensemble(
+            experiment,
+            ensemble_size=prior.ensemble_size,
+            iteration=1,
+            name=f"posterior_{field_chunk_size}",
+            prior_ensemble=prior,
+        )
+        smoother_update(
+            prior,
+            posterior,
+            ["OBSERVATION"],
+            [field.name],
+            UpdateSettings(),
+            ESSettings(field_chunk_size=field_chunk_size),
+            rng=np.random.default_rng(1234),
+        )
+        return posterior
+
+    in_memory = update(None)
+    in_chunks = update(7)
+    active = np.array([0, 1, 2, 4, 5, 6, 7, 8, 9])
+    np.testing.assert_allclose(
+        in_chunks.load_parameters(field.name, active)["values"].values,
+        in_memory.load_parameters(field.name, active)["values"].values,
+        rtol=1e-5,
+    )
+    assert not in_chunks.get_realization_mask_with_parameters()[3]
+    assert not np.allclose(
+        in_chunks.load_parameters(field.name, 0)["values"].values,
+        prior.load_parameters(field.name, 0)["values"].values,
+        equal_nan=True,
+    )
@@ -200,6 +200,18 @@ def test_unknown_variable_raises_validation_error():
         )
 
 
+def test_max_workers_is_set_from_analysis_set_var():
+    assert AnalysisConfig.from_dict({}).es_module.max_workers == 1
+    analysis_config = AnalysisConfig.from_dict(
+        {ConfigKeys.ANALYSIS_SET_VAR: [["STD_ENKF", "MAX_WORKERS", "8"]]}
+    )
+    assert analysis_config.es_module.max_workers == 8
+    with pytest.raises(ConfigValidationError, match="greater than or equal to 1"):
+        AnalysisConfig.from_dict(
+            {ConfigKeys.ANALYSIS_SET_VAR: [["STD_ENKF", "MAX_WORKERS", "0"]]}
+        )
+
+
 def test_default_alpha_is_set():
     default_alpha = 3.0
     assert AnalysisConfig.from_dict({}).observation_settings.alpha == default_alpha
@@ -1,11 +1,12 @@
 import os
 from pathlib import Path
 
+import numpy as np
 import pytest
 import xtgeo
 
 from ert.config import ConfigValidationError, ConfigWarning, Field
-from ert.config.field import TRANSFORM_FUNCTIONS
+from ert.config.field import TRANSFORM_FUNCTIONS, _field_truncate
 from ert.config.parsing import init_user_config_schema, parse
 from ert.enkf_main import sample_prior
 from ert.field_utils import Shape, read_field
@@ -56,6 +57,64 @@ def test_write_to_runpath_produces_the_transformed_field_in_storage(
         assert not os.path.isfile(f"export/with/path/{real}/permx.grdecl")
 
 
+def test_field_parameters_are_gathered_and_scattered_by_the_active_index(
+    tmp_path, storage
+):
+    shape = Shape(4, 3, 2)
+    grid = xtgeo.create_box_grid(dimension=(shape.nx, shape.ny, shape.nz))
+    actnum = grid.get_actnum()
+    mask = np.random.default_rng(42).choice(
+        [True, False], shape.nx * shape.ny * shape.nz
+    )
+    actnum.values = mask
+    grid.set_actnum(actnum)
+    grid.to_file(tmp_path / "MY_EGRID.EGRID", "egrid")
+    field = Field.from_config_list(
+        str(tmp_path / "MY_EGRID.EGRID"),
+        shape,
+        ["PERMX", "PERMX", "permx.grdecl", "INIT_FILES:permx%d.grdecl"],
+    )
+    ensemble = storage.create_experiment(parameters=[field]).create_ensemble(
+        name="prior", ensemble_size=2
+    )
+
+    field = ensemble.experiment.parameter_configuration["PERMX"]
+    assert field.mask_file.with_name("grid_active_index.npy").exists()
+    np.testing.assert_array_equal(
+        field.active_index, np.flatnonzero(~field.mask.ravel())
+    )
+    assert len(field) == np.count_nonzero(mask)
+
+    data = np.arange(2 * len(field), dtype=np.float32).reshape(len(field), 2)
+    field.save_parameters_bulk(ensemble, "PERMX", np.array([0, 1]), data)
+    np.testing.assert_array_equal(
+        field.load_parameters(ensemble, "PERMX", np.array([0, 1])), data
+    )
+    for real in [0, 1]:
+        values = ensemble.load_parameters("PERMX", real)["values"].values
+        np.testing.assert_array_equal(
+            np.ma.MaskedArray(values, mask=field.mask).compressed(), data[:, real]
+        )
+        assert np.isnan(values[field.mask]).all()
+
+
+@pytest.mark.parametrize(
+    "min_, max_, expected",
+    [
+        (None, None, [-2.0, 0.5, 3.0, np.nan]),
+        (0.0, None, [0.0, 0.5, 3.0, np.nan]),
+        (None, 1.0, [-2.0, 0.5, 1.0, np.nan]),
+        (0.0, 1.0, [0.0, 0.5, 1.0, np.nan]),
+        (1.0, 0.0, [1.0, 1.0, 1.0, np.nan]),
+    ],
+)
+def test_field_truncate_clips_values_and_keeps_nan(min_, max_, expected):
+    data = np.array([-2.0, 0.5, 3.0, np.nan], dtype=np.float32)
+    np.testing.assert_array_equal(
+        _field_truncate(data, min_, max_), np.array(expected, dtype=np.float32)
+    )
+
+
 @pytest.fixture
 def grid_shape():
     return Shape(2, 3, 4)
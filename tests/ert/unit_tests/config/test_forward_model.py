@@ -205,6 +205,24 @@ def test_forward_model_env_and_exec_env_is_set():
     assert forward_model.exec_env["c1"] == "d1"
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_parallel_group_is_passed_on_to_the_forward_model_json():
+    with open("exec", "w", encoding="utf-8") as f:
+        pass
+
+    os.chmod("exec", stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+    with open("CONFIG", "w", encoding="utf-8") as f:
+        f.write("EXECUTABLE exec\nPARALLEL_GROUP exports\n")
+    forward_model = _forward_model_step_from_config_file("CONFIG")
+
+    assert forward_model.parallel_group == "exports"
+    fm_json = create_forward_model_json(
+        context=Substitutions(), forward_model_steps=[forward_model], run_id=None
+    )
+    assert fm_json["jobList"][0]["parallel_group"] == "exports"
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_forward_model_stdout_stderr_defaults_to_filename():
     with open("exec", "w", encoding="utf-8") as f:
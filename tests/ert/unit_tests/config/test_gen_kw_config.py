@@ -1,8 +1,10 @@
+import itertools
 import os
 import re
 from pathlib import Path
 from textwrap import dedent
 
+import numpy as np
 import pytest
 from lark import Token
 
@@ -681,3 +683,57 @@ def test_validation_triangular_distribution(
                 ErtConfig.from_file("config.ert")
         else:
             ErtConfig.from_file("config.ert")
+
+
+def test_that_sampling_all_realizations_at_once_equals_sampling_one_at_a_time():
+    keys = ["KEY1", "KEY2", "KEY3"]
+    realizations = np.array([0, 3, 4, 7, 1])
+    sampled = GenKwConfig._sample_values("GROUP", keys, "1234", realizations)
+    assert sampled.shape == (len(keys), len(realizations))
+    for column, realization in enumerate(realizations):
+        np.testing.assert_array_equal(
+            sampled[:, column],
+            GenKwConfig._sample_value("GROUP", keys, "1234", realization),
+        )
+
+
+@pytest.mark.parametrize(
+    "distribution, parameters",
+    [
+        ("NORMAL", ["0", "1"]),
+        ("LOGNORMAL", ["0", "1"]),
+        ("TRUNCATED_NORMAL", ["0", "1", "-0.5", "0.5"]),
+        ("TRIANGULAR", ["0", "1", "3"]),
+        ("UNIFORM", ["0", "1"]),
+        ("DUNIF", ["5", "1", "2"]),
+        ("ERRF", ["1", "2", "0.1", "0.5"]),
+        ("DERRF", ["5", "1", "2", "0.1", "0.5"]),
+        ("LOGUNIF", ["0.1", "10"]),
+        ("CONST", ["3"]),
+        ("RAW", []),
+    ],
+)
+def test_that_transforming_arrays_equals_transforming_each_value(
+    distribution, parameters
+):
+    conf = GenKwConfig(
+        name="KW",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition("KEY1", distribution, parameters),
+            TransformFunctionDefinition("KEY2", "NORMAL", ["1", "2"]),
+        ],
+        output_file="kw.txt",
+        update=True,
+    )
+    values = np.random.default_rng(42).standard_normal((2, 10))
+    transformed = conf.transform(values)
+    assert transformed.shape == values.shape
+    for (row, tf), column in itertools.product(
+        enumerate(conf.transform_functions), range(values.shape[1])
+    ):
+        assert transformed[row, column] == pytest.approx(
+            tf.calculate(float(values[row, column]), list(tf.parameter_list.values())),
+            rel=1e-15,
+        )
@@ -413,3 +413,47 @@ def test_default_max_runtime_is_unlimited():
 def test_max_runtime_is_set_from_corresponding_keyword(value):
     assert QueueConfig.from_dict({ConfigKeys.MAX_RUNTIME: value}).max_runtime == value
     assert QueueConfig(max_runtime=value).max_runtime == value
+
+
+@given(st.integers(min_value=1))
+def test_max_parallel_internalization_is_set_from_corresponding_keyword(value):
+    assert (
+        QueueConfig.from_dict(
+            {ConfigKeys.MAX_PARALLEL_INTERNALIZATION: value}
+        ).max_parallel_internalization
+        == value
+    )
+    assert QueueConfig.from_dict({}).max_parallel_internalization == 4
+
+
+@pytest.mark.parametrize("mode", ["MD5", "BLAKE2B", "QUICK"])
+def test_checksum_mode_is_set_from_corresponding_keyword(mode):
+    ert_config = ErtConfig.from_file_contents(
+        f"NUM_REALIZATIONS 1\nCHECKSUM_MODE {mode}\n"
+    )
+    assert ert_config.queue_config.checksum_mode == mode
+    assert QueueConfig.from_dict({}).checksum_mode == "MD5"
+
+
+def test_that_invalid_checksum_mode_raises_validation_error():
+    with pytest.raises(
+        expected_exception=ConfigValidationError,
+        match=r"'CHECKSUM_MODE' argument 1 must be one of .* was 'SHA1'",
+    ):
+        ErtConfig.from_file_contents("NUM_REALIZATIONS 1\nCHECKSUM_MODE SHA1\n")
+
+
+def test_memory_poll_period_is_set_from_corresponding_keyword():
+    ert_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\nMEMORY_POLL_PERIOD 0.5\n"
+    )
+    assert ert_config.queue_config.memory_poll_period == 0.5
+    assert QueueConfig.from_dict({}).memory_poll_period == 5.0
+
+
+def test_consolidate_responses_is_set_from_corresponding_keyword():
+    ert_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\nCONSOLIDATE_RESPONSES True\n"
+    )
+    assert ert_config.queue_config.consolidate_responses
+    assert not QueueConfig.from_dict({}).consolidate_responses
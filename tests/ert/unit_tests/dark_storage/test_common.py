@@ -1,10 +1,13 @@
 import datetime
 
+import numpy as np
 import pandas as pd
 import polars
 import pytest
 
-from ert.config import GenDataConfig, SummaryConfig
+from ert.config import GenDataConfig, GenKwConfig, SummaryConfig
+from ert.config.gen_kw_config import TransformFunctionDefinition
+from ert.dark_storage.cache import ResponseCache
 from ert.dark_storage.common import data_for_key
 from ert.storage import open_storage
 from tests.ert.unit_tests.config.summary_generator import (
@@ -129,3 +132,111 @@ def test_data_for_key_returns_empty_gen_data_config(tmp_path):
         ensemble.refresh_ensemble_state()
         data = data_for_key(ensemble, "response@0")
         assert not data.empty
+
+
+def _save_fgpr(ensemble, realization, values):
+    ensemble.save_response(
+        "summary",
+        polars.DataFrame(
+            {
+                "response_key": ["FGPR"] * len(values),
+                "time": polars.Series(
+                    [datetime.datetime(2000, 1, i + 1) for i in range(len(values))],
+                    dtype=polars.Datetime("ms"),
+                ),
+                "values": polars.Series(values, dtype=polars.Float32),
+            }
+        ),
+        realization,
+    )
+    ensemble.refresh_ensemble_state()
+
+
+def test_response_cache_is_invalidated_when_ensemble_state_changes(tmp_path):
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        summary_config = SummaryConfig(
+            name="summary", input_files=["CASE"], keys=["FGPR"]
+        )
+        experiment = storage.create_experiment(responses=[summary_config])
+        ensemble = experiment.create_ensemble(name="ensemble", ensemble_size=2)
+        _save_fgpr(ensemble, 0, [0.0, 1.0])
+        cache = ResponseCache()
+
+        first = cache.data_for_key(ensemble, "FGPR")
+        assert cache.data_for_key(ensemble, "FGPR") is first
+        assert (cache.metrics.hits, cache.metrics.misses) == (1, 1)
+
+        _save_fgpr(ensemble, 1, [2.0, 3.0])
+        updated = cache.data_for_key(ensemble, "FGPR")
+        assert list(updated.index) == [0, 1]
+        assert (cache.metrics.hits, cache.metrics.misses) == (1, 2)
+
+        cache.invalidate(ensemble.id)
+        cache.data_for_key(ensemble, "FGPR")
+        assert (cache.metrics.hits, cache.metrics.misses) == (1, 3)
+
+
+def test_response_cache_is_invalidated_when_responses_are_saved_again(tmp_path):
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        summary_config = SummaryConfig(
+            name="summary", input_files=["CASE"], keys=["FGPR"]
+        )
+        experiment = storage.create_experiment(responses=[summary_config])
+        ensemble = experiment.create_ensemble(name="ensemble", ensemble_size=1)
+        _save_fgpr(ensemble, 0, [0.0, 1.0])
+        cache = ResponseCache()
+        cache.data_for_key(ensemble, "FGPR")
+
+        _save_fgpr(ensemble, 0, [2.0, 3.0])
+        assert cache.data_for_key(ensemble, "FGPR").loc[0].tolist() == [2.0, 3.0]
+        assert (cache.metrics.hits, cache.metrics.misses) == (0, 2)
+
+
+def test_response_cache_is_invalidated_when_parameters_are_saved_again(tmp_path):
+    parameter = GenKwConfig(
+        name="PARAMETER",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+        ],
+        output_file="kw.txt",
+        update=True,
+    )
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[parameter])
+        ensemble = experiment.create_ensemble(name="ensemble", ensemble_size=1)
+        parameter.save_parameters(ensemble, "PARAMETER", 0, np.array([0.0]))
+        cache = ResponseCache()
+        cache.data_for_key(ensemble, "PARAMETER:KEY1")
+
+        parameter.save_parameters(ensemble, "PARAMETER", 0, np.array([1.0]))
+        assert cache.data_for_key(ensemble, "PARAMETER:KEY1").loc[0].tolist() == [
+            pytest.approx(parameter.transform(np.array([1.0]))[0])
+        ]
+        assert (cache.metrics.hits, cache.metrics.misses) == (0, 2)
+
+
+def test_response_cache_evicts_least_recently_used_entries(tmp_path):
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[
+                SummaryConfig(name="summary", input_files=["CASE"], keys=["FGPR"])
+            ]
+        )
+        ensembles = [
+            experiment.create_ensemble(name=f"ensemble_{i}", ensemble_size=1)
+            for i in range(3)
+        ]
+        for ensemble in ensembles:
+            _save_fgpr(ensemble, 0, [0.0, 1.0])
+        size = int(data_for_key(ensembles[0], "FGPR").memory_usage(deep=True).sum())
+        cache = ResponseCache(max_bytes=2 * size)
+
+        for ensemble in [ensembles[0], ensembles[1], ensembles[0], ensembles[2]]:
+            cache.data_for_key(ensemble, "FGPR")
+
+        assert cache.metrics.evictions == 1
+        assert cache.metrics.size == 2 * size
+        cache.data_for_key(ensembles[0], "FGPR")
+        assert cache.metrics.hits == 2
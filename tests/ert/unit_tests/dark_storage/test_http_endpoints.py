@@ -1,7 +1,9 @@
 import io
 import json
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from numpy.testing import assert_array_equal
 from requests import Response
@@ -114,6 +116,25 @@ def test_get_response(poly_example_tmp_dir, dark_storage_client):
     assert len(record_df1.columns) == 10
     assert len(record_df1.index) == 3
 
+    resp: Response = dark_storage_client.get(
+        f"/ensembles/{ensemble_id1}/records/POLY_RES@0",
+        headers={"accept": "application/vnd.apache.arrow.stream"},
+    )
+    record_df1 = pa.ipc.open_stream(resp.content).read_pandas()
+    assert len(record_df1.columns) == 10
+    assert len(record_df1.index) == 3
+
+    resp: Response = dark_storage_client.get(
+        "/records",
+        params={"ensemble_id": [ensemble_id1, ensemble_id2], "key": ["POLY_RES@0"]},
+    )
+    source = pa.BufferReader(resp.content)
+    for ensemble_id in [ensemble_id1, ensemble_id2]:
+        table = pa.ipc.open_stream(source).read_all()
+        assert table.schema.metadata[b"ensemble_id"] == ensemble_id.encode()
+        assert table.schema.metadata[b"key"] == b"POLY_RES@0"
+        assert table.num_rows == 3
+
 
 @pytest.mark.integration_test
 def test_get_summary_response(
@@ -234,6 +255,20 @@ def test_misfit_endpoint(poly_example_tmp_dir, dark_storage_client):
     assert_array_equal(misfit.columns, ["0", "2", "4", "6", "8"])
     assert misfit.shape == (3, 5)
 
+    resp: Response = dark_storage_client.get(
+        f"/compute/misfits?ensemble_id={ensemble_id}&response_name=POLY_RES@0"
+        "&summary_misfits=true"
+    )
+    summary = pd.read_csv(io.BytesIO(resp.content), index_col=0)
+    np.testing.assert_allclose(summary["0"], misfit.abs().sum(axis=1))
+
+    resp: Response = dark_storage_client.get(
+        f"/compute/misfits/groups?ensemble_id={ensemble_id}"
+    )
+    groups = pd.read_csv(io.BytesIO(resp.content), index_col=0)
+    assert_array_equal(groups.columns, ["MISFIT:POLY_OBS", "MISFIT:TOTAL"])
+    np.testing.assert_allclose(groups["MISFIT:TOTAL"], summary["0"])
+
 
 @pytest.mark.integration_test
 @pytest.mark.parametrize(
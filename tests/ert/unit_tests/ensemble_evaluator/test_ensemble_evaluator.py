@@ -16,9 +16,12 @@
     EnsembleSucceeded,
     ForwardModelStepFailure,
     ForwardModelStepRunning,
+    ForwardModelStepStart,
     ForwardModelStepSuccess,
     RealizationSuccess,
+    coalesce_memory_reports,
     event_to_json,
+    events_to_json,
 )
 from _ert.forward_model_runner.client import CONNECT_MSG, DISCONNECT_MSG, Client
 from ert.ensemble_evaluator import (
@@ -138,6 +141,19 @@ async def new_connection():
     await new_connection_task
 
 
+@pytest.mark.timeout(20)
+async def test_that_monitors_connecting_while_closing_down_are_terminated(
+    evaluator_to_use,
+):
+    evaluator = evaluator_to_use
+    evaluator.stop()
+    await asyncio.wait_for(evaluator._terminated.wait(), timeout=10)
+
+    async with Monitor(evaluator._config.get_connection_info()) as monitor:
+        events = [event async for event in monitor.track()]
+    assert [type(event) for event in events] == [EESnapshot, EETerminated]
+
+
 @pytest.fixture(name="evaluator_to_use")
 async def evaluator_to_use_fixture(make_ee_config):
     ensemble = TestEnsemble(0, 2, 2, id_="0")
@@ -517,6 +533,81 @@ async def test_ensure_multi_level_events_in_order(evaluator_to_use):
         assert snapshot_event_received == True
 
 
+def test_that_only_the_latest_memory_report_of_a_step_is_kept():
+    def running(real, fm_step, memory):
+        return ForwardModelStepRunning(
+            ensemble="0", real=real, fm_step=fm_step, current_memory_usage=memory
+        )
+
+    start = ForwardModelStepStart(ensemble="0", real="0", fm_step="0")
+    success = ForwardModelStepSuccess(ensemble="0", real="0", fm_step="0")
+    events = [
+        start,
+        running("0", "0", 1),
+        running("1", "0", 1),
+        running("0", "0", 2),
+        running("0", "1", 1),
+        running("0", "0", 3),
+        success,
+    ]
+    assert coalesce_memory_reports(events) == [
+        start,
+        events[2],
+        events[4],
+        events[5],
+        success,
+    ]
+
+
+async def test_evaluator_accepts_batches_of_dispatch_events(make_ee_config):
+    evaluator = EnsembleEvaluator(
+        TestEnsemble(0, 2, 2, id_="0"), make_ee_config(use_token=False)
+    )
+    events = [
+        ForwardModelStepStart(ensemble="0", real="0", fm_step="0"),
+        ForwardModelStepRunning(ensemble="0", real="0", fm_step="0"),
+        ForwardModelStepSuccess(ensemble="other", real="0", fm_step="0"),
+    ]
+    await evaluator.handle_dispatch(
+        b"dispatch-1", events_to_json(events).encode("utf-8")
+    )
+    received = [evaluator._events.get_nowait() for _ in range(2)]
+    assert received == events[:2]
+    assert evaluator._events.empty()
+
+
+@pytest.mark.integration_test
+@pytest.mark.timeout(20)
+async def test_that_a_single_event_is_handled_after_the_batching_interval(
+    make_ee_config,
+):
+    evaluator = EnsembleEvaluator(
+        TestEnsemble(0, 2, 2, id_="0"),
+        make_ee_config(use_token=False),
+        batching_interval=0.2,
+    )
+    run_task = asyncio.create_task(evaluator.run_and_get_successful_realizations())
+    await evaluator._server_started.wait()
+    try:
+        async with Monitor(evaluator._config.get_connection_info()) as monitor:
+            events = monitor.track()
+            assert type(await anext(events)) is EESnapshot
+            await evaluator._events.put(
+                ForwardModelStepRunning(
+                    ensemble=evaluator.ensemble.id_, real="0", fm_step="0"
+                )
+            )
+            event = await asyncio.wait_for(anext(events), timeout=5)
+            assert type(event) is EESnapshotUpdate
+            snapshot = EnsembleSnapshot.from_nested_dict(event.snapshot)
+            assert (
+                snapshot.get_fm_step("0", "0")["status"] == FORWARD_MODEL_STATE_RUNNING
+            )
+    finally:
+        evaluator.stop()
+        await run_task
+
+
 @given(
     num_cpu=st.integers(min_value=1, max_value=64),
     start=st.datetimes(),
@@ -1,3 +1,4 @@
+from collections import Counter
 from datetime import datetime
 
 from _ert.events import (
@@ -7,7 +8,11 @@
     RealizationSuccess,
 )
 from ert.ensemble_evaluator import state
-from ert.ensemble_evaluator.snapshot import EnsembleSnapshot, FMStepSnapshot
+from ert.ensemble_evaluator.snapshot import (
+    EnsembleSnapshot,
+    FMStepSnapshot,
+    RealizationSnapshot,
+)
 from tests.ert import SnapshotBuilder
 
 
@@ -100,3 +105,78 @@ def test_that_realization_success_message_updates_state():
     assert (
         snapshot.to_dict()["reals"]["0"]["status"] == state.REALIZATION_STATE_FINISHED
     )
+
+
+def test_that_merged_snapshot_shares_no_dictionaries_with_update(snapshot):
+    update = EnsembleSnapshot.from_nested_dict(
+        {
+            "reals": {
+                "1": {
+                    "status": state.REALIZATION_STATE_RUNNING,
+                    "fm_steps": {"0": {"status": state.FORWARD_MODEL_STATE_RUNNING}},
+                }
+            }
+        }
+    )
+    snapshot.merge_snapshot(update)
+
+    update.update_fm_step("1", "0", FMStepSnapshot(status="Changed"))
+    update.update_realization("1", status="Changed")
+
+    assert snapshot.get_fm_step("1", "0")["status"] == (
+        state.FORWARD_MODEL_STATE_RUNNING
+    )
+    assert snapshot.reals["1"]["status"] == state.REALIZATION_STATE_RUNNING
+    assert snapshot.reals["1"]["fm_steps"]["0"]["status"] == (
+        state.FORWARD_MODEL_STATE_RUNNING
+    )
+    assert set(snapshot.reals["1"]["fm_steps"]) == {"0", "1", "2", "3"}
+
+
+def test_that_snapshot_copy_is_independent(snapshot):
+    copied = snapshot.copy()
+    assert copied.to_dict() == snapshot.to_dict()
+
+    snapshot.update_fm_step("0", "0", FMStepSnapshot(status="Changed"))
+    snapshot.update_realization("0", status="Changed")
+    assert copied.get_fm_step("0", "0")["status"] == "Unknown"
+    assert copied.reals["0"]["status"] != "Changed"
+
+
+def test_that_snapshot_copy_keeps_empty_fm_steps():
+    snapshot = EnsembleSnapshot()
+    snapshot.add_realization(
+        "0",
+        RealizationSnapshot(
+            status=state.REALIZATION_STATE_WAITING, active=True, fm_steps={}
+        ),
+    )
+    assert snapshot.copy().to_dict() == snapshot.to_dict()
+    assert snapshot.copy().reals["0"]["fm_steps"] == {}
+
+
+def test_that_aggregated_real_states_follow_every_kind_of_update():
+    def counted(snapshot):
+        return Counter(
+            real["status"] for real in snapshot.reals.values() if "status" in real
+        )
+
+    snapshot = SnapshotBuilder().build(["0", "1", "2"], status="Unknown")
+    assert snapshot.aggregate_real_states() == Counter({"Unknown": 3})
+
+    snapshot.update_from_event(RealizationSuccess(ensemble="0", real="0"))
+    snapshot.update_realization("1", status=state.REALIZATION_STATE_RUNNING)
+    snapshot.merge_snapshot(
+        EnsembleSnapshot.from_nested_dict(
+            {"reals": {"2": {"status": state.REALIZATION_STATE_FAILED}, "3": {}}}
+        )
+    )
+    snapshot.add_realization(
+        "1", RealizationSnapshot(status=state.REALIZATION_STATE_FINISHED)
+    )
+
+    assert snapshot.aggregate_real_states() == counted(snapshot)
+    assert snapshot.aggregate_real_states() == Counter(
+        {state.REALIZATION_STATE_FINISHED: 2, state.REALIZATION_STATE_FAILED: 1}
+    )
+    assert snapshot.copy().aggregate_real_states() == counted(snapshot)
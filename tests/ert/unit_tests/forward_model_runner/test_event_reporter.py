@@ -8,6 +8,7 @@
     ForwardModelStepRunning,
     ForwardModelStepStart,
     ForwardModelStepSuccess,
+    dispatch_events_from_json,
     event_from_json,
 )
 from _ert.forward_model_runner.forward_model_step import ForwardModelStep
@@ -24,6 +25,14 @@
 from tests.ert.utils import MockZMQServer
 
 
+def _received_events(mock_server):
+    return [
+        event
+        for message in mock_server.messages
+        for event in dispatch_events_from_json(message)
+    ]
+
+
 def _wait_until(condition, timeout, fail_msg):
     start = time.time()
     while not condition():
@@ -70,8 +79,9 @@ def test_report_with_failed_start_message_argument(unused_tcp_port):
         reporter.report(msg)
         reporter.report(Finish())
 
-    assert len(mock_server.messages) == 2
-    event = event_from_json(mock_server.messages[1])
+    events = _received_events(mock_server)
+    assert len(events) == 2
+    event = events[1]
     assert type(event) is ForwardModelStepFailure
     assert event.error_msg == "massive_failure"
 
@@ -234,4 +244,28 @@ def test_report_with_reconnected_reporter_but_finished_jobs(unused_tcp_port):
         if reporter._event_publisher_thread.is_alive():
             reporter._event_publisher_thread.join()
         assert reporter._done.is_set()
-    assert len(mock_server.messages) == 3, "expected 3 Job running messages"
+    events = _received_events(mock_server)
+    assert events, "expected Job running messages"
+    assert all(type(event) is ForwardModelStepRunning for event in events)
+    assert events[-1].max_memory_usage == 1100
+
+
+def test_queued_events_are_batched_with_only_the_latest_memory_report():
+    reporter = Event(evaluator_url="tcp://localhost:0")
+    fmstep1 = ForwardModelStep(
+        {"name": "fmstep1", "stdout": "stdout", "stderr": "stderr"}, 0
+    )
+    reporter._ens_id = "ens_id"
+    reporter._real_id = "0"
+    reporter._job_handler(Running(fmstep1, ProcessTreeStatus(max_rss=100, rss=10)))
+    reporter._job_handler(Running(fmstep1, ProcessTreeStatus(max_rss=200, rss=20)))
+    reporter._job_handler(Exited(fmstep1, 0))
+    reporter._event_queue.put(Event._sentinel)
+
+    batch = []
+    assert reporter._drain_event_queue(batch)
+    assert [type(event) for event in batch] == [
+        ForwardModelStepRunning,
+        ForwardModelStepSuccess,
+    ]
+    assert batch[0].max_memory_usage == 200
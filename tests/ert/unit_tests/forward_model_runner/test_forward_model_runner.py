@@ -3,9 +3,11 @@
 import os.path
 import stat
 import textwrap
+from pathlib import Path
 
 import pytest
 
+from _ert.checksum import CHUNK_SIZE, ChecksumMode, expected_checksum, file_checksum
 from _ert.forward_model_runner.reporting.message import Checksum, Exited, Start
 from _ert.forward_model_runner.runner import ForwardModelRunner
 from ert.config import ErtConfig, ForwardModelStep
@@ -184,6 +186,32 @@ def test_when_manifest_file_is_not_created_by_fm_runner_checksum_contains_error(
     )
 
 
+@pytest.mark.parametrize("checksum_mode", ["MD5", "BLAKE2B", "QUICK"])
+@pytest.mark.usefixtures("use_tmpdir")
+def test_checksums_are_given_in_the_configured_mode(checksum_mode):
+    with open("manifest.json", "w", encoding="utf-8") as f:
+        json.dump({"file_1": "file_1"}, f)
+    with open("file_1", "wb") as f:
+        f.write(os.urandom(3 * CHUNK_SIZE))
+
+    fmr = ForwardModelRunner({"jobList": [], "checksum_mode": checksum_mode})
+
+    (checksum_msg,) = [s for s in fmr.run([]) if isinstance(s, Checksum)]
+    info = checksum_msg.data["file_1"]
+    assert expected_checksum(info) == (
+        file_checksum(Path("file_1"), ChecksumMode(checksum_mode)),
+        checksum_mode,
+    )
+
+
+def test_memory_poll_period_is_passed_on_to_the_steps():
+    fmr = ForwardModelRunner({"jobList": [{"name": "step"}], "memory_poll_period": 0.5})
+    assert [step.memory_poll_period for step in fmr.steps] == [0.5]
+    fmr = ForwardModelRunner({"jobList": [{"name": "step"}]})
+    (step,) = fmr.steps
+    assert step.memory_poll_period == step.MEMORY_POLL_PERIOD
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_run_multiple_fail_only_runs_one():
     fm_step_list = []
@@ -210,6 +238,73 @@ def test_run_multiple_fail_only_runs_one():
         assert status.exit_code == i + 1
 
 
+def _sleep_steps(parallel_groups):
+    return [
+        {
+            "name": f"SLEEP{index}",
+            "executable": "/bin/sh",
+            "argList": ["-c", "sleep 0.5"],
+            "parallel_group": group,
+        }
+        for index, group in enumerate(parallel_groups)
+    ]
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_steps_in_the_same_parallel_group_run_concurrently():
+    fmr = ForwardModelRunner(
+        {"jobList": _sleep_steps(["a", "a", None, "a"]), "num_cpu": 2}
+    )
+
+    statuses = [
+        (type(s).__name__, s.job.name())
+        for s in fmr.run([])
+        if isinstance(s, Start | Exited)
+    ]
+
+    assert sorted(statuses[:2]) == [("Start", "SLEEP0"), ("Start", "SLEEP1")]
+    assert sorted(statuses[2:4]) == [("Exited", "SLEEP0"), ("Exited", "SLEEP1")]
+    assert statuses[4:] == [
+        ("Start", "SLEEP2"),
+        ("Exited", "SLEEP2"),
+        ("Start", "SLEEP3"),
+        ("Exited", "SLEEP3"),
+    ]
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_parallel_group_runs_at_most_num_cpu_steps_at_a_time():
+    fmr = ForwardModelRunner({"jobList": _sleep_steps(["a", "a"]), "num_cpu": 1})
+
+    statuses = [
+        (type(s).__name__, s.job.name())
+        for s in fmr.run([])
+        if isinstance(s, Start | Exited)
+    ]
+
+    assert statuses == [
+        ("Start", "SLEEP0"),
+        ("Exited", "SLEEP0"),
+        ("Start", "SLEEP1"),
+        ("Exited", "SLEEP1"),
+    ]
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_failing_step_in_parallel_group_stops_the_forward_model():
+    steps = _sleep_steps(["a", "a", "a", None])
+    steps[0]["argList"] = ["-c", "exit 1"]
+    fmr = ForwardModelRunner({"jobList": steps, "num_cpu": 2})
+
+    statuses = list(fmr.run([]))
+
+    exited = [s.job.name() for s in statuses if isinstance(s, Exited)]
+    assert "SLEEP0" in exited
+    assert "SLEEP2" not in exited
+    assert "SLEEP3" not in exited
+    assert not statuses[-1].success()
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_exec_env():
     with open("exec_env.py", "w", encoding="utf-8") as f:
@@ -2,6 +2,7 @@
 import os
 import pathlib
 import stat
+import subprocess
 import sys
 import textwrap
 from dataclasses import dataclass
@@ -13,6 +14,7 @@
     ForwardModelStep,
     _get_processtree_data,
 )
+from _ert.forward_model_runner.process_tree import sample_process_tree
 from _ert.forward_model_runner.reporting.message import Exited, Running, Start
 
 
@@ -82,8 +84,8 @@ def test_cpu_seconds_can_detect_multiprocess():
             "executable": executable,
         },
         0,
+        memory_poll_period=0.05,
     )
-    fmstep.MEMORY_POLL_PERIOD = 0.05
     cpu_seconds = 0.0
     for status in fmstep.run():
         if isinstance(status, Running):
@@ -129,8 +131,8 @@ def max_memory_per_subprocess_layer(layers: int) -> int:
                 "argList": [str(layers), str(int(blobsize))],
             },
             0,
+            memory_poll_period=0.01,
         )
-        fmstep.MEMORY_POLL_PERIOD = 0.01
         max_seen = 0
         for status in fmstep.run():
             if isinstance(status, Running):
@@ -194,6 +196,89 @@ def read_text_side_effect(self: pathlib.Path, *args, **kwargs):
     assert oom_score == 456
 
 
+def _write_proc_entry(proc, pid, ppid, utime, rss_pages, name="job", **files):
+    (proc / str(pid)).mkdir()
+    (proc / str(pid) / "stat").write_text(
+        f"{pid} ({name}) S {ppid} {' '.join(['0'] * 9)} {utime} 0 "
+        f"{' '.join(['0'] * 8)} {rss_pages} 0 0",
+        encoding="utf-8",
+    )
+    for filename, content in files.items():
+        (proc / str(pid) / filename).write_text(content, encoding="utf-8")
+
+
+def test_process_tree_sample_sums_over_descendants_from_a_single_proc_sweep(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr("_ert.forward_model_runner.process_tree._PROC", tmp_path)
+    monkeypatch.setattr("_ert.forward_model_runner.process_tree._CLOCK_TICKS", 100)
+    monkeypatch.setattr("_ert.forward_model_runner.process_tree._PAGE_SIZE", 4096)
+    _write_proc_entry(
+        tmp_path,
+        123,
+        1,
+        utime=150,
+        rss_pages=10,
+        name="a (weird) name",
+        smaps_rollup="Rss: 40 kB\nPss: 30 kB\n",
+        io="rchar: 1\nread_bytes: 1000\nwrite_bytes: 2000\n",
+        oom_score="234\n",
+    )
+    _write_proc_entry(
+        tmp_path,
+        124,
+        123,
+        utime=50,
+        rss_pages=20,
+        smaps_rollup="Pss: 50 kB\n",
+        oom_score="456\n",
+    )
+    _write_proc_entry(tmp_path, 125, 124, utime=100, rss_pages=1)
+    _write_proc_entry(tmp_path, 200, 1, utime=1000, rss_pages=1000)
+    (tmp_path / "self").mkdir()
+
+    sample = sample_process_tree(123)
+
+    assert sample.rss == 31 * 4096
+    assert sample.cpu_seconds == pytest.approx(3.0)
+    assert sample.pss == 80 * 1024
+    assert (sample.read_bytes, sample.write_bytes) == (1000, 2000)
+    assert sample.oom_score == 456
+    assert sample.pids == {124, 125}
+
+    sample = sample_process_tree(123, detailed=False)
+
+    assert sample.rss == 31 * 4096
+    assert sample.pss is None
+    assert sample.read_bytes is None
+    assert sample.oom_score == 456
+
+
+def test_process_tree_sample_of_exited_process_is_empty(tmp_path, monkeypatch):
+    monkeypatch.setattr("_ert.forward_model_runner.process_tree._PROC", tmp_path)
+    _write_proc_entry(tmp_path, 124, 123, utime=50, rss_pages=20)
+
+    sample = sample_process_tree(123)
+
+    assert sample.rss == 0
+    assert sample.pss is None
+    assert sample.oom_score is None
+    assert not sample.pids
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Requires /proc")
+def test_process_tree_sample_of_running_process_finds_children():
+    with subprocess.Popen(["sleep", "10"]) as child:
+        try:
+            sample = sample_process_tree(os.getpid())
+        finally:
+            child.kill()
+
+    assert child.pid in sample.pids
+    assert sample.rss > 0
+    assert sample.cpu_seconds > 0
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_run_fails_using_exit_bash_builtin():
     fmstep = ForwardModelStep(
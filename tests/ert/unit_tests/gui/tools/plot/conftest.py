@@ -1,10 +1,10 @@
-import io
 import os
 import shutil
 from contextlib import contextmanager
 from unittest.mock import MagicMock
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from ert.gui.tools.plot.plot_api import PlotApi
@@ -29,6 +29,29 @@ def is_success(self):
         return self.status_code == 200
 
 
+def arrow_ipc(*dataframes: tuple[pd.DataFrame, dict[str, str]]) -> bytes:
+    """
+    The dataframes as consecutive Arrow IPC streams, with the type of the
+    columns and the given metadata in the schema metadata, as sent by the
+    records endpoints
+    """
+    sink = pa.BufferOutputStream()
+    for dataframe, metadata in dataframes:
+        if isinstance(dataframe.columns, pd.DatetimeIndex):
+            column_type = "datetime"
+        elif pd.api.types.is_integer_dtype(dataframe.columns):
+            column_type = "int"
+        else:
+            column_type = "str"
+        table = pa.Table.from_pandas(dataframe.rename(columns=str))
+        table = table.replace_schema_metadata(
+            {**table.schema.metadata, "columns": column_type, **metadata}
+        )
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
 @pytest.fixture
 def api(tmpdir, source_root, monkeypatch):
     @contextmanager
@@ -48,42 +71,30 @@ def session():
 
 def mocked_requests_get(*args, **kwargs):
     summary_data = {
-        "2010-01-20 00:00:00": [0.1, 0.2, 0.3, 0.4],
-        "2010-02-20 00:00:00": [0.2, 0.21, 0.19, 0.18],
+        pd.Timestamp("2010-01-20"): [0.1, 0.2, 0.3, 0.4],
+        pd.Timestamp("2010-02-20"): [0.2, 0.21, 0.19, 0.18],
     }
     summary_df = pd.DataFrame(summary_data)
-    summary_stream = io.BytesIO()
-    summary_df.to_parquet(summary_stream)
-    summary_parquet_data = summary_stream.getvalue()
 
-    parameter_data = {"0": [0.1, 0.2, 0.3]}
+    parameter_data = {0: [0.1, 0.2, 0.3]}
     parameter_df = pd.DataFrame(parameter_data)
-    parameter_stream = io.BytesIO()
-    parameter_df.to_parquet(parameter_stream)
-    parameter_parquet_data = parameter_stream.getvalue()
 
     gen_data = {
-        "0": [0.1, 0.2, 0.3],
-        "1": [0.1, 0.2, 0.3],
-        "2": [0.1, 0.2, 0.3],
-        "3": [0.1, 0.2, 0.3],
-        "4": [0.1, 0.2, 0.3],
-        "5": [0.1, 0.2, 0.3],
+        0: [0.1, 0.2, 0.3],
+        1: [0.1, 0.2, 0.3],
+        2: [0.1, 0.2, 0.3],
+        3: [0.1, 0.2, 0.3],
+        4: [0.1, 0.2, 0.3],
+        5: [0.1, 0.2, 0.3],
     }
     gen_df = pd.DataFrame(gen_data)
-    gen_stream = io.BytesIO()
-    gen_df.to_parquet(gen_stream)
-    gen_parquet_data = gen_stream.getvalue()
 
     history_data = {
-        "0": [1.0, 0.2, 1.0, 1.0, 1.0],
-        "1": [1.1, 0.2, 1.1, 1.1, 1.1],
-        "2": [1.2, 1.2, 1.2, 1.2, 1.3],
+        0: [1.0, 0.2, 1.0, 1.0, 1.0],
+        1: [1.1, 0.2, 1.1, 1.1, 1.1],
+        2: [1.2, 1.2, 1.2, 1.2, 1.3],
     }
     history_df = pd.DataFrame(history_data)
-    history_stream = io.BytesIO()
-    history_df.to_parquet(history_stream)
-    history_parquet_data = history_stream.getvalue()
 
     ensemble = {
         "/ensembles/ens_id_1": {"name": "ensemble_1", "experiment_name": "experiment"},
@@ -277,12 +288,12 @@ def mocked_requests_get(*args, **kwargs):
     }
 
     records = {
-        "/ensembles/ens_id_3/records/FOPR": summary_parquet_data,
-        "/ensembles/ens_id_3/records/BPR%25253A1%25252C3%25252C8": summary_parquet_data,
-        "/ensembles/ens_id_3/records/SNAKE_OIL_PARAM%25253ABPR_138_PERSISTENCE": parameter_parquet_data,
-        "/ensembles/ens_id_3/records/SNAKE_OIL_PARAM%25253AOP1_DIVERGENCE_SCALE": parameter_parquet_data,
-        "/ensembles/ens_id_3/records/SNAKE_OIL_WPR_DIFF@199": gen_parquet_data,
-        "/ensembles/ens_id_3/records/FOPRH": history_parquet_data,
+        "/ensembles/ens_id_3/records/FOPR": summary_df,
+        "/ensembles/ens_id_3/records/BPR%25253A1%25252C3%25252C8": summary_df,
+        "/ensembles/ens_id_3/records/SNAKE_OIL_PARAM%25253ABPR_138_PERSISTENCE": parameter_df,
+        "/ensembles/ens_id_3/records/SNAKE_OIL_PARAM%25253AOP1_DIVERGENCE_SCALE": parameter_df,
+        "/ensembles/ens_id_3/records/SNAKE_OIL_WPR_DIFF@199": gen_df,
+        "/ensembles/ens_id_3/records/FOPRH": history_df,
     }
 
     experiments = [
@@ -315,7 +326,19 @@ def mocked_requests_get(*args, **kwargs):
     elif args[0] in responses:
         return MockResponse(responses[args[0]], 200)
     elif args[0] in records:
-        return MockResponse(records[args[0]], 200)
+        return MockResponse(arrow_ipc((records[args[0]], {})), 200)
+    elif args[0] == "/records":
+        params = kwargs["params"]
+        dataframes = [
+            (
+                records[f"/ensembles/{ensemble_id}/records/{PlotApi.escape(key)}"],
+                {"ensemble_id": ensemble_id, "key": key},
+            )
+            for ensemble_id in params["ensemble_id"]
+            for key in params["key"]
+            if f"/ensembles/{ensemble_id}/records/{PlotApi.escape(key)}" in records
+        ]
+        return MockResponse(arrow_ipc(*dataframes), 200)
     elif "/experiments" in args[0]:
         return MockResponse(experiments, 200)
 
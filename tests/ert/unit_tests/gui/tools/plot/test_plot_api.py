@@ -322,6 +322,53 @@ def test_plot_api_handles_non_existant_gen_kw(api_and_storage):
     assert api.data_for_key(str(ensemble.id), "gen_kw:does_not_exist").empty
 
 
+def test_that_data_for_keys_matches_data_for_key(api_and_storage):
+    api, storage = api_and_storage
+    experiment = storage.create_experiment(
+        parameters=[
+            GenKwConfig(
+                name="gen_kw",
+                forward_init=False,
+                update=False,
+                template_file=None,
+                output_file=None,
+                transform_function_definitions=[],
+            ),
+        ],
+        responses=[],
+        observations={},
+    )
+    ensembles = [
+        storage.create_ensemble(experiment.id, ensemble_size=3, name=name)
+        for name in ["prior", "posterior"]
+    ]
+    for i, ensemble in enumerate(ensembles):
+        for iens in range(3):
+            ensemble.save_parameters(
+                "gen_kw",
+                iens,
+                xr.Dataset(
+                    {
+                        "values": ("names", [i + iens, -iens]),
+                        "transformed_values": ("names", [i + iens, -iens]),
+                        "names": ["a", "b"],
+                    }
+                ),
+            )
+    ensemble_ids = [str(ensemble.id) for ensemble in ensembles]
+    keys = ["gen_kw:a", "gen_kw:b", "gen_kw:does_not_exist"]
+
+    data = api.data_for_keys([*ensemble_ids, "not_an_ensemble"], keys)
+
+    for ensemble_id in ensemble_ids:
+        for key in keys:
+            assert_frame_equal(
+                data[ensemble_id, key], api.data_for_key(ensemble_id, key)
+            )
+    assert data[ensemble_ids[1], "gen_kw:a"][0].tolist() == [1.0, 2.0, 3.0]
+    assert data["not_an_ensemble", "gen_kw:a"].empty
+
+
 def test_that_multiple_observations_are_parsed_correctly(api):
     ensemble = next(x for x in api.get_all_ensembles() if x.id == "ens_id_5")
     obs_data = api.observations_for_key([ensemble.id], "WOPR:OP1")
@@ -0,0 +1,117 @@
+from threading import Event
+
+from pytestqt.qtbot import QtBot
+
+from ert.gui.tools.plot.plot_api import PlotApiKeyDefinition
+from ert.gui.tools.plot.plot_data_loader import PlotDataLoader, PlotDataRequest
+
+
+def key_def(key, observations=False):
+    return PlotApiKeyDefinition(
+        key=key,
+        index_type=None,
+        observations=observations,
+        dimensionality=2,
+        metadata={"data_origin": "Summary"},
+        log_scale=False,
+    )
+
+
+def test_that_plot_data_is_loaded_in_the_background(qtbot: QtBot, api):
+    ensemble = next(x for x in api.get_all_ensembles() if x.name == "default_0")
+    loader = PlotDataLoader(api)
+    request = PlotDataRequest(key_def("FOPR", observations=True), (ensemble,))
+
+    with qtbot.waitSignal(loader.dataLoaded) as blocker:
+        loader.load(request)
+    assert not loader.loading
+
+    data = blocker.args[0]
+    assert data.request == request
+    assert not data.errors
+    assert not data.ensemble_to_data_map[ensemble].empty
+    assert not data.observations.empty
+    assert not data.history_data.empty
+    loader.shutdown()
+
+
+def test_that_only_the_most_recent_request_is_delivered(qtbot: QtBot, api, monkeypatch):
+    ensemble = next(x for x in api.get_all_ensembles() if x.name == "default_0")
+    loader = PlotDataLoader(api)
+    data_for_keys = api.data_for_keys
+    release = Event()
+
+    def slow_data_for_keys(ensemble_ids, keys):
+        release.wait(timeout=10)
+        return data_for_keys(ensemble_ids, keys)
+
+    monkeypatch.setattr(api, "data_for_keys", slow_data_for_keys)
+    delivered = []
+    loader.dataLoaded.connect(lambda data: delivered.append(data.request.key))
+
+    loader.load(PlotDataRequest(key_def("BPR:1,3,8"), (ensemble,)))
+    loader.load(PlotDataRequest(key_def("FOPR"), (ensemble,)))
+    release.set()
+
+    qtbot.waitUntil(lambda: not loader.loading)
+    # Let the stale result reach the GUI thread, if it was not cancelled
+    qtbot.wait(100)
+    assert delivered == ["FOPR"]
+    loader.shutdown()
+
+
+def test_that_prefetched_data_is_used_once(qtbot: QtBot, api, monkeypatch):
+    ensemble = next(x for x in api.get_all_ensembles() if x.name == "default_0")
+    loader = PlotDataLoader(api)
+    fopr = PlotDataRequest(key_def("FOPR"), (ensemble,))
+    bpr = PlotDataRequest(key_def("BPR:1,3,8"), (ensemble,))
+    requested = []
+    data_for_keys = api.data_for_keys
+
+    def counting_data_for_keys(ensemble_ids, keys):
+        # History is fetched with data_for_keys as well
+        requested.extend(key for key in keys if key in {fopr.key, bpr.key})
+        return data_for_keys(ensemble_ids, keys)
+
+    monkeypatch.setattr(api, "data_for_keys", counting_data_for_keys)
+
+    with qtbot.waitSignal(loader.dataLoaded):
+        loader.load(fopr, prefetch=[bpr])
+    with qtbot.waitSignal(loader.dataLoaded):
+        loader.load(bpr)
+    assert requested.count(bpr.key) == 1
+
+    with qtbot.waitSignal(loader.dataLoaded):
+        loader.load(bpr)
+    assert requested.count(bpr.key) == 2
+    loader.shutdown()
+
+
+def test_that_prefetched_data_is_dropped_when_no_longer_wanted(
+    qtbot: QtBot, api, monkeypatch
+):
+    ensemble = next(x for x in api.get_all_ensembles() if x.name == "default_0")
+    loader = PlotDataLoader(api)
+    fopr = PlotDataRequest(key_def("FOPR"), (ensemble,))
+    bpr = PlotDataRequest(key_def("BPR:1,3,8"), (ensemble,))
+    fopr_history = PlotDataRequest(key_def("FOPRH"), (ensemble,))
+    requested = []
+    data_for_keys = api.data_for_keys
+
+    def counting_data_for_keys(ensemble_ids, keys):
+        requested.extend(key for key in keys if key == bpr.key)
+        return data_for_keys(ensemble_ids, keys)
+
+    monkeypatch.setattr(api, "data_for_keys", counting_data_for_keys)
+
+    with qtbot.waitSignal(loader.dataLoaded):
+        loader.load(fopr, prefetch=[bpr])
+    qtbot.waitUntil(lambda: requested.count(bpr.key) == 1)
+    with qtbot.waitSignal(loader.dataLoaded):
+        loader.load(fopr_history)
+    assert not loader._futures
+
+    with qtbot.waitSignal(loader.dataLoaded):
+        loader.load(bpr)
+    assert requested.count(bpr.key) == 2
+    loader.shutdown()
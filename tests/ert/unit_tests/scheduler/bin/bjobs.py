@@ -13,6 +13,7 @@
 class Job(BaseModel):
     job_id: str
     job_state: JobState
+    job_index: str = "0"
 
 
 def get_parser() -> argparse.ArgumentParser:
@@ -26,8 +27,15 @@ def get_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def bjobs_formatter(jobstats: list[Job]) -> str:
-    return "".join([f"{job.job_id}^{job.job_state}^-\n" for job in jobstats])
+def bjobs_formatter(jobstats: list[Job], with_index: bool) -> str:
+    return "".join(
+        [
+            f"{job.job_id}^{job.job_state}^-"
+            + (f"^{job.job_index}" if with_index else "")
+            + "\n"
+            for job in jobstats
+        ]
+    )
 
 
 def read(path: Path, default: str | None = None) -> str | None:
@@ -57,16 +65,19 @@ def main() -> None:
         elif pid is not None:
             state = "RUN"
 
+        # Elements of job arrays are given as jobid[index]
+        job_id, _, job_index = job.rstrip("]").partition("[")
         jobs_output.append(
             Job(
                 **{
-                    "job_id": job,
+                    "job_id": job_id,
                     "job_state": state,
+                    "job_index": job_index or "0",
                 }
             )
         )
 
-    print(bjobs_formatter(jobs_output))
+    print(bjobs_formatter(jobs_output, with_index="jobindex" in args.o))
 
 
 if __name__ == "__main__":
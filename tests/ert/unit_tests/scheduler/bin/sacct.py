@@ -20,7 +20,7 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("-n", action="store_true")
     parser.add_argument("-o", type=str)
     parser.add_argument("-P", action="store_true")
-    parser.add_argument("-j", type=str)
+    parser.add_argument("-j", "--jobs", type=str)
     return parser
 
 
@@ -31,13 +31,14 @@ def read(path: Path, default: str | None = None) -> str | None:
 def main() -> None:
     args = get_parser().parse_args()
 
-    assert args.o.strip() == "State,ExitCode"
+    assert args.o.strip() in {"State,ExitCode", "JobID,State,ExitCode"}
+    job_ids = args.jobs.split(",") if args.jobs else []
 
     jobs_path = Path(os.getenv("PYTEST_TMP_PATH", ".")) / "mock_jobs"
 
     for pidfile in glob.glob(f"{jobs_path}/*.pid"):
         job = pidfile.split("/")[-1].split(".")[0]
-        if args.j and job != args.j:
+        if job_ids and job not in job_ids:
             continue
         pid = read(Path(pidfile))
         returncode = read(jobs_path / f"{job}.returncode")
@@ -55,7 +56,10 @@ def main() -> None:
             if returncode != "0":
                 state = "FAILED"
 
-        print(f"{state}|{returncode}:0")
+        if args.o.startswith("JobID"):
+            print(f"{job}|{state}|{returncode}:0")
+        else:
+            print(f"{state}|{returncode}:0")
 
 
 if __name__ == "__main__":
@@ -20,28 +20,27 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("--parsable", action="store_true")
     parser.add_argument("--output", type=str)
     parser.add_argument("--error", type=str)
+    parser.add_argument("--array", type=str)
     parser.add_argument("script", type=str)
     return parser
 
 
-def main() -> None:
-    args = get_parser().parse_args()
-
-    jobid = random.randint(1, 2**15)
-    jobdir = Path(os.getenv("PYTEST_TMP_PATH", "."))
-    (jobdir / "mock_jobs").mkdir(parents=True, exist_ok=True)
+def submit(
+    jobdir: Path, jobid: str, args: argparse.Namespace, array_index: int | None
+) -> None:
     (jobdir / "mock_jobs" / f"{jobid}.script").write_text(args.script, encoding="utf-8")
     (jobdir / "mock_jobs" / f"{jobid}.name").write_text(args.job_name, encoding="utf-8")
     env_file = jobdir / "mock_jobs" / f"{jobid}.env"
 
+    env = ""
     if args.ntasks:
-        env_file.write_text(
+        env += (
             f"export SLURM_JOB_CPUS_PER_NODE={args.ntasks}\n"
-            f"export SLURM_CPUS_ON_NODE={args.ntasks}",
-            encoding="utf-8",
+            f"export SLURM_CPUS_ON_NODE={args.ntasks}\n"
         )
-    else:
-        env_file.touch()
+    if array_index is not None:
+        env += f"export SLURM_ARRAY_TASK_ID={array_index}\n"
+    env_file.write_text(env, encoding="utf-8")
 
     subprocess.Popen(
         [str(Path(__file__).parent / "runner"), f"{jobdir}/mock_jobs/{jobid}"],
@@ -50,6 +49,20 @@ def main() -> None:
         stderr=open(args.error, "w", encoding="utf-8"),  # noqa: SIM115
     )
 
+
+def main() -> None:
+    args = get_parser().parse_args()
+
+    jobid = random.randint(1, 2**15)
+    jobdir = Path(os.getenv("PYTEST_TMP_PATH", "."))
+    (jobdir / "mock_jobs").mkdir(parents=True, exist_ok=True)
+    if args.array:
+        first, last = map(int, args.array.split("-"))
+        for array_index in range(first, last + 1):
+            submit(jobdir, f"{jobid}_{array_index}", args, array_index)
+    else:
+        submit(jobdir, str(jobid), args, None)
+
     if args.parsable:
         print(jobid)
     else:
@@ -52,10 +52,18 @@ def main() -> None:
             if returncode != "0":
                 state = "FAILED"
 
-        print(f"JobId={job} JobName={name}")
-        print(f"   JobState={state}")
+        fields = [f"JobId={job}"]
+        if "_" in job:
+            array_job_id, array_task_id = job.split("_")
+            fields = [
+                f"JobId={pid}",
+                f"ArrayJobId={array_job_id}",
+                f"ArrayTaskId={array_task_id}",
+            ]
+        fields += [f"JobName={name}", f"JobState={state}"]
         if returncode:
-            print(f"   ExitCode={returncode}:0")
+            fields.append(f"ExitCode={returncode}:0")
+        print("\n   ".join(fields))
         print("")
 
 
@@ -3,11 +3,18 @@
 import os
 import signal
 import sys
+from functools import partial
 from pathlib import Path
 
 import pytest
 
-from ert.scheduler.driver import SIGNAL_OFFSET, Driver
+from ert.scheduler.driver import (
+    SIGNAL_OFFSET,
+    AdaptivePoller,
+    Driver,
+    JobSubmission,
+    chunk_job_ids,
+)
 from ert.scheduler.local_driver import LocalDriver
 from ert.scheduler.lsf_driver import LsfDriver
 from ert.scheduler.openpbs_driver import OpenPBSDriver
@@ -215,6 +222,136 @@ async def test_num_cpu_sets_env_variables(driver: Driver, tmp_path, job_name):
         assert "NCPUS=2" in env_lines
 
 
+@pytest.mark.integration_test
+async def test_submit_array(driver: Driver, tmp_path, job_name):
+    if not driver.supports_job_arrays:
+        with pytest.raises(NotImplementedError):
+            await driver.submit_array([JobSubmission(0, "true")])
+        return
+    os.chdir(tmp_path)
+    returncodes = {}
+
+    async def finished(iens, returncode):
+        returncodes[iens] = returncode
+
+    runpaths = {iens: tmp_path / f"realization-{iens}" for iens in (3, 5, 8)}
+    for runpath in runpaths.values():
+        runpath.mkdir()
+    await driver.submit_array(
+        [
+            JobSubmission(
+                iens,
+                "sh",
+                ("-c", f"echo {iens} > $(pwd)/out; exit {iens}"),
+                name=f"{job_name}-{iens}",
+                runpath=runpath,
+            )
+            for iens, runpath in runpaths.items()
+        ]
+    )
+    await poll(driver, set(runpaths), finished=finished)
+
+    assert returncodes == {3: 3, 5: 5, 8: 8}
+    for iens, runpath in runpaths.items():
+        assert (runpath / "out").read_text(encoding="utf-8") == f"{iens}\n"
+
+
+@pytest.mark.integration_test
+async def test_kill_array_element(driver: Driver, tmp_path, job_name):
+    if not driver.supports_job_arrays:
+        pytest.skip(f"{type(driver).__name__} does not support job arrays")
+    os.chdir(tmp_path)
+    returncodes = {}
+
+    async def kill_first_once_started(iens):
+        if iens == 0:
+            await driver.kill(iens)
+
+    async def finished(iens, returncode):
+        returncodes[iens] = returncode
+
+    await driver.submit_array(
+        [
+            JobSubmission(0, "sh", ("-c", "sleep 60"), name=f"{job_name}-0"),
+            JobSubmission(1, "sh", ("-c", "exit 0"), name=f"{job_name}-1"),
+        ]
+    )
+    await poll(driver, {0, 1}, started=kill_first_once_started, finished=finished)
+
+    assert returncodes[1] == 0
+    assert returncodes[0] != 0 or isinstance(driver, SlurmDriver)
+
+
+@pytest.mark.integration_test
+async def test_poll_splits_job_ids_into_chunks_and_records_metrics(
+    driver: Driver, tmp_path, job_name, monkeypatch
+):
+    if isinstance(driver, LocalDriver):
+        pytest.skip("LocalDriver does not poll")
+    monkeypatch.setattr(
+        f"{type(driver).__module__}.chunk_job_ids",
+        partial(chunk_job_ids, max_length=1),
+        raising=False,
+    )
+    os.chdir(tmp_path)
+    for iens in range(3):
+        await driver.submit(iens, "true", name=f"{job_name}-{iens}")
+    await poll(driver, {0, 1, 2})
+
+    metrics = driver.poll_metrics
+    assert metrics.polls > 0
+    assert metrics.jobs_per_poll > 0
+    assert metrics.transitions >= 3
+    assert str(metrics).startswith(f"{metrics.polls} polls")
+
+
+@pytest.mark.parametrize(
+    "job_ids, max_length, expected",
+    [
+        pytest.param([], 10, [], id="no_ids"),
+        pytest.param(["1", "2", "3"], 10, [["1", "2", "3"]], id="one_chunk"),
+        pytest.param(["1", "2", "3"], 4, [["1", "2"], ["3"]], id="two_chunks"),
+        pytest.param(["123456"], 4, [["123456"]], id="too_long_id"),
+    ],
+)
+def test_chunk_job_ids(job_ids, max_length, expected):
+    assert list(chunk_job_ids(job_ids, max_length)) == expected
+
+
+def test_adaptive_poller_backs_off_until_a_transition():
+    poller = AdaptivePoller()
+    assert poller.next_period(8.0) == 8.0 / AdaptivePoller.SPEEDUP
+    periods = []
+    for _ in range(10):
+        poller.start_poll()
+        poller.finish_poll(jobs_polled=2)
+        periods.append(poller.next_period(8.0))
+    assert periods[0] == pytest.approx(8.0 / AdaptivePoller.SPEEDUP * 1.5)
+    assert periods == sorted(periods)
+    assert periods[-1] == 8.0
+
+    poller.start_poll()
+    poller.transition()
+    poller.finish_poll(jobs_polled=2)
+    assert poller.next_period(8.0) == 8.0 / AdaptivePoller.SPEEDUP
+
+    poller.start_poll()
+    poller.finish_poll(jobs_polled=2)
+    poller.expect_transitions()
+    assert poller.next_period(8.0) == 8.0 / AdaptivePoller.SPEEDUP
+
+    assert poller.metrics.polls == 12
+    assert poller.metrics.jobs_per_poll == 2
+    assert poller.metrics.transitions == 1
+
+
+def test_adaptive_poller_never_polls_sooner_than_the_minimum_period():
+    poller = AdaptivePoller()
+    poller.expect_transitions()
+    assert poller.next_period(2.0) == AdaptivePoller.MIN_PERIOD
+    assert poller.next_period(0.1) == 0.1
+
+
 async def test_execute_with_retry_exits_on_filenotfounderror(driver: Driver, caplog):
     caplog.set_level(logging.DEBUG)
     invalid_cmd = ["/usr/bin/foo", "bar"]
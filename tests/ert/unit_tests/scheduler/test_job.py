@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import os
 import shutil
 from functools import partial
 from pathlib import Path
@@ -9,6 +10,7 @@
 from lxml import etree
 
 import ert
+from _ert.checksum import CHUNK_SIZE, ChecksumMode, checksum_info
 from ert.ensemble_evaluator import Realization
 from ert.load_status import LoadStatus
 from ert.run_arg import RunArg
@@ -26,6 +28,7 @@ def create_scheduler():
     sch._ens_id = "0"
     sch._events = asyncio.Queue()
     sch.driver = AsyncMock()
+    sch.job_array_submitter = None
     sch._manifest_queue = None
     sch._cancelled = False
     return sch
@@ -313,6 +316,43 @@ async def test_when_checksums_do_not_match_a_warning_is_logged(
     assert f"File {file_path} checksum verification failed." in log_msgs
 
 
+@pytest.mark.parametrize("mode", list(ChecksumMode))
+@pytest.mark.parametrize("modified", [True, False])
+@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.asyncio
+async def test_checksums_are_verified_in_the_mode_they_were_made_with(
+    realization: Realization, mode, modified, caplog
+):
+    file_path = Path("file")
+    file_path.write_bytes(b"a" * 3 * CHUNK_SIZE)
+    info = {"path": str(file_path), **checksum_info(file_path, mode)}
+    if modified:
+        # Change a byte in the middle chunk, which QUICK mode does not read,
+        # along with the size
+        file_path.write_bytes(b"a" * CHUNK_SIZE + b"b" + b"a" * 2 * CHUNK_SIZE)
+    scheduler = create_scheduler()
+    scheduler._manifest_queue = asyncio.Queue()
+    scheduler.checksum = {"test_runpath": {"file": info}}
+
+    job = Job(scheduler, realization)
+    with caplog.at_level(logging.DEBUG):
+        await job._verify_checksum(asyncio.BoundedSemaphore(2), timeout=0)
+
+    if modified:
+        assert f"File {file_path} checksum verification failed." in caplog.messages
+    else:
+        assert f"File {file_path} checksum successful." in caplog.messages
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_quick_checksums_do_not_depend_on_the_modification_time():
+    file_path = Path("file")
+    file_path.write_bytes(b"a" * 3 * CHUNK_SIZE)
+    info = checksum_info(file_path, ChecksumMode.QUICK)
+    os.utime(file_path, ns=(0, 0))
+    assert checksum_info(file_path, ChecksumMode.QUICK) == info
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 @pytest.mark.asyncio
 async def test_when_no_checksum_info_is_received_a_warning_is_logged(
@@ -441,6 +441,12 @@ def test_parse_bjobs_gives_empty_result_on_random_input(some_text):
             {"1": "DONE", "2": "RUN"},
             id="two_jobs",
         ),
+        pytest.param("1^RUN^-^0", {"1": "RUN"}, id="with_jobindex"),
+        pytest.param(
+            "1^DONE^-^1\n1^RUN^-^2",
+            {"1[1]": "DONE", "1[2]": "RUN"},
+            id="job_array_elements",
+        ),
     ],
 )
 def test_parse_bjobs_happy_path(bjobs_output, expected):
@@ -15,6 +15,7 @@
 from ert.load_status import LoadResult, LoadStatus
 from ert.run_arg import RunArg
 from ert.scheduler import LsfDriver, OpenPBSDriver, create_driver, job, scheduler
+from ert.scheduler.driver import FailedSubmit, JobSubmission
 from ert.scheduler.job import JobState
 
 
@@ -610,6 +611,101 @@ async def test_that_process_event_queue_exceptions_are_propagated(
         await sch.execute()
 
 
+async def test_that_jobs_are_submitted_as_job_arrays(mock_driver, storage, tmp_path):
+    ensemble_size = 5
+    ensemble = storage.create_experiment().create_ensemble(
+        name="foo", ensemble_size=ensemble_size
+    )
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens)
+        for iens in range(ensemble_size)
+    ]
+    arrays = []
+
+    class ArrayDriver(mock_driver):
+        @property
+        def supports_job_arrays(self):
+            return True
+
+        async def submit_array(self, jobs):
+            arrays.append([job.iens for job in jobs])
+            for job in jobs:
+                await self.submit(job.iens, job.executable, *job.args)
+
+    sch = scheduler.Scheduler(
+        ArrayDriver(), realizations, max_running=0, job_array_size=2
+    )
+
+    assert await sch.execute() == Id.ENSEMBLE_SUCCEEDED
+    assert sorted(len(array) for array in arrays) == [2, 2]
+    assert sch.count_states() == {JobState.COMPLETED: ensemble_size}
+
+
+async def test_that_failing_job_array_submission_fails_all_its_jobs(
+    mock_driver, storage, tmp_path
+):
+    ensemble = storage.create_experiment().create_ensemble(name="foo", ensemble_size=2)
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens) for iens in (0, 1)
+    ]
+
+    class ArrayDriver(mock_driver):
+        @property
+        def supports_job_arrays(self):
+            return True
+
+        async def submit_array(self, jobs):
+            raise FailedSubmit("No array for you")
+
+    sch = scheduler.Scheduler(
+        ArrayDriver(), realizations, max_running=0, job_array_size=2
+    )
+
+    assert await sch.execute() == Id.ENSEMBLE_SUCCEEDED
+    assert sch.count_states() == {JobState.FAILED: 2}
+
+
+async def test_that_jobs_cancelled_while_their_array_is_submitted_wait_for_it():
+    submitting = asyncio.Event()
+    release = asyncio.Event()
+    submitted = []
+
+    class ArrayDriver:
+        async def submit_array(self, jobs):
+            submitting.set()
+            await release.wait()
+            submitted.extend(job.iens for job in jobs)
+
+    submitter = scheduler.JobArraySubmitter(ArrayDriver(), size=2)
+    tasks = [
+        asyncio.create_task(submitter.submit(JobSubmission(iens, "true")))
+        for iens in (0, 1)
+    ]
+    await submitting.wait()
+    tasks[0].cancel()
+    await asyncio.sleep(0.1)
+    # The job can not be killed before the driver knows its job id
+    assert not tasks[0].done()
+
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await tasks[0]
+    assert submitted == [0, 1]
+    await tasks[1]
+    assert not submitter._submitting
+
+
+async def test_that_job_arrays_fall_back_to_single_submissions(
+    realization, mock_driver, caplog
+):
+    sch = scheduler.Scheduler(mock_driver(), [realization], job_array_size=10)
+
+    assert sch.job_array_submitter is None
+    assert "does not support job arrays" in caplog.text
+    assert await sch.execute() == Id.ENSEMBLE_SUCCEEDED
+    assert sch.count_states() == {JobState.COMPLETED: 1}
+
+
 def test_scheduler_create_lsf_driver():
     queue_name = "foo_queue"
     bsub_cmd = "bar_bsub_cmd"
@@ -702,3 +798,38 @@ async def mock_publisher(*args, **kwargs):
         event = await sch._events.get()
 
     assert expected_error in event.message
+
+
+@pytest.mark.parametrize("max_parallel_internalization", [1, 3])
+async def test_that_internalization_is_bounded_by_max_parallel_internalization(
+    storage, tmp_path, mock_driver, monkeypatch, max_parallel_internalization
+):
+    ensemble_size = 6
+    ensemble = storage.create_experiment().create_ensemble(
+        name="foo", ensemble_size=ensemble_size
+    )
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens)
+        for iens in range(ensemble_size)
+    ]
+    num_loading = 0
+    max_num_loading = 0
+
+    async def mocked_forward_model_ok(*args, **kwargs):
+        nonlocal num_loading, max_num_loading
+        num_loading += 1
+        max_num_loading = max(max_num_loading, num_loading)
+        await asyncio.sleep(0.05)
+        num_loading -= 1
+        return LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
+
+    monkeypatch.setattr(job, "forward_model_ok", mocked_forward_model_ok)
+
+    sch = scheduler.Scheduler(
+        mock_driver(),
+        realizations,
+        max_running=0,
+        max_parallel_internalization=max_parallel_internalization,
+    )
+    assert await sch.execute() == Id.ENSEMBLE_SUCCEEDED
+    assert max_num_loading == max_parallel_internalization
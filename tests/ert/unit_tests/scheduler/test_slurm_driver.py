@@ -2,6 +2,7 @@
 import logging
 import os
 import random
+import shutil
 import stat
 import string
 import sys
@@ -13,8 +14,13 @@
 from hypothesis import strategies as st
 
 from ert.scheduler import SlurmDriver
-from ert.scheduler.slurm_driver import _seconds_to_slurm_time_format
-from tests.ert.utils import poll
+from ert.scheduler.slurm_driver import (
+    JobStatus,
+    ScontrolInfo,
+    _parse_sacct_jobs_output,
+    _seconds_to_slurm_time_format,
+)
+from tests.ert.utils import poll, wait_until
 
 from .conftest import mock_bin
 
@@ -460,3 +466,96 @@ async def test_slurm_uses_sacct(
 
     # Make sure sacct was tried:
     assert "scontrol failed, trying sacct" in caplog.text
+
+
+def test_parse_sacct_jobs_output():
+    output = "10|COMPLETED|0:0\n11_1|FAILED|3:0\n12|CANCELLED by 1000|0:15\n"
+    assert dict(_parse_sacct_jobs_output(output)) == {
+        "10": ScontrolInfo(JobStatus.COMPLETED, 0),
+        "11_1": ScontrolInfo(JobStatus.FAILED, 3),
+        "12": ScontrolInfo(JobStatus.CANCELLED, 0),
+    }
+
+
+def wrap_command(bin_path: Path, name: str, command: str) -> None:
+    """Put a wrapper logging each call of the mocked command first in PATH"""
+    mocked = shutil.which(name)
+    wrapper = bin_path / name
+    wrapper.write_text(
+        f'#!/bin/sh\necho "$@" >> {bin_path}/{name}.log\n{command or mocked} "$@"\n',
+        encoding="utf-8",
+    )
+    wrapper.chmod(wrapper.stat().st_mode | stat.S_IEXEC)
+
+
+@pytest.mark.parametrize("sacct_works", [True, False])
+async def test_jobs_missing_in_squeue_are_polled_in_one_call(
+    monkeypatch, tmp_path, pytestconfig, sacct_works
+):
+    if pytestconfig.getoption("slurm"):
+        pytest.skip()
+    os.chdir(tmp_path)
+    bin_path = tmp_path / "bin"
+    bin_path.mkdir()
+    wrap_command(bin_path, "squeue", "true")
+    wrap_command(bin_path, "scontrol", "")
+    wrap_command(bin_path, "sacct", "" if sacct_works else "false")
+    monkeypatch.setenv("PATH", f"{bin_path}:{os.environ['PATH']}")
+    returncodes = {}
+
+    async def finished(iens, returncode):
+        returncodes[iens] = returncode
+
+    driver = SlurmDriver()
+    for iens in range(3):
+        await driver.submit(iens, "sh", "-c", f"exit {iens}", name=f"job{iens}")
+    job_ids = list(driver._jobs)
+    wait_until(
+        lambda: all(
+            (tmp_path / "mock_jobs" / f"{job_id}.returncode").exists()
+            for job_id in job_ids
+        ),
+        timeout=10,
+    )
+    await poll(driver, {0, 1, 2}, finished=finished)
+
+    assert returncodes == {0: 0, 1: 1, 2: 2}
+    assert (bin_path / "sacct.log").read_text(encoding="utf-8").splitlines() == [
+        f"-X -n -o JobID,State,ExitCode -P --jobs={','.join(sorted(job_ids))}"
+    ]
+    if sacct_works:
+        assert not (bin_path / "scontrol.log").exists()
+    else:
+        assert sorted(
+            (bin_path / "scontrol.log").read_text(encoding="utf-8").splitlines()
+        ) == [f"show job {job_id}" for job_id in sorted(job_ids)]
+
+
+async def test_scontrol_results_are_cached(monkeypatch, tmp_path, pytestconfig):
+    if pytestconfig.getoption("slurm"):
+        pytest.skip()
+    os.chdir(tmp_path)
+    bin_path = tmp_path / "bin"
+    bin_path.mkdir()
+    wrap_command(bin_path, "sacct", "")
+    monkeypatch.setenv("PATH", f"{bin_path}:{os.environ['PATH']}")
+
+    driver = SlurmDriver()
+    await driver.submit(0, "true")
+    await driver.submit(1, "true")
+    job_ids = sorted(driver._jobs)
+    wait_until(
+        lambda: all(
+            (tmp_path / "mock_jobs" / f"{job_id}.returncode").exists()
+            for job_id in job_ids
+        ),
+        timeout=10,
+    )
+
+    first = await driver._poll_once_by_scontrol(job_ids)
+    assert await driver._poll_once_by_scontrol(job_ids) == first
+    assert await driver._poll_once_by_scontrol(job_ids[:1]) == {
+        job_ids[0]: first[job_ids[0]]
+    }
+    assert set(first) == set(job_ids)
+    assert len((bin_path / "sacct.log").read_text().splitlines()) == 1
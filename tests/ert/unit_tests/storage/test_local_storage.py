@@ -11,6 +11,7 @@
 
 import hypothesis.strategies as st
 import numpy as np
+import pandas as pd
 import polars
 import pytest
 import xarray as xr
@@ -20,6 +21,7 @@
 
 from ert.config import (
     EnkfObs,
+    ExtParamConfig,
     Field,
     GenDataConfig,
     GenKwConfig,
@@ -169,6 +171,207 @@ def test_that_saving_response_updates_configs(tmp_path):
         }
 
 
+def test_that_observations_are_aligned_with_responses_of_each_realization(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[SummaryConfig(keys=["*"], input_files=["not_relevant"])],
+            observations={
+                "summary": polars.DataFrame(
+                    {
+                        "observation_key": ["OBS1", "OBS2", "OBS3"],
+                        "response_key": ["FOPR", "FOPR", "FGPR"],
+                        "time": polars.Series(
+                            [
+                                datetime(2000, 1, 1),
+                                datetime(2000, 1, 2),
+                                datetime(2000, 1, 1),
+                            ]
+                        ).dt.cast_time_unit("ms"),
+                        "observations": polars.Series(
+                            [1.0, 2.0, 3.0], dtype=polars.Float32
+                        ),
+                        "std": polars.Series([0.1, 0.2, 0.3], dtype=polars.Float32),
+                    }
+                )
+            },
+        )
+        ensemble = experiment.create_ensemble(ensemble_size=3, name="prior")
+
+        def summary(keys, days, values):
+            return polars.DataFrame(
+                {
+                    "response_key": keys,
+                    "time": polars.Series(
+                        [datetime(2000, 1, d) for d in days]
+                    ).dt.cast_time_unit("ms"),
+                    "values": polars.Series(values, dtype=polars.Float32),
+                }
+            )
+
+        ensemble.save_response(
+            "summary", summary(["FOPR", "FOPR", "FGPR"], [1, 2, 1], [1, 2, 3]), 0
+        )
+        # Realization 1 has no response at the time of OBS2,
+        # and two responses at the time of OBS3
+        ensemble.save_response(
+            "summary", summary(["FOPR", "FGPR", "FGPR"], [1, 1, 1], [4, 5, 7]), 1
+        )
+        ensemble.save_response(
+            "summary", summary(["FOPR", "FOPR", "FGPR"], [1, 2, 1], [7, 8, 9]), 2
+        )
+
+        df = ensemble.get_observations_and_responses(
+            ["OBS1", "OBS2", "OBS3"], np.array([2, 0, 1])
+        )
+        assert df.columns == [
+            "response_key",
+            "index",
+            "observation_key",
+            "observations",
+            "std",
+            "0",
+            "1",
+            "2",
+        ]
+        assert df["observation_key"].to_list() == ["OBS1", "OBS2", "OBS3"]
+        np.testing.assert_array_equal(
+            df.select(["0", "1", "2"]).to_numpy(),
+            [[1, 4, 7], [2, np.nan, 8], [3, 6, 9]],
+        )
+
+
+def test_that_misfits_are_computed_for_all_observations_and_realizations(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[SummaryConfig(keys=["*"], input_files=["not_relevant"])],
+            observations={
+                "summary": polars.DataFrame(
+                    {
+                        "observation_key": ["OBS1", "OBS1", "OBS2"],
+                        "response_key": ["FOPR", "FOPR", "FGPR"],
+                        "time": polars.Series(
+                            [
+                                datetime(2000, 1, 1),
+                                datetime(2000, 1, 2),
+                                datetime(2000, 1, 1),
+                            ]
+                        ).dt.cast_time_unit("ms"),
+                        "observations": polars.Series(
+                            [1.0, 2.0, 3.0], dtype=polars.Float32
+                        ),
+                        "std": polars.Series([0.5, 0.5, 1.0], dtype=polars.Float32),
+                    }
+                )
+            },
+        )
+        ensemble = experiment.create_ensemble(ensemble_size=2, name="prior")
+
+        def summary(keys, days, values):
+            return polars.DataFrame(
+                {
+                    "response_key": keys,
+                    "time": polars.Series(
+                        [datetime(2000, 1, d) for d in days]
+                    ).dt.cast_time_unit("ms"),
+                    "values": polars.Series(values, dtype=polars.Float32),
+                }
+            )
+
+        ensemble.save_response(
+            "summary", summary(["FOPR", "FOPR", "FGPR"], [1, 2, 1], [2, 1, 3]), 0
+        )
+        # Realization 1 has no response at the second time of OBS1
+        ensemble.save_response("summary", summary(["FOPR", "FGPR"], [1, 1], [0, 5]), 1)
+
+        misfits = ensemble.get_misfits()
+        assert misfits["observation_key"].to_list() == ["OBS1", "OBS1", "OBS2"]
+        np.testing.assert_array_equal(
+            misfits.select(["0", "1"]).to_numpy(), [[4, -4], [-4, np.nan], [0, 4]]
+        )
+
+        pd.testing.assert_frame_equal(
+            ensemble.get_misfits_by_observation_group(),
+            pd.DataFrame(
+                {
+                    "MISFIT:OBS1": [8.0, 4.0],
+                    "MISFIT:OBS2": [0.0, 4.0],
+                    "MISFIT:TOTAL": [8.0, 8.0],
+                },
+                index=pd.Index([0, 1], name="Realization"),
+            ),
+        )
+        assert ensemble.get_misfits_by_observation_group(
+            ["OBS2"], np.array([1])
+        ).to_dict() == {"MISFIT:OBS2": {1: 4.0}, "MISFIT:TOTAL": {1: 4.0}}
+
+
+def test_that_consolidated_responses_are_loaded_like_per_realization_responses(
+    tmp_path,
+):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[SummaryConfig(keys=["*"], input_files=["not_relevant"])]
+        )
+        ensemble = experiment.create_ensemble(ensemble_size=4, name="prior")
+        keys = ["FOPR", "FGPR", "BPR:1,1,1", "FOPT"]
+        for realization in [0, 1, 3]:
+            ensemble.save_response(
+                "summary",
+                polars.DataFrame(
+                    {
+                        "response_key": keys * 2,
+                        "time": polars.Series(
+                            [datetime(2000, 1, 1)] * 4 + [datetime(2000, 1, 2)] * 4
+                        ).dt.cast_time_unit("ms"),
+                        "values": polars.Series(
+                            np.arange(8) + 10 * realization, dtype=polars.Float32
+                        ),
+                    }
+                ),
+                realization,
+            )
+
+        def load_all():
+            return {
+                key: ensemble.load_responses(key, (0, 1, 3)).sort(
+                    ["realization", "response_key", "time"]
+                )
+                for key in ["summary", *keys]
+            }
+
+        before = load_all()
+        ensemble.consolidate_responses()
+        assert ensemble._consolidated_responses("summary").covers((0, 1, 3))
+        after = load_all()
+        for key, df in before.items():
+            assert after[key].equals(df)
+        assert ensemble.load_responses("FOPR", (3, 1))["values"].to_list() == [
+            30,
+            34,
+            10,
+            14,
+        ]
+
+        with pytest.raises(KeyError, match="realization: 2"):
+            ensemble.load_responses("FOPR", (1, 2))
+
+        ensemble.save_response(
+            "summary",
+            polars.DataFrame(
+                {
+                    "response_key": ["FOPR"],
+                    "time": polars.Series([datetime(2000, 1, 1)]).dt.cast_time_unit(
+                        "ms"
+                    ),
+                    "values": polars.Series([-1.0], dtype=polars.Float32),
+                }
+            ),
+            1,
+        )
+        assert not ensemble._consolidated_responses("summary").exists()
+        assert ensemble.load_responses("FOPR", (1,))["values"].to_list() == [-1.0]
+
+
 def test_that_saving_empty_parameters_fails_nicely(tmp_path):
     with open_storage(tmp_path, mode="w") as storage:
         experiment = storage.create_experiment()
@@ -255,6 +458,206 @@ def test_that_load_parameters_throws_exception(tmp_path):
             ensemble.load_parameters("I_DONT_EXIST", 1)
 
 
+def test_that_parameters_are_stored_in_one_file_per_group(tmp_path):
+    parameter = GenKwConfig(
+        name="PARAMETER",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+            TransformFunctionDefinition("KEY2", "UNIFORM", [0, 1]),
+        ],
+        output_file="kw.txt",
+        update=True,
+    )
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[parameter])
+        ensemble = storage.create_ensemble(experiment, ensemble_size=5, name="prior")
+        for iens in [0, 2, 3]:
+            ensemble.save_parameters(
+                "PARAMETER",
+                iens,
+                xr.Dataset(
+                    {
+                        "values": ("names", [iens, -iens]),
+                        "transformed_values": ("names", [iens, -iens]),
+                        "names": ["KEY1", "KEY2"],
+                    }
+                ),
+            )
+
+        assert not list(ensemble.mount_point.glob("realization-*/*.nc"))
+        assert ensemble.is_initalized() == [0, 2, 3]
+
+        ds = ensemble.load_parameters("PARAMETER")
+        assert ds["realizations"].values.tolist() == [0, 2, 3]
+        assert ds["names"].values.tolist() == ["KEY1", "KEY2"]
+        assert ds["values"].values.tolist() == [[0, 0], [2, -2], [3, -3]]
+
+        ds = ensemble.load_parameters("PARAMETER", np.array([3, 0]))
+        assert ds["values"].values.tolist() == [[3, -3], [0, 0]]
+        assert ensemble.load_parameters("PARAMETER", 2)["values"].values.tolist() == [
+            2,
+            -2,
+        ]
+        with pytest.raises(
+            KeyError, match="No dataset 'PARAMETER' in storage for realization 1"
+        ):
+            ensemble.load_parameters("PARAMETER", np.array([0, 1]))
+
+
+def test_that_parameters_are_saved_in_the_order_of_the_stored_coordinates(
+    tmp_path,
+):
+    parameter = ExtParamConfig(name="PARAMETER", input_keys=["a", "b"])
+
+    def dataset(names, values):
+        return xr.Dataset({"values": ("names", values), "names": names})
+
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[parameter])
+        ensemble = storage.create_ensemble(experiment, ensemble_size=2, name="prior")
+        ensemble.save_parameters("PARAMETER", 0, dataset(["a", "b"], [1.0, 2.0]))
+        ensemble.save_parameters("PARAMETER", 1, dataset(["b", "a"], [4.0, 3.0]))
+
+        ds = ensemble.load_parameters("PARAMETER")
+        assert ds["names"].values.tolist() == ["a", "b"]
+        assert ds["values"].values.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+        with pytest.raises(ValueError, match="Coordinate 'names' of 'PARAMETER'"):
+            ensemble.save_parameters("PARAMETER", 1, dataset(["a", "c"], [1.0, 2.0]))
+
+
+def test_that_std_dev_of_parameters_is_stored_until_parameters_are_saved(
+    tmp_path,
+):
+    parameter = ExtParamConfig(name="PARAMETER", input_keys={"a": ["x", "y"]})
+    data = np.random.default_rng(1234).standard_normal((2, 4))
+    data[0, 1] = np.nan
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[parameter])
+        ensemble = storage.create_ensemble(experiment, ensemble_size=5, name="prior")
+        parameter.save_parameters_bulk(ensemble, "PARAMETER", [0, 1, 2, 4], data)
+
+        std_dev = ensemble.calculate_std_dev_for_parameter("PARAMETER")
+        xr.testing.assert_allclose(
+            std_dev, ensemble.load_parameters("PARAMETER").std("realizations")
+        )
+        assert (ensemble.mount_point / "parameters" / "PARAMETER" / "std_dev").exists()
+
+        parameter.save_parameters(ensemble, "PARAMETER", 3, np.array([10.0, 10.0]))
+        assert not (
+            ensemble.mount_point / "parameters" / "PARAMETER" / "std_dev"
+        ).exists()
+        xr.testing.assert_allclose(
+            ensemble.calculate_std_dev_for_parameter("PARAMETER"),
+            ensemble.load_parameters("PARAMETER").std("realizations"),
+        )
+
+
+def test_that_std_dev_computed_before_a_save_of_the_same_realizations_is_not_used(
+    tmp_path,
+):
+    parameter = ExtParamConfig(name="PARAMETER", input_keys={"a": ["x", "y"]})
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[parameter])
+        ensemble = storage.create_ensemble(experiment, ensemble_size=2, name="prior")
+        parameter.save_parameters_bulk(
+            ensemble, "PARAMETER", [0, 1], np.array([[1.0, 2.0], [3.0, 5.0]])
+        )
+        std_path = ensemble.mount_point / "parameters" / "PARAMETER" / "std_dev"
+        ensemble.calculate_std_dev_for_parameter("PARAMETER")
+        shutil.copytree(std_path, tmp_path / "stale")
+
+        parameter.save_parameters(ensemble, "PARAMETER", 0, np.array([7.0, 11.0]))
+        # As left behind by a reader that computed it while the save was going on
+        shutil.copytree(tmp_path / "stale", std_path)
+
+        xr.testing.assert_allclose(
+            ensemble.calculate_std_dev_for_parameter("PARAMETER"),
+            ensemble.load_parameters("PARAMETER").std("realizations"),
+        )
+
+
+@pytest.mark.parametrize(
+    "parameter",
+    [
+        GenKwConfig(
+            name="PARAMETER",
+            forward_init=False,
+            template_file="",
+            transform_function_definitions=[
+                TransformFunctionDefinition("KEY1", "NORMAL", [1, 2]),
+                TransformFunctionDefinition("KEY2", "LOGUNIF", [0.1, 1]),
+            ],
+            output_file="kw.txt",
+            update=True,
+        ),
+        ExtParamConfig(name="PARAMETER", input_keys={"a": ["x", "y"]}),
+    ],
+)
+def test_that_saving_parameters_in_bulk_matches_saving_per_realization(
+    tmp_path, parameter
+):
+    data = np.random.default_rng(1234).standard_normal((2, 4))
+    realizations = np.array([4, 0, 2, 3])
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[parameter])
+        bulk = storage.create_ensemble(experiment, ensemble_size=5, name="bulk")
+        single = storage.create_ensemble(experiment, ensemble_size=5, name="single")
+
+        parameter.save_parameters_bulk(bulk, "PARAMETER", realizations, data)
+        for i, iens in enumerate(realizations):
+            parameter.save_parameters(single, "PARAMETER", iens, data[:, i])
+
+        xr.testing.assert_equal(
+            bulk.load_parameters("PARAMETER"), single.load_parameters("PARAMETER")
+        )
+        np.testing.assert_array_equal(
+            bulk.load_parameters("PARAMETER", realizations)["values"].values,
+            data.T,
+        )
+
+
+def test_that_per_realization_parameter_files_are_migrated(tmp_path):
+    parameter = GenKwConfig(
+        name="PARAMETER",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+        ],
+        output_file="kw.txt",
+        update=True,
+    )
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[parameter])
+        ensemble = storage.create_ensemble(experiment, ensemble_size=3, name="prior")
+        ensemble_path = ensemble.mount_point
+        storage._index.version = 9
+        storage._save_index()
+
+    shutil.rmtree(ensemble_path / LocalEnsemble.PARAMETERS_PATH, ignore_errors=True)
+    for iens in [0, 2]:
+        (ensemble_path / f"realization-{iens}").mkdir()
+        xr.Dataset(
+            {
+                "values": ("names", [float(iens)]),
+                "transformed_values": ("names", [float(iens)]),
+                "names": ["KEY1"],
+            }
+        ).expand_dims(realizations=[iens]).to_netcdf(
+            ensemble_path / f"realization-{iens}" / "PARAMETER.nc", engine="scipy"
+        )
+
+    with open_storage(tmp_path, mode="w") as storage:
+        ensemble = next(storage.ensembles)
+        assert not list(ensemble.mount_point.glob("realization-*/*.nc"))
+        ds = ensemble.load_parameters("PARAMETER")
+        assert ds["realizations"].values.tolist() == [0, 2]
+        assert ds["values"].values.tolist() == [[0.0], [2.0]]
+
+
 def test_open_empty_read(tmp_path):
     with open_storage(tmp_path / "empty", mode="r") as storage:
         assert _ensembles(storage) == []